@@ -0,0 +1,142 @@
+"""
+오프라인 클라이언트 벤치마크 스크립트
+fake_compressor 대역을 사용해 클라이언트 오버헤드, 동시성 확장성, 재시도 동작을 측정
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import asyncio
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# 상위 디렉토리의 src 모듈 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from async_client import AsyncCompressionClient
+from fake_compressor import FakeCompressor
+from netspresso_client import NetsPresssoQAClient
+
+
+def measure_overhead(model_path, work_dir, iterations=50):
+    """지연 0인 대역으로 작업당 클라이언트 오버헤드 측정"""
+    client = NetsPresssoQAClient(compressor=FakeCompressor(), use_cache=False, precheck=False)
+    start = time.perf_counter()
+    for i in range(iterations):
+        client.compress(model_path, os.path.join(work_dir, f"overhead_{i}"))
+    elapsed = time.perf_counter() - start
+    return {'iterations': iterations, 'per_job_ms': elapsed / iterations * 1000}
+
+
+def measure_concurrency(model_path, work_dir, jobs, latency, worker_counts, max_concurrent=None):
+    """max_workers 별 배치 소요 시간과 처리량 측정"""
+    rows = []
+    for workers in worker_counts:
+        compressor = FakeCompressor(latency=latency, max_concurrent=max_concurrent)
+        client = NetsPresssoQAClient(compressor=compressor, use_cache=False, precheck=False)
+        batch = [
+            {'model_path': model_path, 'output_dir': os.path.join(work_dir, f"w{workers}_{i}")}
+            for i in range(jobs)
+        ]
+        wall_time = 0.0
+        for result in client.compress_many(batch, max_workers=workers):
+            wall_time = result['wall_time']
+        rows.append({
+            'max_workers': workers,
+            'wall_time': wall_time,
+            'jobs_per_second': jobs / wall_time if wall_time else 0.0,
+            'speedup': (jobs * latency) / wall_time if wall_time else 0.0,
+            'peak_concurrency': compressor.stats['peak_concurrency'],
+            'queue_wait': compressor.stats['queue_wait']
+        })
+    return rows
+
+
+def measure_retries(model_path, work_dir, fail_first, max_attempts):
+    """앞선 N회 호출이 실패할 때 재시도로 복구되기까지의 시도 횟수와 시간 측정"""
+    client = NetsPresssoQAClient(compressor=FakeCompressor(fail_first=fail_first), use_cache=False, precheck=False)
+    start = time.perf_counter()
+    attempts = 0
+    result = None
+    while attempts < max_attempts:
+        attempts += 1
+        result = client.compress(model_path, os.path.join(work_dir, f"retry_{attempts}"))
+        if result['success']:
+            break
+    return {
+        'fail_first': fail_first,
+        'attempts': attempts,
+        'recovered': bool(result and result['success']),
+        'elapsed': time.perf_counter() - start
+    }
+
+
+def measure_async(model_path, work_dir, jobs, latency, max_concurrent=None):
+    """asyncio 클라이언트로 작업을 한꺼번에 제출했을 때 소요 시간과 작업당 상태 조회 수 측정"""
+    compressor = FakeCompressor(latency=latency, max_concurrent=max_concurrent)
+    client = AsyncCompressionClient(compressor, precheck=False)
+    batch = [{'model_path': model_path, 'output_dir': os.path.join(work_dir, f"async_{i}")} for i in range(jobs)]
+
+    async def run():
+        return [result async for result in client.compress_many(batch)]
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    wall_time = time.perf_counter() - start
+    return {
+        'jobs': jobs,
+        'wall_time': wall_time,
+        'jobs_per_second': jobs / wall_time if wall_time else 0.0,
+        'succeeded': sum(r['success'] for r in results),
+        'polls_per_job': compressor.stats['polls'] / jobs if jobs else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 NetsPresso 클라이언트 벤치마크")
+    parser.add_argument('--jobs', type=int, default=16, help="배치당 작업 수")
+    parser.add_argument('--latency', type=float, default=0.2, help="대역 압축 지연(초)")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--max-concurrent', type=int, default=None, help="대역 서버 동시 처리 슬롯")
+    parser.add_argument('--async-jobs', type=int, default=200, help="asyncio 클라이언트로 동시에 제출할 작업 수")
+    parser.add_argument('--output', default='./results/benchmarks/client_benchmark.json')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        model_path = os.path.join(work_dir, "model.pt")
+        with open(model_path, 'wb') as f:
+            f.write(os.urandom(64 * 1024))
+
+        results = {
+            'timestamp': datetime.now().isoformat(),
+            'overhead': measure_overhead(model_path, work_dir),
+            'concurrency': measure_concurrency(model_path, work_dir, args.jobs, args.latency,
+                                               args.workers, args.max_concurrent),
+            'retries': measure_retries(model_path, work_dir, fail_first=2, max_attempts=5),
+            'async': measure_async(model_path, work_dir, args.async_jobs, args.latency, args.max_concurrent)
+        }
+
+    print(f"작업당 클라이언트 오버헤드: {results['overhead']['per_job_ms']:.2f}ms")
+    print("| max_workers | 소요 시간(s) | 작업/s | 속도 향상 | 최대 동시 처리 |")
+    print("|---:|---:|---:|---:|---:|")
+    for row in results['concurrency']:
+        print(f"| {row['max_workers']} | {row['wall_time']:.2f} | {row['jobs_per_second']:.1f} "
+              f"| {row['speedup']:.1f}x | {row['peak_concurrency']} |")
+    retries = results['retries']
+    print(f"재시도: {retries['attempts']}회 시도 후 {'복구' if retries['recovered'] else '실패'}")
+    async_run = results['async']
+    print(f"asyncio {async_run['jobs']}개 작업: {async_run['wall_time']:.2f}s "
+          f"({async_run['jobs_per_second']:.1f} 작업/s, 작업당 조회 {async_run['polls_per_job']:.1f}회)")
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"벤치마크 결과 저장됨: {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
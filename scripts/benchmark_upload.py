@@ -0,0 +1,80 @@
+"""
+청크 업로드 벤치마크 스크립트
+로컬 대역 서버로 파일 크기/청크 크기별 처리량과 최대 힙 사용량을 측정
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+# 상위 디렉토리의 src 모듈 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from chunked_upload import ChunkedUploader, LocalUploadServer
+from utils import format_file_size
+
+
+def write_random_file(path, size_bytes, block=1024 * 1024):
+    """메모리에 전부 올리지 않고 임의 데이터 파일 생성"""
+    with open(path, 'wb') as f:
+        remaining = size_bytes
+        while remaining > 0:
+            f.write(os.urandom(min(block, remaining)))
+            remaining -= block
+
+
+def benchmark_upload(work_dir, size_bytes, chunk_size, fail_chunks=()):
+    """한 번의 업로드 처리량과 최대 힙 사용량 측정"""
+    model_path = Path(work_dir) / f"model_{size_bytes}.pt"
+    write_random_file(model_path, size_bytes)
+    server = LocalUploadServer(Path(work_dir) / f"server_{size_bytes}_{chunk_size}", fail_chunks=fail_chunks)
+
+    tracemalloc.start()
+    try:
+        stats = ChunkedUploader(server, chunk_size=chunk_size, retry_backoff=0).upload(model_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    model_path.unlink()
+
+    stats['chunk_size'] = chunk_size
+    stats['peak_heap'] = peak
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="청크 업로드 벤치마크 (로컬 대역 서버)")
+    parser.add_argument('--sizes-mb', type=int, nargs='+', default=[8, 64, 167])
+    parser.add_argument('--chunk-mb', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--output', default='./results/benchmarks/upload_benchmark.json')
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size_mb in args.sizes_mb:
+            for chunk_mb in args.chunk_mb:
+                size = size_mb * 1024 * 1024
+                chunk = chunk_mb * 1024 * 1024
+                # 중간 청크 하나를 실패시켜 재개 경로까지 측정
+                rows.append(benchmark_upload(work_dir, size, chunk, fail_chunks={size // chunk // 2}))
+
+    print("| 파일 크기 | 청크 | 처리량 | 재시도 | 최대 힙 |")
+    print("|---:|---:|---:|---:|---:|")
+    for row in rows:
+        print(f"| {format_file_size(row['size'])} | {format_file_size(row['chunk_size'])} "
+              f"| {format_file_size(row['throughput'])}/s | {row['retries']} | {format_file_size(row['peak_heap'])} |")
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'timestamp': datetime.now().isoformat(), 'uploads': rows}, f, ensure_ascii=False, indent=2)
+    print(f"벤치마크 결과 저장됨: {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+성능 회귀 검사 스크립트
+모델별로 압축 소요 시간 / 압축 크기 / 추론 p50·p99 / 최대 활성화 메모리를 repeats회 측정해
+결과 DB에 (모델, 커밋, runner) 단위로 기록하고, 직전 실행들과 비교해 회귀가 있으면 종료 코드 1을 반환
+
+지연 시간은 스레드 수를 고정(--threads)하고 충분히 반복해 측정. 캐시된 기준 값은 다른 runner에서 측정됐을 수
+있으므로 시간 지표는 같은 runner(OS 이미지 + CPU 모델 + 코어 수)의 기준이 --min-baseline개 이상일 때 그 기준과
+비교해 실패로 판정하고, 그 전까지는 참고용으로만 표시 (--gate-latency면 runner와 무관하게 실패 판정)
+
+결과는 표준 결과 JSON(results/regressions/*.json)으로도 저장되어 generate_qa_report.py에서 표로 표시됨
+"""
+import os
+import sys
+import argparse
+import subprocess
+import tempfile
+from datetime import datetime
+
+# 상위 디렉토리의 src 모듈 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+MODEL_FACTORIES = ('simple', 'yolo')
+
+
+def current_commit():
+    """GITHUB_SHA → git HEAD → 실행 시각 순으로 현재 실행의 식별자 결정"""
+    if os.getenv('GITHUB_SHA'):
+        return os.environ['GITHUB_SHA']
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return datetime.now().strftime('local-%Y%m%d_%H%M%S')
+
+
+def measure_model(client, model_path, output_dir, input_size, warmup=10, iterations=200):
+    """압축 1회 + 압축 모델 추론/프로파일로 regression.METRICS 지표 측정"""
+    import torch
+    from benchmark import percentile, time_model
+    from model_profiler import profile_graph_module
+    from model_tests import load_fx_model
+
+    result = client.compress(model_path, output_dir,
+                             input_shapes=[{"batch": 1, "channel": 3, "dimension": list(input_size)}])
+    if not result['success'] or not result.get('compressed_path'):
+        raise RuntimeError(f"압축 실패: {result.get('error')}")
+
+    input_shape = (1, 3, *input_size)
+    compressed = load_fx_model(result['compressed_path'])
+    timings = time_model(compressed, torch.randn(*input_shape), warmup=warmup, iterations=iterations)
+    return {
+        'compression_wall_time': result['duration'],
+        'compressed_size': os.path.getsize(result['compressed_path']),
+        'inference_p50': percentile(timings, 50),
+        'inference_p99': percentile(timings, 99),
+        'peak_memory': profile_graph_module(compressed, input_shape)['peak_activation_bytes']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성능 지표 기록 및 회귀 검사")
+    parser.add_argument('--models', nargs='+', choices=MODEL_FACTORIES, default=list(MODEL_FACTORIES))
+    parser.add_argument('--commit', default=None, help="기록할 커밋 (기본: GITHUB_SHA 또는 git HEAD)")
+    parser.add_argument('--repeats', type=int, default=5, help="모델별 측정 횟수")
+    parser.add_argument('--iterations', type=int, default=200, help="추론 지연 시간 측정 반복 수")
+    parser.add_argument('--threads', type=int, default=1, help="추론 측정 시 torch 스레드 수 (0이면 고정 안 함)")
+    parser.add_argument('--input-size', type=int, nargs=2, default=[224, 224], metavar=('H', 'W'))
+    parser.add_argument('--window', type=int, default=20, help="기준으로 삼을 직전 측정 값 개수")
+    parser.add_argument('--min-baseline', type=int, default=5, help="비교에 필요한 최소 기준 값 개수")
+    parser.add_argument('--threshold', type=float, default=3.0, help="robust z-score 임계값 (MAD 배수)")
+    parser.add_argument('--min-change', type=float, default=0.05, help="회귀로 볼 최소 상대 변화")
+    parser.add_argument('--alpha', type=float, default=0.05, help="Mann-Whitney 유의수준 (지표 간 Holm 보정)")
+    parser.add_argument('--gate-latency', action='store_true',
+                        help="같은 runner 기준이 없어도 시간 지표 회귀를 실패로 판정")
+    parser.add_argument('--runner', default=None,
+                        help="실행 환경 식별자 (기본: NETSPRESSO_RUNNER 또는 OS 이미지 + CPU 모델 + 코어 수)")
+    parser.add_argument('--db', default=None, help="결과 DB 경로 (기본: NETSPRESSO_RESULTS_DB 또는 results/results.db)")
+    parser.add_argument('--output-dir', default='./results/regressions')
+    parser.add_argument('--check-only', action='store_true', help="측정 없이 이미 기록된 값만 비교")
+    parser.add_argument('--fake', action='store_true', help="오프라인 대역 backend 사용")
+    args = parser.parse_args()
+
+    if args.fake:
+        os.environ['NETSPRESSO_FAKE_BACKEND'] = '1'
+
+    from regression import DETERMINISTIC_METRICS, METRICS, check_regressions, runner_id
+    from results_db import DEFAULT_RESULTS_DB, ResultsDB
+    from utils import save_test_result
+
+    commit = args.commit or current_commit()
+    runner = args.runner or runner_id()
+    print(f"실행 환경: {runner}")
+    db_path = args.db or os.getenv('NETSPRESSO_RESULTS_DB', DEFAULT_RESULTS_DB)
+    regressed = False
+
+    with ResultsDB(db_path) as results_db:
+        if not args.check_only:
+            from model_tests import create_simple_test_model, create_yolo_compatible_model
+            from netspresso_client import NetsPresssoQAClient
+            from trace_cache import get_traced_model_path
+
+            if args.threads:
+                import torch
+                torch.set_num_threads(args.threads)
+
+            factories = {'simple': create_simple_test_model, 'yolo': create_yolo_compatible_model}
+            # 압축 시간을 재야 하므로 압축 결과 캐시는 사용하지 않음
+            client = NetsPresssoQAClient(use_cache=False)
+            with tempfile.TemporaryDirectory() as work_dir:
+                for model in args.models:
+                    model_path = get_traced_model_path(factories[model])
+                    for repeat in range(args.repeats):
+                        metrics = measure_model(client, model_path, os.path.join(work_dir, f"{model}_{repeat}"),
+                                                args.input_size, iterations=args.iterations)
+                        results_db.add_metrics(model, metrics, commit=commit, runner=runner)
+                        print(f"측정 {model} #{repeat + 1}: " + ", ".join(
+                            f"{name}={value:.4g}" for name, value in metrics.items()))
+
+        for model in args.models:
+            check = check_regressions(results_db, model, commit, metrics=METRICS, window=args.window,
+                                      min_baseline=args.min_baseline, mad_threshold=args.threshold,
+                                      gating=None if args.gate_latency else DETERMINISTIC_METRICS, runner=runner,
+                                      min_relative_change=args.min_change, alpha=args.alpha)
+            regressed = regressed or check['regressed']
+            if check['advisory']:
+                print(f"   [{model}] 참고용 회귀 (같은 runner 기준 부족, 실패로 판정하지 않음): "
+                      f"{', '.join(check['advisory'])}")
+
+            for row in check['metrics']:
+                if row['status'] == 'insufficient_baseline':
+                    print(f"   [{model}] {row['metric']}: 기준 값 부족 ({row['baseline_samples']}/{args.min_baseline})")
+                    continue
+                if row['status'] == 'regressed':
+                    mark = '❌' if row['gating'] else '⚠️'
+                else:
+                    mark = {'improved': '⬇️'}.get(row['status'], '✅')
+                print(f"{mark} [{model}] {row['metric']}: {row['baseline_median']:.4g} → "
+                      f"{row['current_median']:.4g} ({row['relative_change'] * 100:+.1f}%, {row['method']})")
+
+            result = {
+                'test_name': f"{model}_regression",
+                'success': not check['regressed'],
+                'regression': check,
+                'error': f"성능 회귀: {', '.join(check['regressions'])}" if check['regressed'] else None
+            }
+            output_path = os.path.join(args.output_dir, f"{model}_regression_result.json")
+            save_test_result(result, output_path)
+            print(f"회귀 검사 결과 저장됨: {output_path}")
+
+    if regressed:
+        print("⚠️  성능 회귀가 감지되었습니다.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
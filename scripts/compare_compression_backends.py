@@ -0,0 +1,66 @@
+"""
+로컬 vs 원격 압축 비교 스크립트
+같은 모델을 로컬 채널 프루닝 backend와 NetsPresso(또는 오프라인 대역)로 압축해
+크기 / 파라미터 수 / 지연 시간 / 출력 편차를 표준 결과 JSON으로 저장 (generate_qa_report.py에서 표로 표시)
+"""
+import os
+import sys
+import argparse
+from pathlib import Path
+
+# 상위 디렉토리의 src 모듈 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 채널 프루닝과 원격 압축 결과 비교")
+    parser.add_argument('model_path', help="torch.fx.GraphModule 모델 경로")
+    parser.add_argument('--compression-ratio', type=float, default=0.5)
+    parser.add_argument('--norm', choices=('l2', 'l1'), default='l2', help="로컬 프루닝 채널 중요도 기준")
+    parser.add_argument('--input-size', type=int, nargs=2, default=[224, 224], metavar=('H', 'W'))
+    parser.add_argument('--iterations', type=int, default=20, help="지연 시간 측정 반복 횟수")
+    parser.add_argument('--fake', action='store_true', help="원격 backend로 오프라인 대역 사용")
+    parser.add_argument('--local-only', action='store_true', help="원격 압축 없이 로컬 결과만 기록")
+    parser.add_argument('--no-cache', action='store_true', help="압축 결과 캐시를 사용하지 않음")
+    parser.add_argument('--output-dir', default='./results/backends')
+    args = parser.parse_args()
+
+    if args.fake:
+        os.environ['NETSPRESSO_FAKE_BACKEND'] = '1'
+
+    from local_compressor import LocalCompressor, compare_backends, save_backend_comparison
+    from netspresso_client import NetsPresssoQAClient
+    from utils import format_file_size
+
+    clients = {'local': NetsPresssoQAClient(compressor=LocalCompressor(norm=args.norm), use_cache=not args.no_cache)}
+    if not args.local_only:
+        clients['remote'] = NetsPresssoQAClient(use_cache=not args.no_cache)
+
+    model_name = Path(args.model_path).stem
+    comparison = compare_backends(
+        clients,
+        args.model_path,
+        os.path.join(args.output_dir, model_name),
+        input_shapes=[{"batch": 1, "channel": 3, "dimension": list(args.input_size)}],
+        compression_ratio=args.compression_ratio,
+        iterations=args.iterations
+    )
+
+    original = comparison['original']
+    print(f"원본: {format_file_size(original['size'])}, {original['params']:,} params, "
+          f"{original['latency'] * 1000:.2f}ms")
+    for row in comparison['backends']:
+        if row['success']:
+            print(f"✅ {row['backend']}: {format_file_size(row['compressed_size'])} ({row['size_ratio']:.1%}), "
+                  f"{row['params']:,} params, {row['latency'] * 1000:.2f}ms ({row['speedup']:.2f}x)")
+        else:
+            print(f"❌ {row['backend']}: {row['error_type']}: {row['error']}")
+
+    output_path = os.path.join(args.output_dir, f"{model_name}_backend_comparison.json")
+    save_backend_comparison(comparison, output_path)
+    print(f"비교 결과 저장됨: {output_path}")
+    return 0 if comparison['backends'][0]['success'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
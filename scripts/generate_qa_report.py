@@ -3,15 +3,23 @@ QA 리포트 생성 스크립트 (개선 버전)
 """
 import os
 import json
-from datetime import datetime
-import glob
+import itertools
+from datetime import datetime, timedelta
 import sys
+import shutil
 import traceback
 from pathlib import Path
 
 # 상위 디렉토리의 src 모듈 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from failure_patterns import FAILURE_CATEGORIES, cluster_failures
+from regression import METRICS
+from results_db import DEFAULT_RESULTS_DB, ResultsDB
+from results_index import ResultsIndex
+
+DEFAULT_SHARD_SIZE = 200
+
 try:
     from utils import TestResultCollector, load_test_result, format_file_size
 except ImportError as e:
@@ -20,7 +28,7 @@ except ImportError as e:
     
     # 기본 TestResultCollector 구현
     class TestResultCollector:
-        def __init__(self):
+        def __init__(self, streaming=False):
             self.results = []
             self.start_time = datetime.now()
         
@@ -67,33 +75,28 @@ except ImportError as e:
         return f"{size_bytes:.1f}{size_names[i]}"
 
 
-def collect_test_results():
-    """테스트 결과 파일들을 수집하여 종합 리포트 생성"""
-    
-    collector = TestResultCollector()
+def collect_test_results(results_dir='./results'):
+    """
+    테스트 결과 파일들을 수집하여 종합 리포트 생성
     
-    # 여러 패턴으로 결과 파일 찾기
-    patterns = [
-        './results/**/*.json',
-        './results/**/metadata.json',
-        './results/**/*result*.json',
-        './results/**/*test*.json'
-    ]
+    results 폴더는 한 번만 순회하며, 영구 인덱스(results/.results_index.json)를 이용해
+    새로 생기거나 바뀐 파일만 파싱. *.jsonl 결과 로그는 한 줄씩 스트리밍으로 읽음.
+    결과 details는 수집기의 spill 파일로 내보내므로 결과 수가 많아도 메모리 사용량이 작게 유지됨
+    """
     
-    result_files = []
-    for pattern in patterns:
-        files = glob.glob(pattern, recursive=True)
-        result_files.extend(files)
+    collector = TestResultCollector(streaming=True)
     
-    # 중복 제거
-    result_files = list(set(result_files))
+    index = ResultsIndex(results_dir)
+    parsed_files = index.refresh()
+    # 바뀐 파일이 없으면 인덱스를 다시 쓰지 않음
+    index.save()
     
-    if not result_files:
+    if not index.entries and not index.log_segments:
         print(f"경고: results/ 폴더에서 JSON 파일을 찾을 수 없습니다.")
         print("다음 위치를 확인합니다:")
         
         # results 폴더 구조 탐색
-        results_path = Path('./results')
+        results_path = Path(results_dir)
         if results_path.exists():
             print(f"📁 results 폴더 내용:")
             for item in results_path.rglob('*'):
@@ -119,45 +122,23 @@ def collect_test_results():
         )
         return collector
     
-    print(f"발견된 테스트 결과 파일: {len(result_files)}개")
+    print(f"발견된 테스트 결과 파일: {index.stats['total']}개 "
+          f"(새로 파싱 {index.stats['parsed']}개, 인덱스 재사용 {index.stats['reused']}개), "
+          f"결과 로그 세그먼트: {len(index.log_segments)}개")
+    for result_file in parsed_files:
+        key = os.path.relpath(result_file, results_dir)
+        if index.entries[key]['record']:
+            print(f"처리 완료: {Path(result_file).name}")
+        else:
+            print(f"경고: {result_file}에서 유효한 결과 데이터를 찾을 수 없습니다.")
     
-    for result_file in result_files:
-        try:
-            test_data = load_test_result(result_file)
-            if test_data:
-                # 다양한 형태의 결과 데이터 처리
-                if 'result' in test_data:
-                    # 기존 형식
-                    result = test_data['result']
-                    test_name = Path(result_file).stem
-                    collector.add_result(
-                        test_name=test_name,
-                        success=result.get('success', False),
-                        details=result
-                    )
-                elif 'status' in test_data or 'compressed_model_id' in test_data:
-                    # NetsPresso metadata.json 형식
-                    test_name = f"netspresso_test_{Path(result_file).parent.name}"
-                    success = test_data.get('status') == 'completed' or 'compressed_model_id' in test_data
-                    collector.add_result(
-                        test_name=test_name,
-                        success=success,
-                        details=test_data
-                    )
-                else:
-                    # 일반적인 JSON 결과
-                    test_name = Path(result_file).stem
-                    success = test_data.get('success', 'error' not in test_data)
-                    collector.add_result(
-                        test_name=test_name,
-                        success=success,
-                        details=test_data
-                    )
-                print(f"처리 완료: {Path(result_file).name}")
-            else:
-                print(f"경고: {result_file}에서 유효한 결과 데이터를 찾을 수 없습니다.")
-        except Exception as e:
-            print(f"오류: {result_file} 처리 중 문제 발생: {e}")
+    # 기존 파일별 JSON (마이그레이션 전 결과) + JSONL 결과 로그 (스트리밍)
+    for record in itertools.chain(index.records(), index.iter_log_results()):
+        collector.add_result(
+            test_name=record['test_name'],
+            success=record['success'],
+            details=record['details']
+        )
     
     return collector
 
@@ -174,6 +155,21 @@ def generate_test_details_section(result):
     # 기본 정보
     if 'duration' in details:
         details_section += f"- **소요 시간**: {details['duration']:.2f}초\n"
+    if details.get('stages'):
+        # 바깥 compress span을 뺀 단계별 self 시간 (자식 단계 시간은 제외)
+        stages = ', '.join(f"{name} {stage['self']:.2f}초" for name, stage in details['stages'].items()
+                           if name != 'compress')
+        details_section += f"- **단계별 시간**: {stages}\n"
+
+    # 수치 동등성 검증
+    if 'equivalence' in details:
+        equivalence = details['equivalence']
+        details_section += (
+            f"- **수치 동등성**: {'통과' if equivalence['passed'] else '실패'} "
+            f"({equivalence['samples']}개 입력, max abs {equivalence['max_abs_error']:.2e}, "
+            f"평균 cos {equivalence['mean_cosine_similarity']:.6f}, "
+            f"top-{equivalence['top_k']} 일치 {equivalence['topk_agreement'] * 100:.2f}%)\n"
+        )
     
     # 성공 시 정보
     if result['success']:
@@ -203,36 +199,276 @@ def generate_test_details_section(result):
     return details_section
 
 
+def generate_sweep_section(results):
+    """압축률 스윕 결과의 파레토 프런티어 표 생성"""
+    section = ""
+    sweeps = [r for r in results if r['details'] and 'sweep' in r['details']]
+    if not sweeps:
+        return section
+    
+    section += "## 📐 압축률 스윕 (파레토 프런티어)\n\n"
+    for result in sweeps:
+        sweep = result['details']['sweep']
+        original = sweep.get('original', {})
+        section += f"### {result['test_name']}\n\n"
+        section += f"- **모델**: {sweep.get('model_path')}\n"
+        if original:
+            section += f"- **원본**: {format_file_size(original['size'])}, {original['latency'] * 1000:.2f}ms\n"
+        section += f"- **측정 지점**: {len(sweep['points'])}개 / 요청 {len(sweep['ratios_requested'])}개\n"
+        if sweep.get('stopped_early'):
+            skipped = ', '.join(f"{r:.2f}" for r in sweep['skipped_ratios'])
+            section += f"- **조기 종료**: 개선이 없어 {skipped} 생략\n"
+        section += "\n| 압축률 | 압축 크기 | 지연 시간 | 출력 편차 |\n|----:|----:|----:|----:|\n"
+        for point in sweep['pareto_frontier']:
+            deviation = f"{point['deviation']:.2e}" if point['deviation'] is not None else "형태 불일치"
+            section += (f"| {point['ratio']:.2f} | {format_file_size(point['compressed_size'])} "
+                        f"| {point['latency'] * 1000:.2f}ms | {deviation} |\n")
+        section += "\n"
+    
+    return section
+
+
+def generate_benchmark_section(results):
+    """원본/압축 모델 추론 벤치마크 비교 표 생성"""
+    section = ""
+    benchmarks = [r for r in results if r['details'] and 'benchmark' in r['details']]
+    if not benchmarks:
+        return section
+    
+    section += "## ⏱️ 추론 벤치마크 (원본 vs 압축)\n\n"
+    for result in benchmarks:
+        benchmark = result['details']['benchmark']
+        section += f"### {result['test_name']}\n\n"
+        section += f"- **원본**: {benchmark['original_path']}\n"
+        section += f"- **압축**: {benchmark['compressed_path']}\n"
+        section += f"- **반복**: warmup {benchmark['warmup']}회, 측정 {benchmark['iterations']}회\n\n"
+        section += "| 배치 | 스레드 | 원본 p50 | 압축 p50 | 압축 p90 | 압축 p99 | 처리량 | 속도 향상 |\n"
+        section += "|----:|----:|----:|----:|----:|----:|----:|----:|\n"
+        for row, compressed in zip(benchmark['comparison'], benchmark['compressed']):
+            section += (f"| {row['batch_size']} | {row['num_threads']} "
+                        f"| {row['original_p50'] * 1000:.2f}ms | {row['compressed_p50'] * 1000:.2f}ms "
+                        f"| {compressed['p90'] * 1000:.2f}ms | {compressed['p99'] * 1000:.2f}ms "
+                        f"| {compressed['throughput']:.1f}/s | {row['speedup_p50']:.2f}x |\n")
+        section += "\n"
+    
+    return section
+
+
+def generate_backend_comparison_section(results):
+    """로컬 채널 프루닝과 원격 압축의 크기 / 지연 시간 비교 표 생성"""
+    section = ""
+    comparisons = [r for r in results if r['details'] and 'backend_comparison' in r['details']]
+    if not comparisons:
+        return section
+    
+    section += "## ⚖️ 로컬 vs 원격 압축\n\n"
+    for result in comparisons:
+        comparison = result['details']['backend_comparison']
+        original = comparison['original']
+        section += f"### {result['test_name']}\n\n"
+        section += f"- **모델**: {comparison['model_path']}\n"
+        section += f"- **압축률**: {comparison['compression_ratio']}\n\n"
+        section += "| backend | 상태 | 크기 | 크기 비율 | 파라미터 | 지연 시간 | 속도 향상 | 출력 편차 | 압축 시간 |\n"
+        section += "|------|------|----:|----:|----:|----:|----:|----:|----:|\n"
+        section += (f"| 원본 | - | {format_file_size(original['size'])} | 100.0% | {original['params']:,} "
+                    f"| {original['latency'] * 1000:.2f}ms | 1.00x | - | - |\n")
+        for row in comparison['backends']:
+            compression_time = f"{row['compression_time']:.2f}초" if row.get('compression_time') is not None else "-"
+            if not row['success']:
+                section += (f"| {row['backend']} | ❌ {row.get('error_type') or row['status']} "
+                            f"| - | - | - | - | - | - | {compression_time} |\n")
+                continue
+            deviation = f"{row['deviation']:.2e}" if row['deviation'] is not None else "형태 불일치"
+            section += (f"| {row['backend']} | ✅ | {format_file_size(row['compressed_size'])} | {row['size_ratio']:.1%} "
+                        f"| {row['params']:,} | {row['latency'] * 1000:.2f}ms | {row['speedup']:.2f}x "
+                        f"| {deviation} | {compression_time} |\n")
+        section += "\n"
+    
+    return section
+
+
+def generate_scaling_section(results):
+    """모델 크기별 단계 시간 표와 확장 곡선(시간 ∝ 크기^k) 표 생성"""
+    section = ""
+    scalings = [r for r in results if r['details'] and 'scaling' in r['details']]
+    if not scalings:
+        return section
+    
+    section += "## 📈 모델 크기별 확장성\n\n"
+    for result in scalings:
+        scaling = result['details']['scaling']
+        stages = list(scaling['rows'][0]['stages']) if scaling['rows'] else []
+        section += f"### {result['test_name']}\n\n"
+        section += "| 모델 | 파라미터 | 파일 크기 | " + " | ".join(stages) + " | 최대 활성화 메모리 |\n"
+        section += "|------|----:|----:|" + "----:|" * len(stages) + "----:|\n"
+        for row in scaling['rows']:
+            times = " | ".join(f"{row['stages'][stage] * 1000:.1f}ms" for stage in stages)
+            section += (f"| {row['name']} | {row['params']:,} | {format_file_size(row['file_size'])} | {times} "
+                        f"| {format_file_size(row['peak_activation_bytes'])} |\n")
+        
+        target = format_file_size(scaling['target_size'])
+        section += (f"\n| 지표 | 지수 k (∝ 크기^k) | R² | {target} 추정 (거듭제곱) | {target} 추정 (직선) |\n"
+                    "|------|----:|----:|----:|----:|\n")
+        for key, fits in scaling['curves'].items():
+            power = fits['power']
+            if power is None:
+                continue
+            values = [scaling['projected'][key][kind] for kind in ('power', 'linear')]
+            values = [max(v, 0) for v in values]
+            values = [format_file_size(v) if key.endswith('bytes') else f"{v:.2f}초" for v in values]
+            section += f"| {key} | {power['exponent']:.2f} | {power['r2']:.3f} | {values[0]} | {values[1]} |\n"
+        section += "\n"
+    
+    return section
+
+
+def generate_regression_section(results):
+    """성능 회귀 검사 결과(기준 대비 지표 변화) 표 생성"""
+    section = ""
+    checks = [r for r in results if r['details'] and 'regression' in r['details']]
+    if not checks:
+        return section
+    
+    section += "## 📉 성능 회귀 검사\n\n"
+    for result in checks:
+        check = result['details']['regression']
+        status = f"❌ 회귀 ({', '.join(check['regressions'])})" if check['regressed'] else "✅ 회귀 없음"
+        section += f"### {check['model']} — {status}\n\n"
+        section += f"- **커밋**: `{check['commit']}`\n"
+        section += f"- **기준**: 직전 최대 {check['window']}회 측정 값\n"
+        if check.get('runner'):
+            section += f"- **실행 환경**: `{check['runner']}`\n"
+        if check.get('advisory'):
+            section += f"- **참고용 회귀** (실패로 판정하지 않음): {', '.join(check['advisory'])}\n"
+        section += "\n"
+        section += "| 지표 | 기준 중앙값 | 현재 중앙값 | 변화 | 판정 방법 | 결과 |\n|------|----:|----:|----:|------|------|\n"
+        for row in check['metrics']:
+            name = METRICS.get(row['metric'], row['metric'])
+            if row['status'] == 'insufficient_baseline':
+                section += (f"| {name} | - | {row['current_median']:.4g} | - | - "
+                            f"| 기준 부족 ({row['baseline_samples']}개) |\n")
+                continue
+            if row['method'] == 'mann_whitney':
+                method = f"Mann-Whitney p={row.get('p_adjusted', row['p_value']):.3f}"
+            else:
+                method = f"robust z={row['z_score']:.1f}"
+            if row['status'] == 'regressed' and not row.get('gating', True):
+                outcome = "⚠️ 회귀 (참고)"
+            else:
+                outcome = {'regressed': "❌ 회귀", 'improved': "⬇️ 개선"}.get(row['status'], "✅")
+            section += (f"| {name} | {row['baseline_median']:.4g} | {row['current_median']:.4g} "
+                        f"| {row['relative_change'] * 100:+.1f}% | {method} | {outcome} |\n")
+        section += "\n"
+    
+    return section
+
+
+def generate_trend_section(results_db, days=7, history_limit=10):
+    """결과 DB 기반 일별 추이 / 실패 유형 / 모델별 최근 이력 표 생성"""
+    section = ""
+    trend = results_db.daily_trend(days=days)
+    if not trend:
+        return section
+    
+    section += f"## 📈 최근 {days}일 추이\n\n"
+    section += "| 날짜 | 전체 | 성공 | 실패 | 성공률 | 평균 소요 시간 |\n|------|----:|----:|----:|----:|----:|\n"
+    for day in trend:
+        duration = f"{day['mean_duration']:.2f}초" if day['mean_duration'] is not None else "-"
+        section += (f"| {day['day']} | {day['total']} | {day['passed']} | {day['failed']} "
+                    f"| {day['success_rate']:.1f}% | {duration} |\n")
+    section += "\n"
+    
+    since = datetime.now() - timedelta(days=days)
+    failure_counts = results_db.failure_counts(since=since)
+    if failure_counts:
+        section += "### 실패 유형별 건수\n\n| 유형 | 건수 |\n|------|----:|\n"
+        for category, count in failure_counts.items():
+            section += f"| {FAILURE_CATEGORIES.get(category, category)} | {count} |\n"
+        section += "\n"
+    
+    models = results_db.recent_models()
+    if models:
+        section += f"### 모델별 최근 {history_limit}회 이력\n\n| 모델 | 결과 (오래된 → 최신) | 평균 소요 시간 |\n|------|------|----:|\n"
+        for model in models:
+            history = results_db.model_history(model, limit=history_limit)
+            statuses = "".join("✅" if h['status'] == 'passed' else "❌" for h in history)
+            durations = [h['duration'] for h in history if h['duration'] is not None]
+            mean_duration = f"{sum(durations) / len(durations):.2f}초" if durations else "-"
+            section += f"| {model} | {statuses} | {mean_duration} |\n"
+        section += "\n"
+    
+    return section
+
+
 def analyze_failure_patterns(failed_tests):
-    """실패 패턴 분석"""
+    """
+    실패 패턴 분석
+    
+    Returns:
+        dict: 실패 유형 → 시그니처 군집(cluster_failures) 목록. 건수가 많은 유형부터
+    """
     patterns = {}
     
-    for test in failed_tests:
-        error = test['details'].get('error', '').lower()
-        error_type = test['details'].get('error_type', 'unknown')
-        
-        # 패턴 분류
-        if 'notvalidframeworkexception' in error or 'framework' in error:
-            patterns.setdefault('framework_issues', []).append(test)
-        elif 'timeout' in error or 'time' in error:
-            patterns.setdefault('timeout_issues', []).append(test)
-        elif 'memory' in error or 'oom' in error:
-            patterns.setdefault('memory_issues', []).append(test)
-        elif 'network' in error or 'connection' in error:
-            patterns.setdefault('network_issues', []).append(test)
-        else:
-            patterns.setdefault('other_issues', []).append(test)
+    for cluster in cluster_failures(failed_tests):
+        patterns.setdefault(cluster['category'], []).append(cluster)
     
-    return patterns
+    return dict(sorted(patterns.items(), key=lambda item: -sum(c['count'] for c in item[1])))
+
 
+def generate_test_result_block(result):
+    """테스트 한 건의 상세 결과 블록"""
+    status_emoji = "✅" if result['success'] else "❌"
+    block = f"### {status_emoji} {result['test_name']}\n\n"
+    block += f"- **실행 시간**: {result['timestamp']}\n"
+    block += f"- **결과**: {'성공' if result['success'] else '실패'}\n"
+    block += generate_test_details_section(result)
+    return block + "\n"
 
-def generate_markdown_report(collector):
-    """마크다운 형태의 QA 리포트 생성"""
+
+def write_detail_shards(results, shard_dir, report_name, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    테스트별 상세 결과를 shard_size개씩 페이지 파일로 나눠 저장 (결과는 한 번만 순회)
     
-    summary = collector.get_summary()
+    Returns:
+        list: 페이지별 file(파일명), count, success_count, first, last dict 목록
+    """
+    shard_dir = Path(shard_dir)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    pages = []
+    page_file = None
+    
+    def close_page():
+        if page_file is not None:
+            page_file.write(f"\n---\n[← 요약으로]({'../' + report_name})\n")
+            page_file.close()
+    
+    for result in results:
+        if page_file is None or pages[-1]['count'] >= shard_size:
+            close_page()
+            page = {'file': f"page_{len(pages) + 1:04d}.md", 'count': 0, 'success_count': 0,
+                    'first': result['test_name'], 'last': result['test_name']}
+            pages.append(page)
+            page_file = open(shard_dir / page['file'], 'w', encoding='utf-8')
+            page_file.write(f"# 📋 상세 테스트 결과 {len(pages)}페이지\n\n[← 요약으로]({'../' + report_name})\n\n")
+        page = pages[-1]
+        page['count'] += 1
+        page['success_count'] += 1 if result['success'] else 0
+        page['last'] = result['test_name']
+        page_file.write(generate_test_result_block(result))
+    close_page()
+    
+    return pages
+
+
+def iter_report_chunks(summary, results_db=None, detail_pages=None, detail_dir=None):
+    """
+    리포트를 섹션 단위 문자열로 차례대로 생성
+    
+    detail_pages(write_detail_shards 결과)를 주면 테스트별 상세 결과 대신 페이지 링크 표를 넣음
+    """
     
     # 헤더
-    report = f"""# NetsPresso QA 테스트 리포트
+    yield f"""# NetsPresso QA 테스트 리포트
 
 **생성 시각**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
 **테스트 소요시간**: {summary['test_duration']:.1f}초
@@ -252,7 +488,7 @@ def generate_markdown_report(collector):
     if summary['total_tests'] > 0:
         success_bar = "█" * int(summary['success_rate'] / 5)  # 20개 바 기준
         fail_bar = "█" * int((100 - summary['success_rate']) / 5)
-        report += f"""
+        yield f"""
 ### 성공/실패 비율
 ```
 성공 [{success_bar:<20}] {summary['success_rate']:.1f}%
@@ -262,62 +498,76 @@ def generate_markdown_report(collector):
 """
 
     # 상세 결과
-    report += "## 📋 상세 테스트 결과\n\n"
+    yield "## 📋 상세 테스트 결과\n\n"
     
-    for result in summary['results']:
-        status_emoji = "✅" if result['success'] else "❌"
-        report += f"### {status_emoji} {result['test_name']}\n\n"
-        report += f"- **실행 시간**: {result['timestamp']}\n"
-        report += f"- **결과**: {'성공' if result['success'] else '실패'}\n"
-        
-        # 상세 정보 추가
-        details_section = generate_test_details_section(result)
-        if details_section:
-            report += details_section
-        
-        report += "\n"
+    if detail_pages is None:
+        for result in summary['results']:
+            yield generate_test_result_block(result)
+    else:
+        yield "| 페이지 | 테스트 | 성공 | 실패 | 범위 |\n|------|----:|----:|----:|------|\n"
+        for number, page in enumerate(detail_pages, 1):
+            yield (f"| [{number}]({detail_dir}/{page['file']}) | {page['count']} | {page['success_count']} "
+                   f"| {page['count'] - page['success_count']} | {page['first']} … {page['last']} |\n")
+        yield "\n"
+    
+    # 압축률 스윕
+    yield generate_sweep_section(summary['results'])
+    
+    # 추론 벤치마크
+    yield generate_benchmark_section(summary['results'])
+    
+    # 로컬 vs 원격 압축
+    yield generate_backend_comparison_section(summary['results'])
+    
+    # 모델 크기별 확장성
+    yield generate_scaling_section(summary['results'])
+    
+    # 성능 회귀 검사
+    yield generate_regression_section(summary['results'])
+    
+    # 결과 DB 기반 추이
+    if results_db is not None:
+        yield generate_trend_section(results_db)
     
     # 실패 분석
-    failed_tests = [r for r in summary['results'] if not r['success']]
-    if failed_tests:
-        report += "## 🔍 실패 분석\n\n"
+    failure_patterns = {}
+    if summary['failed_count']:
+        yield "## 🔍 실패 분석\n\n"
         
-        failure_patterns = analyze_failure_patterns(failed_tests)
+        failure_patterns = analyze_failure_patterns(r for r in summary['results'] if not r['success'])
         
-        for pattern_type, tests in failure_patterns.items():
-            pattern_name = {
-                'framework_issues': '프레임워크 호환성 문제',
-                'timeout_issues': '타임아웃 문제',
-                'memory_issues': '메모리 부족',
-                'network_issues': '네트워크 문제',
-                'other_issues': '기타 문제'
-            }.get(pattern_type, pattern_type)
+        for pattern_type, clusters in failure_patterns.items():
+            pattern_name = FAILURE_CATEGORIES.get(pattern_type, pattern_type)
             
-            report += f"### {pattern_name}\n"
-            report += f"발생 횟수: {len(tests)}건\n\n"
+            section = f"### {pattern_name}\n"
+            section += f"발생 횟수: {sum(c['count'] for c in clusters)}건 (원인 {len(clusters)}가지)\n\n"
             
-            for test in tests:
-                report += f"- **{test['test_name']}**: {test['details'].get('error', 'Unknown error')}\n"
+            # 원인(시그니처)별 한 줄
+            for cluster in clusters:
+                examples = ', '.join(str(name) for name in cluster['examples'])
+                section += f"- `{cluster['signature']}` — {cluster['count']}건 (예: {examples})\n"
             
-            report += "\n"
+            yield section + "\n"
     
     # QA 권장사항
-    report += """## 🎯 QA 관점 권장사항
+    section = """## 🎯 QA 관점 권장사항
 
 ### 우선순위 높음
 """
     
-    if failed_tests:
-        if any('framework' in test['details'].get('error', '').lower() for test in failed_tests):
-            report += "- 지원되지 않는 모델 형식에 대한 명확한 문서화 필요\n"
-        if any('timeout' in test['details'].get('error', '').lower() for test in failed_tests):
-            report += "- 대용량 모델 처리 시 타임아웃 설정 검토\n"
-        if len(failed_tests) > summary['total_tests'] * 0.3:
-            report += "- 전체적인 안정성 개선 필요 (실패율 30% 초과)\n"
+    if summary['failed_count']:
+        if 'framework_issues' in failure_patterns:
+            section += "- 지원되지 않는 모델 형식에 대한 명확한 문서화 필요\n"
+        if 'timeout_issues' in failure_patterns:
+            section += "- 대용량 모델 처리 시 타임아웃 설정 검토\n"
+        if any(r['details'] and r['details'].get('regression', {}).get('regressed') for r in summary['results']):
+            section += "- 성능 회귀가 감지된 지표의 원인 커밋 확인 필요\n"
+        if summary['failed_count'] > summary['total_tests'] * 0.3:
+            section += "- 전체적인 안정성 개선 필요 (실패율 30% 초과)\n"
     else:
-        report += "- 현재 테스트된 기능들은 모두 정상 작동하고 있습니다.\n"
+        section += "- 현재 테스트된 기능들은 모두 정상 작동하고 있습니다.\n"
     
-    report += """
+    yield section + f"""
 ### 개선 제안
 - 모델 업로드 전 호환성 사전 검증 기능 구현
 - 에러 메시지의 사용자 친화성 개선
@@ -333,45 +583,88 @@ def generate_markdown_report(collector):
 *이 리포트는 자동으로 생성되었습니다.*
 *리포트 생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 """
+
+
+def generate_markdown_report(collector, results_db=None):
+    """
+    마크다운 형태의 QA 리포트 생성 (상세 결과를 모두 포함한 단일 문자열)
     
-    return report
+    results_db(results_db.ResultsDB)를 주면 과거 결과 기반 추이 섹션 추가
+    """
+    return "".join(iter_report_chunks(collector.get_summary(), results_db))
 
 
-def main():
+def write_markdown_report(collector, report_path, results_db=None, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    리포트를 섹션이 생성되는 대로 파일에 기록
+    
+    테스트별 상세 결과는 <리포트 이름>_details/page_NNNN.md로 shard_size개씩 나눠 저장하고
+    요약 리포트에는 페이지 링크만 넣음. 요약은 임시 파일에 쓴 뒤 rename하므로 중간 상태가 보이지 않음
+    
+    Returns:
+        dict: report_path, detail_dir, pages
+    """
+    report_path = Path(report_path)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    summary = collector.get_summary()
+    
+    detail_dir = f"{report_path.stem}_details"
+    pages = write_detail_shards(summary['results'], report_path.parent / detail_dir, report_path.name, shard_size)
+    
+    tmp_path = report_path.with_name(f".{report_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for chunk in iter_report_chunks(summary, results_db, pages, detail_dir):
+            f.write(chunk)
+    os.replace(tmp_path, report_path)
+    
+    return {'report_path': str(report_path), 'detail_dir': str(report_path.parent / detail_dir), 'pages': pages}
+
+
+def publish_latest(report_path, latest_path):
+    """
+    최신 리포트 경로를 report_path의 하드링크로 교체 (내용을 다시 쓰지 않음)
+    
+    하드링크를 만들 수 없는 파일 시스템에서는 복사 후 rename. 상세 페이지 링크가 깨지지 않도록
+    latest_path는 report_path와 같은 디렉토리에 두어야 함
+    """
+    latest_path = Path(latest_path)
+    tmp_path = latest_path.with_name(f".{latest_path.name}.{os.getpid()}.tmp")
+    try:
+        os.link(report_path, tmp_path)
+    except OSError:
+        shutil.copyfile(report_path, tmp_path)
+    os.replace(tmp_path, latest_path)
+    return str(latest_path)
+
+
+def main(results_dir='./results'):
     """메인 실행 함수"""
     try:
         print("🚀 QA 리포트 생성을 시작합니다...")
         
         # 결과 수집
-        collector = collect_test_results()
+        collector = collect_test_results(results_dir)
         
         if not collector.results:
             print("❌ 테스트 결과를 찾을 수 없습니다.")
-            print("   ./results/ 폴더에 *.json 파일이 있는지 확인해주세요.")
+            print(f"   {results_dir}/ 폴더에 *.json 파일이 있는지 확인해주세요.")
             return 1
         
         # 마크다운 리포트 생성
         print("📝 리포트를 생성하고 있습니다...")
-        report = generate_markdown_report(collector)
+        db_path = os.getenv('NETSPRESSO_RESULTS_DB', DEFAULT_RESULTS_DB)
+        results_db = ResultsDB(db_path) if os.path.exists(db_path) else None
         
-        # 리포트 저장 디렉토리 생성
-        reports_dir = Path('./results/reports')
-        reports_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 타임스탬프가 포함된 리포트 저장
+        # 타임스탬프가 포함된 리포트 저장 (상세 결과는 페이지 파일로 분할)
+        reports_dir = Path(results_dir) / 'reports'
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        report_path = reports_dir / f"qa_report_{timestamp}.md"
-        
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+        written = write_markdown_report(collector, reports_dir / f"qa_report_{timestamp}.md", results_db)
         
-        # 최신 리포트로 복사
-        summary_path = Path('./results/qa_summary_report.md')
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+        # 최신 리포트는 하드링크로 교체
+        summary_path = publish_latest(written['report_path'], reports_dir / 'qa_summary_report.md')
         
         print(f"✅ QA 리포트 생성 완료!")
-        print(f"   📄 상세 리포트: {report_path}")
+        print(f"   📄 상세 리포트: {written['report_path']} (상세 페이지 {len(written['pages'])}개)")
         print(f"   📄 요약 리포트: {summary_path}")
         
         # 요약 정보 출력
@@ -388,6 +681,10 @@ def main():
         # 실패가 있으면 경고
         if summary['failed_count'] > 0:
             print(f"⚠️  {summary['failed_count']}개의 테스트가 실패했습니다. 상세 내용은 리포트를 확인해주세요.")
+            # 원인별 한 줄 요약
+            for cluster in cluster_failures(r for r in collector.results if not r['success']):
+                category = FAILURE_CATEGORIES.get(cluster['category'], cluster['category'])
+                print(f"   • [{category}] {cluster['count']}건: {cluster['signature']}")
             return 1
         else:
             print("🎉 모든 테스트가 성공했습니다!")
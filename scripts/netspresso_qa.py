@@ -0,0 +1,177 @@
+"""
+NetsPresso QA 통합 CLI
+    python scripts/netspresso_qa.py {compress,verify,bench,report,convert} ...
+
+torch / torch.fx / netspresso SDK는 불러오는 데 수 초가 걸리므로 각 하위 명령 안에서만 import.
+report / convert / --help는 표준 라이브러리와 결과 모듈만 불러와 바로 끝남
+(tests/test_cli.py에서 import 시간 예산으로 검사)
+"""
+import os
+import sys
+import argparse
+
+# 상위 디렉토리의 src 모듈 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# report / convert 경로에서 불러오면 안 되는 모듈 (import 시간 예산 테스트에서 사용)
+HEAVY_MODULES = ('torch', 'netspresso', 'onnx', 'onnx2torch', 'numpy')
+
+
+def cmd_compress(args):
+    if args.fake:
+        os.environ['NETSPRESSO_FAKE_BACKEND'] = '1'
+    if args.local:
+        os.environ['NETSPRESSO_LOCAL_BACKEND'] = '1'
+    if args.queue:
+        return compress_with_queue(args)
+    from netspresso_client import NetsPresssoQAClient
+    from tracing import Tracer, export_chrome_trace
+
+    client = NetsPresssoQAClient(use_cache=not args.no_cache)
+    tracer = Tracer()
+    with tracer.activate():
+        model_paths = args.model_paths
+        if not model_paths:
+            # 모델을 주지 않으면 간단한 CNN (trace 결과는 세션 간 캐시에서 재사용)
+            from netspresso_client import create_simple_test_model
+            from trace_cache import get_traced_model_path
+            model_paths = [get_traced_model_path(create_simple_test_model)]
+        jobs = [{
+            'model_path': path,
+            'output_dir': args.output_dir if len(model_paths) == 1 else os.path.join(args.output_dir, str(index)),
+            'compression_ratio': args.compression_ratio
+        } for index, path in enumerate(model_paths)]
+        results = list(client.compress_many(jobs, max_workers=args.workers))
+
+    for result in sorted(results, key=lambda r: r['job_index']):
+        result.pop('spans', None)
+        status = "✅" if result['success'] else "❌"
+        print(f"{status} {result['model_path']}: {result['status']} "
+              f"({result.get('compressed_path') or result.get('error')}, {result['duration']:.3f}초)")
+        for name, stage in result.get('stages', {}).items():
+            print(f"   {name}: {stage['total']:.3f}초 (self {stage['self']:.3f}초, {stage['count']}회)")
+    if args.trace:
+        print(f"trace 저장됨: {export_chrome_trace(tracer.spans, args.trace)}")
+    return 0 if all(result['success'] for result in results) else 1
+
+
+def compress_with_queue(args):
+    """작업 큐를 거쳐 압축: 같은 배치로 다시 실행하면 끝나지 않은 작업만 이어서 처리"""
+    from job_queue import JobQueue, run_queue
+
+    model_paths = args.model_paths
+    if not model_paths:
+        from netspresso_client import create_simple_test_model
+        from trace_cache import get_traced_model_path
+        model_paths = [get_traced_model_path(create_simple_test_model)]
+
+    with JobQueue(args.queue) as queue:
+        for index, path in enumerate(model_paths):
+            output_dir = args.output_dir if len(model_paths) == 1 else os.path.join(args.output_dir, str(index))
+            queue.add(path, output_dir, compression_ratio=args.compression_ratio, batch=args.batch)
+        summary = run_queue(queue, batch=args.batch, credit_budget=args.credit_budget,
+                            max_concurrent=args.workers, credits_per_job=args.credits_per_job)
+        for job in queue.jobs(summary['batch']):
+            status = {"done": "✅", "failed": "❌"}.get(job['status'], "⏸️")
+            print(f"{status} {job['model_path']}: {job['status']} ({job['stage']}, 시도 {job['attempts']}회) "
+                  f"{job['compressed_path'] or job['error'] or ''}")
+
+    budget = f" / 예산 {summary['credit_budget']:g}" if summary['credit_budget'] is not None else ""
+    print(f"배치 {summary['batch']}: {summary['counts']}, 크레딧 {summary['credits_used']:g}{budget}")
+    if summary['budget_exhausted']:
+        print("⚠️  크레딧 예산 소진: 남은 작업은 다음 실행에서 이어서 처리")
+    return 0 if set(summary['counts']) <= {'done'} else 1
+
+
+def cmd_verify(args):
+    from pathlib import Path
+    from equivalence import save_equivalence_result, verify_model_files
+
+    equivalence = verify_model_files(
+        args.original_path,
+        args.compressed_path,
+        num_samples=args.samples,
+        chunk_size=args.chunk_size,
+        sample_shape=tuple(args.sample_shape),
+        top_k=args.top_k
+    )
+    output_path = os.path.join(args.output_dir, f"{Path(args.compressed_path).stem}_equivalence_result.json")
+    save_equivalence_result(equivalence, output_path)
+    print(f"수치 동등성: {'통과' if equivalence['passed'] else '실패'} "
+          f"(max abs {equivalence['max_abs_error']:.2e}, top-{args.top_k} 일치 {equivalence['topk_agreement']:.2%})")
+    for violation in equivalence['violations']:
+        print(f"  ❌ {violation}")
+    print(f"검증 결과 저장됨: {output_path}")
+    return 0 if equivalence['passed'] else 1
+
+
+def cmd_bench(args):
+    from run_benchmark import run
+    return run(args)
+
+
+def cmd_report(args):
+    from generate_qa_report import main as generate_report
+    return generate_report(args.results_dir)
+
+
+def cmd_convert(args):
+    from test_result_saver import convert_to_standard_format
+    convert_to_standard_format(args.results_dir)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="netspresso_qa", description="NetsPresso QA 통합 CLI")
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+
+    compress = subparsers.add_parser('compress', help="모델 압축 (NetsPresso, 오프라인 대역 또는 로컬 프루닝)")
+    compress.add_argument('model_paths', nargs='*', metavar='MODEL',
+                          help="압축할 모델 경로 (생략하면 간단한 테스트 CNN)")
+    compress.add_argument('--output-dir', default='./results/test')
+    compress.add_argument('--compression-ratio', type=float, default=0.5)
+    compress.add_argument('--workers', type=int, default=4, help="동시에 압축할 모델 수")
+    compress.add_argument('--no-cache', action='store_true', help="압축 결과 캐시를 사용하지 않음")
+    compress.add_argument('--fake', action='store_true', help="실제 서비스 대신 오프라인 대역 backend 사용")
+    compress.add_argument('--local', action='store_true',
+                          help="실제 서비스 대신 로컬 L2-norm 채널 프루닝 backend 사용 (크레딧 소모 없음)")
+    compress.add_argument('--trace', metavar='PATH', help="단계별 타이밍을 Chrome trace JSON으로 저장")
+    compress.add_argument('--queue', metavar='DB',
+                          help="SQLite 작업 큐로 실행 (중단 후 다시 실행하면 끝나지 않은 작업만 처리)")
+    compress.add_argument('--batch', help="작업 큐 배치 이름 (기본: GITHUB_RUN_ID 또는 local)")
+    compress.add_argument('--credit-budget', type=float, help="이번 실행에서 쓸 최대 크레딧 (--queue)")
+    compress.add_argument('--credits-per-job', type=float, default=25, help="압축 한 번에 예약할 크레딧 (--queue)")
+    compress.set_defaults(handler=cmd_compress)
+
+    verify = subparsers.add_parser('verify', help="원본 vs 압축 모델 수치 동등성 검증")
+    verify.add_argument('original_path', help="원본 torch.fx.GraphModule 경로")
+    verify.add_argument('compressed_path', help="압축된 모델 경로")
+    verify.add_argument('--samples', type=int, default=4096)
+    verify.add_argument('--chunk-size', type=int, default=256)
+    verify.add_argument('--sample-shape', type=int, nargs=3, default=[3, 224, 224], metavar=('C', 'H', 'W'))
+    verify.add_argument('--top-k', type=int, default=5)
+    verify.add_argument('--output-dir', default='./results/benchmarks')
+    verify.set_defaults(handler=cmd_verify)
+
+    # run_benchmark.py는 최상위에서 torch를 불러오지 않으므로 인자 정의를 그대로 공유
+    from run_benchmark import add_arguments as add_bench_arguments
+    bench = subparsers.add_parser('bench', help="원본 vs 압축 모델 추론 벤치마크")
+    add_bench_arguments(bench).set_defaults(handler=cmd_bench)
+
+    report = subparsers.add_parser('report', help="결과 파일로 QA 리포트 생성")
+    report.add_argument('--results-dir', default='./results')
+    report.set_defaults(handler=cmd_report)
+
+    convert = subparsers.add_parser('convert', help="NetsPresso 결과를 표준 결과 형식으로 변환")
+    convert.add_argument('--results-dir', default='./results')
+    convert.set_defaults(handler=cmd_convert)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
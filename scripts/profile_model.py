@@ -0,0 +1,41 @@
+"""
+정적 모델 프로파일 출력 스크립트
+압축 요청 전에 연산량/메모리가 어느 레이어에 몰려 있는지 확인
+"""
+import os
+import sys
+import argparse
+
+# 상위 디렉토리의 src 모듈 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import format_file_size, get_model_info
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델 레이어별 params / MACs / 활성화 메모리 프로파일")
+    parser.add_argument('model_path', help="torch.fx.GraphModule 모델 경로")
+    parser.add_argument('--input-shape', type=int, nargs=4, default=[1, 3, 224, 224], metavar=('N', 'C', 'H', 'W'))
+    parser.add_argument('--top', type=int, default=10, help="MACs 기준 상위 N개 노드만 출력")
+    args = parser.parse_args()
+
+    info = get_model_info(args.model_path, input_shape=tuple(args.input_shape))
+    if 'error' in info or 'profile_error' in info:
+        print(f"❌ 프로파일 실패: {info.get('error') or info.get('profile_error')}")
+        return 1
+
+    profile = info['profile']
+    print(f"모델: {info['path']} ({info['size_readable']}){' [캐시]' if profile['cached'] else ''}")
+    print(f"파라미터: {info['params']:,} | MACs: {info['macs']:,} | FLOPs: {info['flops']:,}")
+    print(f"최대 활성화 메모리: {info['peak_activation_readable']}")
+    print()
+    print("| 노드 | 연산 | 출력 형태 | params | MACs | 활성화 |")
+    print("|------|------|-----------|-------:|-----:|-------:|")
+    for node in sorted(profile['nodes'], key=lambda n: n['macs'], reverse=True)[:args.top]:
+        print(f"| {node['name']} | {node['target']} | {tuple(node['output_shape'])} | {node['params']:,} "
+              f"| {node['macs']:,} | {format_file_size(node['activation_bytes'])} |")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
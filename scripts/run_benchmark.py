@@ -0,0 +1,83 @@
+"""
+원본/압축 모델 추론 벤치마크 실행 스크립트
+결과는 표준 결과 JSON으로 저장되어 generate_qa_report.py에서 표로 표시됨
+"""
+import os
+import sys
+import argparse
+from pathlib import Path
+
+# 상위 디렉토리의 src 모듈 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+def add_arguments(parser):
+    """벤치마크 인자 등록 (netspresso_qa.py bench 하위 명령과 공유)"""
+    parser.add_argument('original_path', help="원본 torch.fx.GraphModule 경로")
+    parser.add_argument('compressed_path', help="압축된 모델 경로")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--sample-shape', type=int, nargs=3, default=[3, 224, 224], metavar=('C', 'H', 'W'))
+    parser.add_argument('--output-dir', default='./results/benchmarks')
+    parser.add_argument('--verify-samples', type=int, default=0,
+                        help="0보다 크면 해당 개수의 입력으로 수치 동등성도 검증")
+    parser.add_argument('--verify-chunk-size', type=int, default=256)
+    parser.add_argument('--top-k', type=int, default=5)
+    return parser
+
+
+def run(args):
+    from benchmark import compare_models, save_benchmark_result
+
+    benchmark = compare_models(
+        args.original_path,
+        args.compressed_path,
+        sample_shape=tuple(args.sample_shape),
+        batch_sizes=args.batch_sizes,
+        num_threads=args.threads,
+        warmup=args.warmup,
+        iterations=args.iterations
+    )
+
+    print("| 배치 | 스레드 | 원본 p50 | 압축 p50 | 속도 향상 |")
+    print("|---:|---:|---:|---:|---:|")
+    for row in benchmark['comparison']:
+        print(f"| {row['batch_size']} | {row['num_threads']} | {row['original_p50'] * 1000:.2f}ms "
+              f"| {row['compressed_p50'] * 1000:.2f}ms | {row['speedup_p50']:.2f}x |")
+
+    output_path = os.path.join(args.output_dir, f"{Path(args.compressed_path).stem}_benchmark_result.json")
+    save_benchmark_result(benchmark, output_path)
+    print(f"벤치마크 결과 저장됨: {output_path}")
+    
+    if args.verify_samples > 0:
+        from equivalence import save_equivalence_result, verify_model_files
+        
+        equivalence = verify_model_files(
+            args.original_path,
+            args.compressed_path,
+            num_samples=args.verify_samples,
+            chunk_size=args.verify_chunk_size,
+            sample_shape=tuple(args.sample_shape),
+            top_k=args.top_k
+        )
+        equivalence_path = os.path.join(args.output_dir, f"{Path(args.compressed_path).stem}_equivalence_result.json")
+        save_equivalence_result(equivalence, equivalence_path)
+        print(f"수치 동등성: {'통과' if equivalence['passed'] else '실패'} "
+              f"(max abs {equivalence['max_abs_error']:.2e}, top-{args.top_k} 일치 {equivalence['topk_agreement']:.2%})")
+        for violation in equivalence['violations']:
+            print(f"  ❌ {violation}")
+        print(f"검증 결과 저장됨: {equivalence_path}")
+        if not equivalence['passed']:
+            return 1
+    return 0
+
+
+def main(argv=None):
+    parser = add_arguments(argparse.ArgumentParser(description="원본 vs 압축 모델 추론 벤치마크"))
+    return run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+압축률 스윕 실행 스크립트
+모델 하나를 여러 compression_ratio로 병렬 압축하고 파레토 프런티어를 JSON으로 저장
+"""
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# 상위 디렉토리의 src 모듈 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+def frange(start, stop, step):
+    """start부터 stop까지(포함) step 간격의 압축률 목록"""
+    values = []
+    value = start
+    while value <= stop + 1e-9:
+        values.append(round(value, 4))
+        value += step
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="압축률 스윕 (파레토 프런티어)")
+    parser.add_argument('model_path', help="torch.fx.GraphModule 모델 경로")
+    parser.add_argument('--start', type=float, default=0.1)
+    parser.add_argument('--stop', type=float, default=0.9)
+    parser.add_argument('--step', type=float, default=0.1)
+    parser.add_argument('--workers', type=int, default=4, help="동시 압축 작업 수")
+    parser.add_argument('--patience', type=int, default=1, help="개선 없는 묶음을 몇 번까지 허용할지")
+    parser.add_argument('--input-size', type=int, nargs=2, default=[224, 224], metavar=('H', 'W'))
+    parser.add_argument('--output-dir', default='./results/sweeps')
+    parser.add_argument('--fake', action='store_true', help="오프라인 대역 backend 사용")
+    parser.add_argument('--no-cache', action='store_true', help="압축 결과 캐시를 사용하지 않음")
+    args = parser.parse_args()
+
+    if args.fake:
+        os.environ['NETSPRESSO_FAKE_BACKEND'] = '1'
+
+    from netspresso_client import NetsPresssoQAClient
+    from ratio_sweep import save_sweep_result, sweep_compression_ratios
+
+    client = NetsPresssoQAClient(use_cache=not args.no_cache)
+    model_name = Path(args.model_path).stem
+    sweep = sweep_compression_ratios(
+        client,
+        args.model_path,
+        os.path.join(args.output_dir, model_name),
+        ratios=frange(args.start, args.stop, args.step),
+        input_shapes=[{"batch": 1, "channel": 3, "dimension": list(args.input_size)}],
+        max_workers=args.workers,
+        patience=args.patience
+    )
+
+    output_path = os.path.join(args.output_dir, f"{model_name}_sweep_result.json")
+    save_sweep_result(sweep, output_path)
+    print(json.dumps(sweep['pareto_frontier'], ensure_ascii=False, indent=2))
+    print(f"스윕 결과 저장됨: {output_path}")
+    return 0 if sweep['points'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
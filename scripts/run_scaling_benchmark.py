@@ -0,0 +1,70 @@
+"""
+모델 크기별 확장성 벤치마크 실행 스크립트
+create_parametric_model 크기 사다리에서 trace / save / load / verify / (대역) 압축 시간을 측정하고
+확장 곡선을 표준 결과 JSON으로 저장 (generate_qa_report.py에서 표로 표시)
+"""
+import os
+import sys
+import argparse
+
+# 상위 디렉토리의 src 모듈 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델 크기별 trace/save/load/verify/압축 확장성 벤치마크")
+    parser.add_argument('--models', nargs='+', help="측정할 크기 사다리 이름 (기본: 전부)")
+    parser.add_argument('--max-size-mb', type=float, help="예상 파일 크기가 이보다 큰 모델은 건너뜀")
+    parser.add_argument('--repeats', type=int, default=3, help="모델별 반복 측정 횟수 (중앙값 사용)")
+    parser.add_argument('--upload-bandwidth-mb', type=float,
+                        help="대역 압축 단계의 업로드 대역폭(MB/s). 지정하지 않으면 업로드 지연 없음")
+    parser.add_argument('--input-size', type=int, nargs=2, default=[224, 224], metavar=('H', 'W'))
+    parser.add_argument('--work-dir', help="모델 파일을 쓸 디렉토리 (기본: 임시 디렉토리)")
+    parser.add_argument('--output-dir', default='./results/scaling')
+    args = parser.parse_args()
+
+    from fake_compressor import FakeCompressor
+    from model_tests import create_parametric_model
+    from scaling_benchmark import SIZE_LADDER, run_scaling_benchmark, save_scaling_result
+    from utils import format_file_size
+
+    configs = [c for c in SIZE_LADDER if not args.models or c['name'] in args.models]
+    if args.max_size_mb is not None:
+        def estimated_size(config):
+            model = create_parametric_model(**{k: v for k, v in config.items() if k != 'name'})
+            return sum(p.numel() * p.element_size() for p in model.parameters())
+        configs = [c for c in configs if estimated_size(c) <= args.max_size_mb * 1e6]
+    if len(configs) < 2:
+        print("❌ 확장 곡선을 맞추려면 모델이 2개 이상 필요합니다.")
+        return 1
+
+    bandwidth = args.upload_bandwidth_mb * 1e6 if args.upload_bandwidth_mb else None
+    scaling = run_scaling_benchmark(
+        configs,
+        work_dir=args.work_dir,
+        repeats=args.repeats,
+        compressor=FakeCompressor(upload_bandwidth=bandwidth),
+        input_shape=(1, 3, *args.input_size)
+    )
+
+    stages = list(scaling['rows'][0]['stages'])
+    print("| 모델 | 파일 크기 | " + " | ".join(stages) + " |")
+    print("|---|---:|" + "---:|" * len(stages))
+    for row in scaling['rows']:
+        times = " | ".join(f"{row['stages'][stage] * 1000:.1f}ms" for stage in stages)
+        print(f"| {row['name']} | {format_file_size(row['file_size'])} | {times} |")
+    print(f"\n확장 곡선 (파일 크기 기준, {format_file_size(scaling['target_size'])} 추정):")
+    for key, fits in scaling['curves'].items():
+        power, projected = fits['power'], scaling['projected'][key]
+        if power is not None:
+            print(f"   {key}: k={power['exponent']:.2f} (R² {power['r2']:.3f}) "
+                  f"→ 거듭제곱 {projected['power']:.3g}, 직선 {projected['linear']:.3g}")
+
+    output_path = os.path.join(args.output_dir, "scaling_result.json")
+    save_scaling_result(scaling, output_path)
+    print(f"확장성 벤치마크 결과 저장됨: {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,11 +4,18 @@ NetsPresso 테스트 실행 후 결과를 저장하는 헬퍼 함수들
 """
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-def save_test_result(test_name, success, details=None, output_dir="./results/test_results"):
+from results_log import ResultsLog
+
+RESULTS_LOG_NAME = "results.jsonl"
+
+
+def save_test_result(test_name, success, details=None, output_dir="./results/test_results", format="json"):
     """
     테스트 결과를 JSON 파일로 저장
     
@@ -17,6 +24,7 @@ def save_test_result(test_name, success, details=None, output_dir="./results/tes
         success (bool): 성공 여부
         details (dict): 상세 정보
         output_dir (str): 저장할 디렉토리
+        format (str): "json"은 결과마다 파일 하나, "jsonl"은 output_dir/results.jsonl 결과 로그에 한 줄 추가
     """
     
     # 출력 디렉토리 생성
@@ -34,6 +42,12 @@ def save_test_result(test_name, success, details=None, output_dir="./results/tes
         }
     }
     
+    if format == "jsonl":
+        filepath = output_path / RESULTS_LOG_NAME
+        ResultsLog(filepath).append(result_data)
+        print(f"테스트 결과 기록됨: {filepath}")
+        return str(filepath)
+    
     # 파일 저장
     filename = f"{test_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     filepath = output_path / filename
@@ -0,0 +1,301 @@
+"""
+asyncio 압축 작업 API
+submit()은 작업 핸들(CompressionJob)을 바로 반환하고, 상태 조회는 적응형 backoff로 이벤트 루프에서 진행.
+스레드를 작업마다 붙잡지 않으므로 한 프로세스에서 수백 개 작업을 동시에 걸어 두고 기다리거나 취소할 수 있음
+
+backend는 submit_compression / get_compression_status / cancel_compression 세 메서드를 가진 객체
+(fake_compressor.FakeCompressor가 그대로 해당). 블로킹 automatic_compression만 있는 NetsPresso SDK compressor는
+ExecutorBackend로 감싸 스레드 풀에서 실행
+"""
+
+import asyncio
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from netspresso_client import DEFAULT_COMPRESSION_RATIO, DEFAULT_INPUT_SHAPES, compression_error
+
+TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+class ExecutorBackend:
+    """
+    블로킹 automatic_compression을 스레드 풀 작업으로 돌려 비동기 작업 API로 노출하는 어댑터
+
+    이미 실행 중인 SDK 호출은 중단할 수 없으므로, 취소하면 결과만 버림.
+    SDK가 반환한 error / stopped metadata는 failed 상태와 SDK의 오류 메시지로 바꿈
+    """
+
+    def __init__(self, compressor, max_workers=4):
+        self.compressor = compressor
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit_compression(self, input_model_path, output_dir, input_shapes, framework='pytorch', compression_ratio=0.5):
+        job_id = str(uuid.uuid4())
+        future = self._executor.submit(
+            self.compressor.automatic_compression,
+            input_model_path=input_model_path,
+            output_dir=output_dir,
+            input_shapes=input_shapes,
+            compression_ratio=compression_ratio
+        )
+        with self._lock:
+            self._jobs[job_id] = {'future': future, 'cancelled': False}
+        return job_id
+
+    def get_compression_status(self, job_id):
+        with self._lock:
+            job = self._jobs[job_id]
+        future = job['future']
+        status = {'job_id': job_id, 'compressed_model_path': None, 'error': None, 'error_type': None}
+        if job['cancelled']:
+            status['status'] = 'cancelled'
+        elif not future.done():
+            status['status'] = 'in_progress' if future.running() else 'queued'
+        elif future.exception() is not None:
+            error = future.exception()
+            status.update(status='failed', error=str(error), error_type=type(error).__name__)
+        else:
+            # SDK는 실패해도 예외 대신 status='error'/'stopped' metadata를 반환
+            result = future.result()
+            error = compression_error(result)
+            if error is not None:
+                status.update(status='failed', error=error[0], error_type=error[1])
+            else:
+                status.update(status='completed', compressed_model_path=result.compressed_model_path)
+        return status
+
+    def cancel_compression(self, job_id):
+        with self._lock:
+            job = self._jobs[job_id]
+            if job['cancelled'] or job['future'].done():
+                return False
+            job['cancelled'] = True
+        job['future'].cancel()
+        return True
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def as_async_backend(compressor, max_workers=4):
+    """비동기 작업 API가 있으면 그대로, 없으면 ExecutorBackend로 감싸 반환"""
+    if hasattr(compressor, 'submit_compression') and hasattr(compressor, 'get_compression_status'):
+        return compressor
+    return ExecutorBackend(compressor, max_workers=max_workers)
+
+
+class CompressionJob:
+    """submit()이 반환하는 작업 핸들"""
+
+    def __init__(self, client, job_id, model_path, output_dir):
+        self.client = client
+        self.job_id = job_id
+        self.model_path = model_path
+        self.output_dir = output_dir
+        self.status = 'submitted'
+        self.polls = 0
+        self.submitted_at = time.perf_counter()
+        self._future = asyncio.get_running_loop().create_future()
+        self._task = None
+
+    def done(self):
+        return self._future.done()
+
+    async def result(self, timeout=None):
+        """
+        작업 결과 dict를 기다림 (NetsPresssoQAClient.compress 결과와 같은 형식에 job_id, polls 추가)
+
+        timeout(초)이 지나면 asyncio.TimeoutError를 내지만 작업 자체는 계속 진행됨
+        (작업 시간 제한은 submit(timeout=...)으로 지정)
+        """
+        return await asyncio.wait_for(asyncio.shield(self._future), timeout)
+
+    def cancel(self):
+        """작업 취소. 이미 끝났으면 False"""
+        if self._future.done():
+            return False
+        try:
+            self.client.backend.cancel_compression(self.job_id)
+        except KeyError:
+            pass
+        self._finish({'success': False, 'status': 'cancelled', 'error': "사용자가 작업을 취소함",
+                      'error_type': 'CancelledError'})
+        if self._task is not None:
+            self._task.cancel()
+        return True
+
+    def _finish(self, result):
+        if self._future.done():
+            return
+        self.status = result['status']
+        result.setdefault('compressed_path', None)
+        result.update(job_id=self.job_id, model_path=self.model_path, polls=self.polls,
+                      duration=time.perf_counter() - self.submitted_at)
+        self._future.set_result(result)
+
+
+class AsyncCompressionClient:
+    """
+    asyncio 압축 클라이언트
+
+    Args:
+        compressor: 비동기 작업 API backend 또는 블로킹 compressor. None이면 NetsPresssoQAClient와 같은 방식으로 생성
+            (NETSPRESSO_FAKE_BACKEND=1 이면 오프라인 대역)
+        poll_interval (float): 첫 상태 조회 간격(초)
+        max_poll_interval (float): 조회 간격 상한(초)
+        backoff (float): 상태가 바뀌지 않을 때마다 간격에 곱하는 배수 (상태가 바뀌면 poll_interval로 복귀)
+        jitter (float): 간격에 더하는 0~jitter 비율의 난수 (여러 작업의 조회가 한꺼번에 몰리지 않게)
+        max_poll_errors (int): 상태 조회가 연속으로 이만큼 실패하면 작업 실패로 처리
+        max_in_flight (int): 동시에 진행할 최대 작업 수. 초과하면 submit()이 자리가 날 때까지 대기
+        timeout (float): 작업 기본 시간 제한(초). 초과하면 backend 작업을 취소하고 status='timeout'
+        precheck (bool): 제출 전에 로컬 호환성 검사 (스레드에서 실행)
+    """
+
+    def __init__(self, compressor=None, poll_interval=0.05, max_poll_interval=5.0, backoff=1.5, jitter=0.1,
+                 max_poll_errors=3, max_in_flight=None, timeout=None, precheck=True, max_workers=4):
+        if compressor is None:
+            from netspresso_client import NetsPresssoQAClient
+            compressor = NetsPresssoQAClient(use_cache=False, precheck=False).compressor
+        self.backend = as_async_backend(compressor, max_workers=max_workers)
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.max_poll_errors = max_poll_errors
+        self.timeout = timeout
+        self.precheck = precheck
+        self._in_flight = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._random = random.Random()
+
+    async def submit(self, model_path, output_dir, input_shapes=None, compression_ratio=DEFAULT_COMPRESSION_RATIO,
+                     timeout=None):
+        """작업을 제출하고 CompressionJob 반환 (상태 조회는 백그라운드 task에서 진행)"""
+        input_shapes = input_shapes or DEFAULT_INPUT_SHAPES
+        if self._in_flight is not None:
+            await self._in_flight.acquire()
+        try:
+            job = await self._submit(model_path, output_dir, input_shapes, compression_ratio)
+        except BaseException:
+            if self._in_flight is not None:
+                self._in_flight.release()
+            raise
+
+        if self._in_flight is not None:
+            job._future.add_done_callback(lambda _: self._in_flight.release())
+        if not job.done():
+            job._task = asyncio.ensure_future(self._poll(job, timeout if timeout is not None else self.timeout))
+        return job
+
+    async def compress(self, model_path, output_dir, input_shapes=None, compression_ratio=DEFAULT_COMPRESSION_RATIO,
+                       timeout=None):
+        """submit 후 결과까지 기다림"""
+        job = await self.submit(model_path, output_dir, input_shapes, compression_ratio, timeout=timeout)
+        return await job.result()
+
+    async def compress_many(self, jobs):
+        """
+        여러 작업을 모두 제출하고 끝나는 순서대로 결과를 yield
+
+        Args:
+            jobs (list): compress()의 인자 dict 목록
+        """
+        jobs = list(jobs)
+        handles = []
+        for index, job in enumerate(jobs):
+            handle = await self.submit(**job)
+            handle.index = index
+            handles.append(handle)
+        pending = {asyncio.ensure_future(handle.result()): handle for handle in handles}
+        while pending:
+            finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                result['job_index'] = pending.pop(future).index
+                yield result
+
+    async def _submit(self, model_path, output_dir, input_shapes, compression_ratio):
+        job = None
+        try:
+            if self.precheck:
+                from precheck import precheck_model
+                precheck = await asyncio.to_thread(precheck_model, model_path, input_shapes)
+                if not precheck['compatible']:
+                    job = CompressionJob(self, None, model_path, output_dir)
+                    job._finish({'success': False, 'status': 'precheck_failed', 'error': precheck['reason'],
+                                 'error_type': 'PrecheckError', 'precheck': precheck})
+                    return job
+            job_id = self.backend.submit_compression(
+                input_model_path=model_path,
+                output_dir=output_dir,
+                input_shapes=input_shapes,
+                compression_ratio=compression_ratio
+            )
+            return CompressionJob(self, job_id, model_path, output_dir)
+        except Exception as e:
+            job = job or CompressionJob(self, None, model_path, output_dir)
+            job._finish({'success': False, 'status': 'error', 'error': str(e), 'error_type': type(e).__name__})
+            return job
+
+    async def _poll(self, job, timeout):
+        """적응형 backoff 상태 조회 루프"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        interval = self.poll_interval
+        errors = 0
+        try:
+            while not job.done():
+                try:
+                    status = self.backend.get_compression_status(job.job_id)
+                    errors = 0
+                except Exception as e:
+                    errors += 1
+                    if errors >= self.max_poll_errors:
+                        job._finish({'success': False, 'status': 'error', 'error': str(e),
+                                     'error_type': type(e).__name__})
+                        return
+                    status = {'status': job.status}
+                job.polls += 1
+
+                if status['status'] in TERMINAL_STATUSES:
+                    job._finish({
+                        'success': status['status'] == 'completed',
+                        'status': status['status'],
+                        'compressed_path': status.get('compressed_model_path'),
+                        'error': status.get('error'),
+                        'error_type': status.get('error_type')
+                    })
+                    return
+
+                if status['status'] != job.status:
+                    # 진행 중이면 짧게, 같은 상태가 이어지면 점점 길게
+                    job.status = status['status']
+                    interval = self.poll_interval
+                else:
+                    interval = min(interval * self.backoff, self.max_poll_interval)
+                delay = interval * (1 + self._random.uniform(0, self.jitter))
+                # backend가 다음 상태 변화 시각을 알려주면 그보다 오래 기다리지 않음
+                if status.get('retry_after') is not None:
+                    delay = min(delay, max(status['retry_after'], 0.001))
+
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        try:
+                            self.backend.cancel_compression(job.job_id)
+                        except KeyError:
+                            pass
+                        job._finish({'success': False, 'status': 'timeout',
+                                     'error': f"작업 시간 제한 {timeout}초 초과 (마지막 상태: {job.status})",
+                                     'error_type': 'TimeoutError'})
+                        return
+                    delay = min(delay, remaining)
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # job.cancel()로 취소된 경우 결과는 이미 기록됨
+            if not job.done():
+                raise
@@ -0,0 +1,120 @@
+"""
+원본/압축 모델 추론 지연 시간 벤치마크
+배치 크기와 torch 스레드 수를 바꿔가며 p50/p90/p99 지연 시간, 처리량, 속도 향상 비율을 측정
+"""
+
+import time
+from datetime import datetime
+
+import torch
+
+from model_tests import load_fx_model
+from utils import save_test_result
+
+DEFAULT_SAMPLE_SHAPE = (3, 224, 224)
+
+
+def percentile(sorted_values, q):
+    """정렬된 값 목록의 q 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def time_model(model, example_input, warmup=5, iterations=50):
+    """
+    warmup 후 iterations회 실행한 각 추론 시간(초)을 정렬해 반환
+
+    eval()은 한 번만 호출하고 측정 구간에는 순수한 forward 호출만 넣음
+    (run_fx_model의 eval() / FX_LOCK은 호출마다 오버헤드가 붙고 스레드 간 측정을 직렬화함)
+    """
+    model.eval()
+    timings = []
+    with torch.no_grad():
+        for _ in range(warmup):
+            model(example_input)
+        for _ in range(iterations):
+            start = time.perf_counter()
+            model(example_input)
+            timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings
+
+
+def benchmark_model(model, sample_shape=DEFAULT_SAMPLE_SHAPE, batch_sizes=(1, 8), num_threads=(1, 4),
+                    warmup=5, iterations=50, seed=0):
+    """
+    배치 크기 x 스레드 수 조합별 지연 시간 측정
+
+    Returns:
+        list: batch_size, num_threads, p50/p90/p99/mean(초), throughput(samples/s) 행 목록
+    """
+    original_threads = torch.get_num_threads()
+    generator = torch.Generator().manual_seed(seed)
+    rows = []
+    try:
+        for threads in num_threads:
+            torch.set_num_threads(threads)
+            for batch_size in batch_sizes:
+                example_input = torch.randn(batch_size, *sample_shape, generator=generator)
+                timings = time_model(model, example_input, warmup=warmup, iterations=iterations)
+                mean = sum(timings) / len(timings)
+                rows.append({
+                    'batch_size': batch_size,
+                    'num_threads': threads,
+                    'p50': percentile(timings, 50),
+                    'p90': percentile(timings, 90),
+                    'p99': percentile(timings, 99),
+                    'mean': mean,
+                    'throughput': batch_size / mean if mean > 0 else 0.0
+                })
+    finally:
+        torch.set_num_threads(original_threads)
+    return rows
+
+
+def compare_models(original_path, compressed_path, sample_shape=DEFAULT_SAMPLE_SHAPE, batch_sizes=(1, 8),
+                   num_threads=(1, 4), warmup=5, iterations=50):
+    """
+    원본과 압축 모델을 같은 조건으로 벤치마크하고 조합별 속도 향상 비율 계산
+
+    Returns:
+        dict: original/compressed 측정 행, comparison(speedup_p50, speedup_p99, throughput_ratio)
+    """
+    options = dict(sample_shape=sample_shape, batch_sizes=batch_sizes, num_threads=num_threads,
+                   warmup=warmup, iterations=iterations)
+    original_rows = benchmark_model(load_fx_model(original_path), **options)
+    compressed_rows = benchmark_model(load_fx_model(compressed_path), **options)
+
+    comparison = []
+    for before, after in zip(original_rows, compressed_rows):
+        comparison.append({
+            'batch_size': before['batch_size'],
+            'num_threads': before['num_threads'],
+            'original_p50': before['p50'],
+            'compressed_p50': after['p50'],
+            'speedup_p50': before['p50'] / after['p50'] if after['p50'] > 0 else 0.0,
+            'speedup_p99': before['p99'] / after['p99'] if after['p99'] > 0 else 0.0,
+            'throughput_ratio': after['throughput'] / before['throughput'] if before['throughput'] > 0 else 0.0
+        })
+
+    return {
+        'original_path': str(original_path),
+        'compressed_path': str(compressed_path),
+        'sample_shape': list(sample_shape),
+        'warmup': warmup,
+        'iterations': iterations,
+        'original': original_rows,
+        'compressed': compressed_rows,
+        'comparison': comparison,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def save_benchmark_result(benchmark, output_path):
+    """벤치마크 결과를 표준 결과 JSON으로 저장 (generate_qa_report가 벤치마크 섹션으로 표시)"""
+    save_test_result({'success': True, 'benchmark': benchmark}, output_path)
+    return output_path
@@ -0,0 +1,212 @@
+"""
+대용량 모델 파일의 청크 단위 재개 가능 업로드
+파일을 mmap으로 읽어 청크별 해시를 계산하며 전송하고, 실패 시 마지막으로 확인된 청크부터 재개
+"""
+
+import os
+import mmap
+import time
+import hashlib
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB
+
+
+@contextmanager
+def mapped_file(file_path):
+    """파일을 읽기 전용 mmap으로 열어 memoryview 반환 (빈 파일은 빈 memoryview)"""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            yield memoryview(b'')
+            return
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            mapped.close()
+
+
+def combine_digests(chunk_digests):
+    """청크 해시 목록으로 파일 전체 해시 계산 (파일을 다시 읽지 않음)"""
+    digest = hashlib.sha256()
+    for chunk_digest in chunk_digests:
+        digest.update(bytes.fromhex(chunk_digest))
+    return digest.hexdigest()
+
+
+class UploadError(Exception):
+    """재시도 횟수를 넘겨 업로드를 완료하지 못함"""
+
+
+class ChunkedUploader:
+    """
+    청크 업로드 프로토콜(begin_upload / put_chunk / get_status / complete_upload)을
+    구현한 transport로 파일을 전송
+
+    Args:
+        transport: 업로드 대상 (LocalUploadServer 또는 같은 메서드를 가진 객체)
+        chunk_size (int): 청크 크기(bytes)
+        max_retries (int): 청크 전송 실패 시 연속 재시도 횟수
+        retry_backoff (float): 재시도 간 기본 대기 시간(초), 재시도마다 2배
+    """
+
+    def __init__(self, transport, chunk_size=DEFAULT_CHUNK_SIZE, max_retries=5, retry_backoff=0.1):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 0보다 커야 합니다")
+        self.transport = transport
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+    def upload(self, file_path):
+        """
+        파일 업로드. 같은 파일을 다시 올리면 서버가 확인한 청크는 건너뜀
+
+        Returns:
+            dict: upload_id, file_digest, 전송/건너뛴 청크 수, 재시도 횟수, 소요 시간, 처리량
+        """
+        start = time.perf_counter()
+        file_path = Path(file_path)
+        stat = file_path.stat()
+        total_chunks = max(1, -(-stat.st_size // self.chunk_size))
+
+        upload_id = self.transport.begin_upload(
+            name=file_path.name,
+            size=stat.st_size,
+            chunk_size=self.chunk_size,
+            fingerprint=f"{stat.st_size}:{stat.st_mtime_ns}"
+        )
+
+        chunk_digests = [None] * total_chunks
+        sent_chunks = 0
+        sent_bytes = 0
+        retries = 0
+
+        with mapped_file(file_path) as view:
+            status = self.transport.get_status(upload_id)
+            index = status['next_chunk']
+            skipped_chunks = index
+            # 이미 확인된 청크의 해시는 서버 기록을 사용
+            for acked, digest in enumerate(status['digests'][:index]):
+                chunk_digests[acked] = digest
+
+            failures = 0
+            while index < total_chunks:
+                offset = index * self.chunk_size
+                chunk = view[offset:offset + self.chunk_size]
+                try:
+                    digest = chunk_digests[index] or hashlib.sha256(chunk).hexdigest()
+                    chunk_digests[index] = digest
+                    self.transport.put_chunk(upload_id, index, chunk, digest)
+                except (ConnectionError, TimeoutError, OSError) as e:
+                    failures += 1
+                    retries += 1
+                    if failures > self.max_retries:
+                        raise UploadError(f"청크 {index} 전송 실패 ({self.max_retries}회 재시도 초과): {e}") from e
+                    time.sleep(self.retry_backoff * (2 ** (failures - 1)))
+                    # 서버가 마지막으로 확인한 청크부터 재개
+                    index = self.transport.get_status(upload_id)['next_chunk']
+                    continue
+                finally:
+                    chunk.release()
+
+                failures = 0
+                sent_chunks += 1
+                sent_bytes += min(self.chunk_size, stat.st_size - offset)
+                index += 1
+
+        file_digest = combine_digests(chunk_digests)
+        self.transport.complete_upload(upload_id, file_digest)
+        elapsed = time.perf_counter() - start
+        return {
+            'upload_id': upload_id,
+            'file_digest': file_digest,
+            'size': stat.st_size,
+            'total_chunks': total_chunks,
+            'sent_chunks': sent_chunks,
+            'skipped_chunks': skipped_chunks,
+            'sent_bytes': sent_bytes,
+            'retries': retries,
+            'elapsed': elapsed,
+            'throughput': sent_bytes / elapsed if elapsed > 0 else 0.0
+        }
+
+
+class LocalUploadServer:
+    """
+    청크 업로드 프로토콜의 로컬 대역 서버 (벤치마크/재개 테스트용)
+    청크를 받는 즉시 디스크의 해당 오프셋에 기록하므로 서버 측 메모리도 일정함
+
+    Args:
+        storage_dir (str): 업로드 파일을 기록할 디렉토리
+        fail_chunks (iterable): 처음 한 번 ConnectionError를 낼 청크 번호들
+        bandwidth (float): 수신 대역폭(bytes/s). None이면 제한 없음
+    """
+
+    def __init__(self, storage_dir, fail_chunks=(), bandwidth=None):
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.pending_failures = set(fail_chunks)
+        self.bandwidth = bandwidth
+        self.uploads = {}
+        self.received_chunks = 0
+        self._lock = threading.Lock()
+
+    def begin_upload(self, name, size, chunk_size, fingerprint):
+        upload_id = hashlib.sha256(f"{name}:{fingerprint}:{chunk_size}".encode()).hexdigest()[:16]
+        with self._lock:
+            if upload_id not in self.uploads:
+                path = self.storage_dir / f"{upload_id}.part"
+                with open(path, 'wb') as f:
+                    f.truncate(size)
+                self.uploads[upload_id] = {
+                    'name': name,
+                    'path': path,
+                    'size': size,
+                    'chunk_size': chunk_size,
+                    'digests': [],
+                    'completed': False
+                }
+        return upload_id
+
+    def get_status(self, upload_id):
+        upload = self.uploads[upload_id]
+        return {
+            'next_chunk': len(upload['digests']),
+            'digests': list(upload['digests']),
+            'completed': upload['completed']
+        }
+
+    def put_chunk(self, upload_id, index, data, digest):
+        upload = self.uploads[upload_id]
+        if index in self.pending_failures:
+            self.pending_failures.discard(index)
+            raise ConnectionError(f"청크 {index} 수신 중 연결 끊김 (주입된 오류)")
+        if index != len(upload['digests']):
+            raise ValueError(f"순서가 맞지 않는 청크: {index} (기대값 {len(upload['digests'])})")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"청크 {index} 해시 불일치")
+        if self.bandwidth:
+            time.sleep(len(data) / self.bandwidth)
+
+        with open(upload['path'], 'r+b') as f:
+            f.seek(index * upload['chunk_size'])
+            f.write(data)
+        with self._lock:
+            upload['digests'].append(digest)
+            self.received_chunks += 1
+
+    def complete_upload(self, upload_id, file_digest):
+        upload = self.uploads[upload_id]
+        if combine_digests(upload['digests']) != file_digest:
+            raise ValueError("파일 해시 불일치: 업로드가 손상되었습니다")
+        final_path = self.storage_dir / upload['name']
+        os.replace(upload['path'], final_path)
+        upload['path'] = final_path
+        upload['completed'] = True
+        return str(final_path)
@@ -0,0 +1,470 @@
+"""
+프로세스 단위로 재사용하는 NetsPresso 연결 풀 / 인증 토큰 디스크 캐시
+
+NetsPresso(api_key=...)는 생성할 때마다 PyPI 버전 확인 + 로그인 + 사용자 정보 조회를 하고, SDK는 요청마다
+requests.get/post를 바로 호출해 TLS 연결을 새로 맺음. 여기서는
+- keep-alive requests.Session(연결 풀 크기 설정 가능)을 SDK의 HTTP 호출 경로에 연결하고
+- 로그인 토큰을 만료 전까지 디스크(~/.cache/netspresso_qa/auth)에 보관해 다음 프로세스도 재사용하며
+- api_key별 NetsPresso 객체를 프로세스 안에서 한 번만 만들어 공유함
+- 서버가 토큰을 거부(401)하면 캐시된 토큰을 버리고 새 토큰으로 한 번 재시도함
+"""
+
+import os
+import json
+import time
+import base64
+import hashlib
+import tempfile
+import threading
+from importlib import import_module
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TOKEN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'netspresso_qa', 'auth')
+# 만료 직전 토큰으로 요청하다 실패하지 않도록 남은 시간이 이보다 짧으면 새로 발급
+TOKEN_EXPIRY_MARGIN = 60
+# exp가 없는(JWT가 아닌) 토큰의 유효 기간
+DEFAULT_TOKEN_TTL = 3600
+
+# SDK에서 모듈 수준 requests 함수를 직접 호출하는 모듈
+SDK_REQUEST_MODULES = (
+    'netspresso.clients.utils.requester',
+    'netspresso.clients.compressor.v2.main',
+    'netspresso.clients.launcher.v2.implements.model.model',
+)
+
+# 401 응답 재시도 시 다시 보낼 때 유지할 요청 옵션
+SEND_OPTIONS = ('timeout', 'verify', 'stream', 'cert', 'proxies', 'allow_redirects')
+
+_lock = threading.Lock()
+_sessions = {}
+_netspresso_pool = {}
+# get_pooled_netspresso가 만든 PooledAuth (401 응답의 토큰을 발급한 객체를 찾는 데 사용)
+_pooled_auths = []
+
+
+def create_session(pool_size=DEFAULT_POOL_SIZE):
+    """
+    호스트당 keep-alive 연결을 최대 pool_size개 유지하는 requests.Session
+
+    연결이 모두 사용 중이면 새 연결을 만들지 않고 빌 때까지 기다림 (동시 연결 수 상한)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session(pool_size=None):
+    """프로세스 전체에서 공유하는 Session (pool_size 기본값: NETSPRESSO_POOL_SIZE 또는 10)"""
+    pool_size = pool_size or int(os.getenv('NETSPRESSO_POOL_SIZE', DEFAULT_POOL_SIZE))
+    with _lock:
+        session = _sessions.get(pool_size)
+        if session is None:
+            session = _sessions[pool_size] = create_session(pool_size)
+        return session
+
+
+class SessionRequests:
+    """
+    requests 모듈 대역: get/post/put/patch/delete/request를 공유 Session으로 보냄
+
+    응답이 401이고 Bearer 토큰을 auths 중 하나가 발급했으면 그 토큰을 무효화하고 새 토큰으로 한 번 재시도.
+    그 밖의 속성(exceptions, Response 등)은 실제 requests 모듈의 것을 그대로 돌려줌
+    """
+
+    def __init__(self, session, auths=()):
+        self.session = session
+        self.auths = auths
+
+    def request(self, method, url, **kwargs):
+        response = self.session.request(method, url, **kwargs)
+        if response.status_code != 401:
+            return response
+
+        access_token = response.request.headers.get('Authorization', '')[len('Bearer '):]
+        auth = next((auth for auth in list(self.auths) if access_token and auth.issued(access_token)), None)
+        if auth is None:
+            return response
+        auth.invalidate(access_token)
+        try:
+            tokens = auth.tokens()
+        except requests.RequestException:
+            return response
+        # 준비된 요청을 복사해 보내므로 파일 업로드 본문도 그대로 다시 보냄
+        retry = response.request.copy()
+        retry.headers['Authorization'] = f"Bearer {tokens['access_token']}"
+        return self.session.send(retry, **{name: kwargs[name] for name in SEND_OPTIONS if name in kwargs})
+
+    def get(self, url, params=None, **kwargs):
+        return self.request('GET', url, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url, data=data, **kwargs)
+
+    def patch(self, url, data=None, **kwargs):
+        return self.request('PATCH', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def install_session(session, module_names=SDK_REQUEST_MODULES, auths=()):
+    """
+    SDK 모듈의 requests 참조를 session으로 바꿔 모든 SDK 요청이 연결 풀을 쓰게 함
+
+    auths(PooledAuth 목록)가 발급한 토큰이 401로 거부되면 재발급 후 한 번 재시도
+
+    Returns:
+        list: 바꾼 모듈 이름 (설치되지 않은 모듈은 건너뜀)
+    """
+    installed = []
+    for module_name in module_names:
+        try:
+            module = import_module(module_name)
+        except ImportError:
+            continue
+        if hasattr(module, 'requests'):
+            module.requests = SessionRequests(session, auths)
+            installed.append(module_name)
+    return installed
+
+
+def token_expiry(token):
+    """JWT payload의 exp(epoch 초). JWT가 아니거나 exp가 없으면 None (서명은 검증하지 않음)"""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, AttributeError, TypeError):
+        return None
+
+
+class TokenCache:
+    """
+    (api_key, 서버) 단위 토큰 디스크 캐시
+
+    파일 이름에는 api_key 해시만 쓰고, 파일은 소유자만 읽을 수 있게(0600) 임시 파일에 쓴 뒤 교체
+    """
+
+    def __init__(self, cache_dir=None, margin=TOKEN_EXPIRY_MARGIN):
+        self.cache_dir = Path(cache_dir or os.getenv('NETSPRESSO_TOKEN_CACHE_DIR', DEFAULT_TOKEN_CACHE_DIR))
+        self.margin = margin
+
+    def path(self, api_key, server):
+        digest = hashlib.sha256(f"{server}\0{api_key}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest[:32]}.json"
+
+    def load(self, api_key, server):
+        """저장된 토큰 dict(access_token, refresh_token, expires_at). 만료 여부와 무관, 없으면 None"""
+        try:
+            with open(self.path(api_key, server), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_valid(self, tokens):
+        """만료까지 margin초 이상 남았는지"""
+        return bool(tokens) and tokens.get('expires_at', 0) - self.margin > time.time()
+
+    def get(self, api_key, server):
+        """유효한 토큰 dict. 없거나 곧 만료되면 None"""
+        tokens = self.load(api_key, server)
+        return tokens if self.is_valid(tokens) else None
+
+    def put(self, api_key, server, access_token, refresh_token=None):
+        """토큰 저장 후 저장한 dict 반환"""
+        expires_at = token_expiry(access_token) or time.time() + DEFAULT_TOKEN_TTL
+        tokens = {'access_token': access_token, 'refresh_token': refresh_token, 'expires_at': expires_at}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(tokens, f)
+            os.replace(tmp_path, self.path(api_key, server))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return tokens
+
+    def clear(self, api_key, server):
+        try:
+            os.remove(self.path(api_key, server))
+        except FileNotFoundError:
+            pass
+
+
+class PooledAuth:
+    """
+    NetsPresso 인증 서버(SDK와 같은 /auth/login_by_api_key, /auth/login_by_refresh_token)에 대한 토큰 관리
+
+    Args:
+        base_url (str): 인증 API 기준 URL (예: https://v2-prod.netspresso.ai:43001/api/v3)
+        session (requests.Session): 공유 Session (기본값: get_session())
+        token_cache (TokenCache): 디스크 캐시 (None이면 기본 위치)
+    """
+
+    def __init__(self, base_url, api_key, session=None, token_cache=None, verify_ssl=True, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.session = session or get_session()
+        self.token_cache = token_cache or TokenCache()
+        self.verify_ssl = verify_ssl
+        self.timeout = timeout
+        self.logins = 0
+        self._tokens = None
+        self._issued = set()
+        self._lock = threading.Lock()
+
+    def tokens(self):
+        """유효한 토큰 dict. 메모리 → 디스크 캐시 → 갱신(refresh) → 로그인 순으로 시도"""
+        with self._lock:
+            if self._tokens is None:
+                self._tokens = self.token_cache.load(self.api_key, self.base_url)
+            if not self.token_cache.is_valid(self._tokens):
+                self._tokens = self._reissue()
+            self._issued.add(self._tokens['access_token'])
+            return self._tokens
+
+    def issued(self, access_token):
+        """access_token을 이 객체가 돌려준 적이 있는지"""
+        with self._lock:
+            return access_token in self._issued
+
+    def invalidate(self, access_token=None):
+        """
+        서버가 토큰을 거부했을 때 호출. 메모리/디스크 캐시를 지움
+
+        access_token을 주면 현재 토큰이 그 토큰일 때만 지움 (다른 스레드가 이미 재발급했으면 그대로 둠)
+        """
+        with self._lock:
+            if access_token is not None and (self._tokens or {}).get('access_token') != access_token:
+                return
+            self._tokens = None
+            self.token_cache.clear(self.api_key, self.base_url)
+
+    def _reissue(self):
+        refresh_token = (self._tokens or {}).get('refresh_token')
+        if refresh_token:
+            try:
+                return self._store(self._post('/auth/login_by_refresh_token', json={'refresh_token': refresh_token}))
+            except requests.RequestException:
+                pass
+        self.logins += 1
+        return self._store(self._post('/auth/login_by_api_key', headers={'api-key': self.api_key}))
+
+    def _post(self, path, **kwargs):
+        response = self.session.post(f"{self.base_url}{path}", verify=self.verify_ssl, timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        body = response.json()
+        # SDK 응답은 data 아래에 토큰이 있음
+        return body.get('data', body)
+
+    def _store(self, tokens):
+        return self.token_cache.put(self.api_key, self.base_url, tokens['access_token'], tokens.get('refresh_token'))
+
+
+def get_pooled_netspresso(api_key, verify_ssl=True, pool_size=None, token_cache=None):
+    """
+    api_key별로 프로세스에서 한 번만 만드는 NetsPresso 객체
+
+    공유 Session을 SDK에 연결하고, SDK 생성자의 버전 확인 / 로그인 / 사용자 정보 조회를 건너뜀.
+    토큰은 SDK가 요청 전에 부르는 validate_token에서 PooledAuth(디스크 캐시)로 처음 받아오므로 생성 시 네트워크 요청이
+    없음. 만료가 가까우면 재발급해 디스크 캐시도 갱신하고, 서버가 401을 돌려주면 무효화 후 한 번 재시도
+    """
+    key = (api_key, verify_ssl)
+    with _lock:
+        netspresso = _netspresso_pool.get(key)
+    if netspresso is not None:
+        return netspresso
+
+    from netspresso import NetsPresso
+    from netspresso.clients.auth import auth_client
+    from netspresso.clients.auth.client import TokenHandler
+    from netspresso.clients.auth.response_body import TokenResponse
+
+    session = get_session(pool_size)
+    auth = PooledAuth(auth_client.api_client.base_url, api_key, session=session, token_cache=token_cache,
+                      verify_ssl=verify_ssl)
+    with _lock:
+        _pooled_auths.append(auth)
+    install_session(session, auths=_pooled_auths)
+
+    token_handler = TokenHandler.__new__(TokenHandler)
+    token_handler.api_key = api_key
+    token_handler.email = token_handler.password = None
+    token_handler.verify_ssl = verify_ssl
+    # 첫 validate_token 전까지는 비어 있음
+    token_handler.tokens = None
+
+    def validate_token():
+        tokens = auth.tokens()
+        token_handler.tokens = TokenResponse(access_token=tokens['access_token'], refresh_token=tokens['refresh_token'])
+
+    token_handler.validate_token = validate_token
+
+    netspresso = NetsPresso.__new__(NetsPresso)
+    netspresso.dev_mode = True
+    netspresso.token_handler = token_handler
+    netspresso.user_info = None
+    netspresso.auth = auth
+
+    with _lock:
+        return _netspresso_pool.setdefault(key, netspresso)
+
+
+def reset_pool():
+    """공유 Session / NetsPresso 객체를 모두 닫고 비움 (테스트용)"""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _netspresso_pool.clear()
+        _pooled_auths.clear()
+
+
+def make_test_token(ttl=3600, subject="qa"):
+    """서명 없는 JWT 형식 토큰 (로컬 대역 서버용)"""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode('utf-8')).rstrip(b'=').decode('ascii')
+    payload = {'sub': subject, 'exp': int(time.time() + ttl), 'jti': os.urandom(8).hex()}
+    signature = base64.urlsafe_b64encode(b"unsigned").rstrip(b'=').decode('ascii')
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(payload)}.{signature}"
+
+
+class LocalAuthServer:
+    """
+    NetsPresso 인증 API의 로컬 대역 HTTP 서버 (연결 재사용 / 토큰 캐시 검증용)
+
+    HTTP/1.1 keep-alive로 동작하며 로그인 / 토큰 갱신 / 요청 / TCP 연결 수를 셈.
+    GET /ping?delay=초 는 지연 후 200을, GET /protected 는 발급한 토큰이면 200 아니면 401을 돌려줌
+    (revoke_tokens()로 발급한 토큰을 모두 무효화)
+
+    Args:
+        api_key (str): 허용할 api_key
+        token_ttl (float): 발급 토큰의 유효 기간(초)
+    """
+
+    def __init__(self, api_key="test-api-key", token_ttl=3600, prefix="/api/v3"):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import parse_qs, urlparse
+
+        self.api_key = api_key
+        self.token_ttl = token_ttl
+        self.prefix = prefix
+        self.stats = {'connections': 0, 'requests': 0, 'logins': 0, 'refreshes': 0, 'unauthorized': 0}
+        self.issued_tokens = set()
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # 헤더와 본문을 한 번에 보내 지연 ACK로 요청마다 수십 ms씩 늘어나지 않게 함
+            wbufsize = -1
+
+            def setup(self):
+                super().setup()
+                server._count('connections')
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status, body):
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _tokens(self):
+                access_token = make_test_token(server.token_ttl)
+                with server._lock:
+                    server.issued_tokens.add(access_token)
+                return {'data': {'access_token': access_token,
+                                 'refresh_token': make_test_token(server.token_ttl * 10)}}
+
+            def do_POST(self):
+                server._count('requests')
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                path = urlparse(self.path).path
+                if path == f"{server.prefix}/auth/login_by_api_key":
+                    if self.headers.get('api-key') != server.api_key:
+                        return self._send_json(401, {'detail': "invalid api key"})
+                    server._count('logins')
+                    return self._send_json(200, self._tokens())
+                if path == f"{server.prefix}/auth/login_by_refresh_token":
+                    if not json.loads(body or b'{}').get('refresh_token'):
+                        return self._send_json(401, {'detail': "missing refresh token"})
+                    server._count('refreshes')
+                    return self._send_json(200, self._tokens())
+                self._send_json(404, {'detail': "not found"})
+
+            def do_GET(self):
+                server._count('requests')
+                url = urlparse(self.path)
+                if url.path == '/ping':
+                    delay = float(parse_qs(url.query).get('delay', ['0'])[0])
+                    if delay:
+                        time.sleep(delay)
+                    return self._send_json(200, {'ok': True})
+                if url.path == '/protected':
+                    access_token = self.headers.get('Authorization', '')[len('Bearer '):]
+                    with server._lock:
+                        valid = access_token in server.issued_tokens
+                    if not valid:
+                        server._count('unauthorized')
+                        return self._send_json(401, {'detail': "invalid token"})
+                    return self._send_json(200, {'ok': True})
+                self._send_json(404, {'detail': "not found"})
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def auth_url(self):
+        return f"{self.url}{self.prefix}"
+
+    def revoke_tokens(self):
+        """발급한 access 토큰을 모두 무효화 (서버 측 토큰 폐기 흉내)"""
+        with self._lock:
+            self.issued_tokens.clear()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.05},
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
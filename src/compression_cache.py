@@ -0,0 +1,168 @@
+"""
+압축 결과 로컬 캐시
+모델 파일 해시 + input_shapes + compression_ratio를 키로 압축 산출물을 디스크에 보관
+
+같은 캐시 폴더를 여러 프로세스(pytest-xdist 워커 등)가 함께 쓰므로 인덱스를 바꿀 때는 파일 잠금을 잡고
+디스크의 최신 인덱스를 다시 읽은 뒤 변경분만 반영해 저장 (다른 프로세스가 추가/삭제한 항목을 덮어쓰지 않음)
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from utils import file_lock, hash_file
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'netspresso_qa', 'compression')
+DEFAULT_MAX_SIZE = 2 * 1024 ** 3  # 2GB
+INDEX_FILE = 'index.json'
+LOCK_FILE = 'index.lock'
+
+
+class CompressionCache:
+    """automatic_compression 결과를 보관하는 크기 제한 LRU 캐시"""
+
+    def __init__(self, cache_dir=None, max_size_bytes=DEFAULT_MAX_SIZE):
+        self.cache_dir = Path(cache_dir or os.getenv('NETSPRESSO_CACHE_DIR', DEFAULT_CACHE_DIR))
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index = self._load_index()
+
+    def make_key(self, model_path, input_shapes, compression_ratio, backend=None):
+        """
+        모델 내용과 압축 설정으로 캐시 키 생성
+
+        backend를 주면 키에 포함 (로컬 압축 결과가 원격 서비스 결과 자리에 적중하지 않도록)
+        """
+        settings = {'input_shapes': input_shapes, 'compression_ratio': compression_ratio}
+        if backend is not None:
+            settings['backend'] = backend
+        settings = json.dumps(settings, sort_keys=True)
+        digest = hashlib.sha256()
+        digest.update(hash_file(model_path).encode())
+        digest.update(settings.encode())
+        return digest.hexdigest()
+
+    def get(self, key, output_dir):
+        """
+        캐시 적중 시 저장된 산출물을 output_dir로 복사하고 결과 dict 반환
+
+        Returns:
+            dict or None: 캐시된 압축 결과 (적중하지 않으면 None)
+        """
+        with self._locked_index():
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+
+            entry_dir = self.cache_dir / key
+            if not entry_dir.exists():
+                # 인덱스만 남은 경우 정리
+                del self._index[key]
+                self._save_index()
+                return None
+
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            for item in entry_dir.iterdir():
+                shutil.copy2(item, output_path / item.name)
+
+            entry['last_access'] = time.time()
+            entry['hits'] = entry.get('hits', 0) + 1
+            self._save_index()
+
+        result = dict(entry['result'])
+        result['compressed_path'] = str(output_path / entry['compressed_file'])
+        metadata_path = output_path / 'metadata.json'
+        if metadata_path.exists():
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                result['metadata'] = json.load(f)
+        result['cached'] = True
+        return result
+
+    def put(self, key, result):
+        """성공한 압축 결과의 산출물(압축 모델 + metadata.json)을 캐시에 저장"""
+        compressed_path = result.get('compressed_path')
+        if not result.get('success') or not compressed_path or not os.path.exists(compressed_path):
+            return False
+
+        compressed_path = Path(compressed_path)
+        entry_dir = self.cache_dir / key
+        tmp_dir = self.cache_dir / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(compressed_path, tmp_dir / compressed_path.name)
+        metadata_path = compressed_path.parent / 'metadata.json'
+        if metadata_path.exists():
+            shutil.copy2(metadata_path, tmp_dir / 'metadata.json')
+        size = sum(f.stat().st_size for f in tmp_dir.iterdir())
+
+        with self._locked_index():
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir)
+            os.replace(tmp_dir, entry_dir)
+            self._index[key] = {
+                'compressed_file': compressed_path.name,
+                'size': size,
+                'last_access': time.time(),
+                'hits': 0,
+                'result': {
+                    'success': True,
+                    'status': str(result.get('status')),
+                    'error': None
+                }
+            }
+            self._evict()
+            self._save_index()
+        return True
+
+    def total_size(self):
+        """캐시가 차지하는 전체 바이트 수"""
+        return sum(entry['size'] for entry in self._index.values())
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._locked_index():
+            for key in list(self._index):
+                shutil.rmtree(self.cache_dir / key, ignore_errors=True)
+            self._index = {}
+            self._save_index()
+
+    def _evict(self):
+        """최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 삭제"""
+        total = self.total_size()
+        for key in sorted(self._index, key=lambda k: self._index[k]['last_access']):
+            if total <= self.max_size_bytes:
+                break
+            total -= self._index[key]['size']
+            shutil.rmtree(self.cache_dir / key, ignore_errors=True)
+            del self._index[key]
+
+    @contextmanager
+    def _locked_index(self):
+        """스레드 잠금 + 파일 잠금을 잡고 디스크의 최신 인덱스를 다시 읽음 (블록 안에서 바꾼 뒤 _save_index 호출)"""
+        with self._lock, file_lock(str(self.cache_dir / LOCK_FILE)):
+            self._index = self._load_index()
+            yield
+
+    def _load_index(self):
+        index_path = self.cache_dir / INDEX_FILE
+        if not index_path.exists():
+            return {}
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self):
+        """_locked_index 안에서만 호출"""
+        index_path = self.cache_dir / INDEX_FILE
+        tmp_path = index_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, index_path)
@@ -0,0 +1,162 @@
+"""
+압축 모델의 배치 단위 수치 동등성 검증
+대량의 입력을 고정 크기 청크로 두 모델에 통과시키며 오차 지표를 누적 집계 (메모리 사용량 일정)
+"""
+
+import time
+from datetime import datetime
+
+import torch
+import torch.nn.functional as F
+
+from model_tests import load_fx_model
+from utils import save_test_result
+
+DEFAULT_SAMPLE_SHAPE = (3, 224, 224)
+DEFAULT_TOLERANCES = {
+    'max_abs_error': 1e-3,
+    'mean_abs_error': 1e-4,
+    'min_cosine_similarity': 0.99,
+    'min_topk_agreement': 0.99
+}
+
+
+class RunningEquivalenceStats:
+    """청크별 출력 비교 결과를 누적하는 집계기"""
+
+    def __init__(self, top_k=1):
+        self.top_k = top_k
+        self.samples = 0
+        self.elements = 0
+        self.max_abs_error = 0.0
+        self.sum_abs_error = 0.0
+        self.sum_cosine = 0.0
+        self.min_cosine = 1.0
+        self.topk_matches = 0.0
+
+    def update(self, expected, actual):
+        """한 청크의 (N, ...) 출력 쌍을 반영"""
+        expected = expected.reshape(expected.shape[0], -1).double()
+        actual = actual.reshape(actual.shape[0], -1).double()
+        abs_error = (expected - actual).abs()
+
+        self.samples += expected.shape[0]
+        self.elements += abs_error.numel()
+        self.max_abs_error = max(self.max_abs_error, abs_error.max().item())
+        self.sum_abs_error += abs_error.sum().item()
+
+        cosine = F.cosine_similarity(expected, actual, dim=1)
+        self.sum_cosine += cosine.sum().item()
+        self.min_cosine = min(self.min_cosine, cosine.min().item())
+
+        k = min(self.top_k, expected.shape[1])
+        expected_topk = expected.topk(k, dim=1).indices
+        actual_topk = actual.topk(k, dim=1).indices
+        # 샘플별로 top-k 집합이 겹치는 비율
+        overlap = (expected_topk.unsqueeze(2) == actual_topk.unsqueeze(1)).any(dim=2).sum(dim=1)
+        self.topk_matches += (overlap.double() / k).sum().item()
+
+    def summary(self):
+        samples = max(self.samples, 1)
+        return {
+            'samples': self.samples,
+            'max_abs_error': self.max_abs_error,
+            'mean_abs_error': self.sum_abs_error / max(self.elements, 1),
+            'mean_cosine_similarity': self.sum_cosine / samples,
+            'min_cosine_similarity': self.min_cosine,
+            'topk_agreement': self.topk_matches / samples,
+            'top_k': self.top_k
+        }
+
+
+def _check_tolerances(summary, tolerances):
+    violations = []
+    if summary['max_abs_error'] > tolerances['max_abs_error']:
+        violations.append(f"max_abs_error {summary['max_abs_error']:.3e} > {tolerances['max_abs_error']:.3e}")
+    if summary['mean_abs_error'] > tolerances['mean_abs_error']:
+        violations.append(f"mean_abs_error {summary['mean_abs_error']:.3e} > {tolerances['mean_abs_error']:.3e}")
+    if summary['min_cosine_similarity'] < tolerances['min_cosine_similarity']:
+        violations.append(f"min_cosine_similarity {summary['min_cosine_similarity']:.6f} "
+                          f"< {tolerances['min_cosine_similarity']}")
+    if summary['topk_agreement'] < tolerances['min_topk_agreement']:
+        violations.append(f"top-{summary['top_k']} agreement {summary['topk_agreement']:.4f} "
+                          f"< {tolerances['min_topk_agreement']}")
+    return violations
+
+
+def random_input_chunks(num_samples, chunk_size, sample_shape=DEFAULT_SAMPLE_SHAPE, seed=0):
+    """고정 시드로 (chunk_size, *sample_shape) 입력 청크를 하나씩 생성"""
+    generator = torch.Generator().manual_seed(seed)
+    remaining = num_samples
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        yield torch.randn(size, *sample_shape, generator=generator)
+        remaining -= size
+
+
+def verify_numerical_equivalence(original, compressed, num_samples=4096, chunk_size=256,
+                                 sample_shape=DEFAULT_SAMPLE_SHAPE, top_k=1, tolerances=None,
+                                 inputs=None, seed=0):
+    """
+    두 모델의 출력 편차를 대량 입력으로 검증
+
+    Args:
+        original, compressed: 비교할 모델 (nn.Module / GraphModule)
+        num_samples (int): 생성할 랜덤 입력 수 (inputs를 넘기면 무시)
+        chunk_size (int): 한 번에 통과시킬 배치 크기
+        top_k (int): top-k 일치율 계산 시 k
+        tolerances (dict): DEFAULT_TOLERANCES 중 덮어쓸 값
+        inputs (iterable): 직접 준비한 (N, ...) 입력 텐서 청크들
+
+    Returns:
+        dict: passed, violations, 오차 지표, elapsed
+    """
+    start = time.perf_counter()
+    tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+    chunks = inputs if inputs is not None else random_input_chunks(num_samples, chunk_size, sample_shape, seed)
+    stats = RunningEquivalenceStats(top_k=top_k)
+
+    original.eval()
+    compressed.eval()
+    with torch.no_grad():
+        for chunk in chunks:
+            expected = original(chunk)
+            actual = compressed(chunk)
+            if expected.shape != actual.shape:
+                summary = stats.summary()
+                summary.update({
+                    'passed': False,
+                    'violations': [f"출력 형태 불일치: {tuple(expected.shape)} vs {tuple(actual.shape)}"],
+                    'tolerances': tolerances,
+                    'elapsed': time.perf_counter() - start
+                })
+                return summary
+            stats.update(expected, actual)
+
+    summary = stats.summary()
+    violations = _check_tolerances(summary, tolerances)
+    summary.update({
+        'passed': not violations,
+        'violations': violations,
+        'tolerances': tolerances,
+        'elapsed': time.perf_counter() - start,
+        'timestamp': datetime.now().isoformat()
+    })
+    return summary
+
+
+def verify_model_files(original_path, compressed_path, **options):
+    """저장된 두 모델 파일을 로드해 verify_numerical_equivalence 실행"""
+    result = verify_numerical_equivalence(load_fx_model(original_path), load_fx_model(compressed_path), **options)
+    result['original_path'] = str(original_path)
+    result['compressed_path'] = str(compressed_path)
+    return result
+
+
+def save_equivalence_result(equivalence, output_path):
+    """검증 결과를 표준 결과 JSON으로 저장 (허용 오차 초과 시 실패로 기록)"""
+    result = {'success': equivalence['passed'], 'equivalence': equivalence}
+    if not equivalence['passed']:
+        result['error'] = "수치 동등성 허용 오차 초과: " + "; ".join(equivalence['violations'])
+    save_test_result(result, output_path)
+    return output_path
@@ -0,0 +1,116 @@
+"""
+실패 원인 분류 / 시그니처 군집화
+리포트의 실패 분석과 결과 DB의 failure_category 컬럼이 같은 기준을 쓰도록 한 곳에 모음
+
+분류는 미리 컴파일한 하나의 정규식으로 오류 메시지를 한 번만 훑고, 여러 규칙이 맞으면
+FAILURE_RULES 순서(앞쪽 우선)로 결정. 군집화는 UUID / 경로 / 숫자 등 실행마다 달라지는 부분을
+지운 시그니처 기준으로 묶어 원인별 한 줄로 요약. 유형은 시그니처가 아니라 원본 메시지로 판정
+(경로/URL 안의 단어도 규칙에 걸리므로 classify_failure와 같은 결과가 나오도록)
+"""
+
+import re
+
+FAILURE_CATEGORIES = {
+    'framework_issues': '프레임워크 호환성 문제',
+    'timeout_issues': '타임아웃 문제',
+    'memory_issues': '메모리 부족',
+    'network_issues': '네트워크 문제',
+    'other_issues': '기타 문제'
+}
+
+# (유형, 패턴) - 앞에 있을수록 우선
+FAILURE_RULES = (
+    ('framework_issues', r"notvalidframework\w*|\bframeworks?\b|unsupported (?:model )?format"),
+    ('timeout_issues', r"timed? ?out\w*|deadline exceeded"),
+    ('memory_issues', r"out of memory|\boom\b|memoryerror|cannot allocate|\bmemory\b"),
+    ('network_issues', r"connection\w*|\bnetwork\b|name resolution|max retries exceeded|\bssl\w*|\bdns\b"),
+)
+
+# 소문자로 바꾼 메시지에 적용 (IGNORECASE보다 빠름)
+_RULE_PATTERN = re.compile(
+    '|'.join(f"(?P<rule{index}>{pattern})" for index, (_, pattern) in enumerate(FAILURE_RULES))
+)
+
+# 시그니처 정규화: 실행마다 달라지는 값 → 자리표시자
+_NORMALIZERS = (
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.IGNORECASE), "<uuid>"),
+    (re.compile(r"\b[0-9a-f]{16,}\b", re.IGNORECASE), "<hex>"),
+    # URL을 경로보다 먼저 치환해야 "https://host/a/b"가 "https:<path>"로 쪼개지지 않음
+    (re.compile(r"https?://\S+"), "<url>"),
+    # 경로는 /, ./, ../, ~, 드라이브 문자로 시작하는 것만 ("read/write" 같은 일반 단어 조합은 유지)
+    (re.compile(r"(?<![\w.~-])(?:[A-Za-z]:[\\/]|\.{1,2}[\\/]|~[\\/]?|[\\/])[\w.~-]+(?:[\\/][\w.~-]+)*"), "<path>"),
+    (re.compile(r"0x[0-9a-f]+", re.IGNORECASE), "<addr>"),
+    (re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+    (re.compile(r"\s+"), " "),
+)
+MAX_SIGNATURE_LENGTH = 200
+
+
+def _error_text(details):
+    details = details or {}
+    error = details.get('error')
+    error_type = details.get('error_type')
+    text = str(error) if error is not None else ''
+    return f"{error_type}: {text}" if error_type else text
+
+
+def classify_message(message):
+    """오류 메시지 한 개를 FAILURE_CATEGORIES 키로 분류"""
+    best = None
+    for match in _RULE_PATTERN.finditer(message.lower()):
+        index = int(match.lastgroup[4:])
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return FAILURE_RULES[best][0] if best is not None else 'other_issues'
+
+
+def classify_failure(details):
+    """실패한 결과의 details(error, error_type)로 실패 유형 판정"""
+    return classify_message(_error_text(details))
+
+
+def normalize_signature(message):
+    """UUID / 경로 / 숫자 등을 지워 같은 원인의 메시지가 같은 문자열이 되도록 정규화"""
+    signature = message
+    for pattern, replacement in _NORMALIZERS:
+        signature = pattern.sub(replacement, signature)
+    signature = signature.strip()
+    if len(signature) > MAX_SIGNATURE_LENGTH:
+        signature = signature[:MAX_SIGNATURE_LENGTH] + "…"
+    return signature or "(오류 메시지 없음)"
+
+
+def cluster_failures(failed_tests, max_examples=3):
+    """
+    실패 결과를 (유형, 시그니처) 단위로 묶음
+
+    Args:
+        failed_tests (iterable): test_name, details를 가진 결과 dict들
+
+    Returns:
+        list: category, signature, count, examples(테스트 이름 일부), sample_error dict 목록 (건수 내림차순)
+    """
+    # 같은 메시지는 한 번만 정규화/분류. 유형은 원본 메시지로 판정해 결과 DB의 failure_category와 일치시킴
+    # (정규화하면 규칙이 보는 경로/URL 안의 단어가 사라짐), 시그니처는 묶는 데만 사용
+    parsed = {}
+    clusters = {}
+    for test in failed_tests:
+        message = _error_text(test.get('details'))
+        key = parsed.get(message)
+        if key is None:
+            key = parsed[message] = (classify_message(message), normalize_signature(message))
+        cluster = clusters.get(key)
+        if cluster is None:
+            cluster = clusters[key] = {
+                'category': key[0],
+                'signature': key[1],
+                'count': 0,
+                'examples': [],
+                'sample_error': message
+            }
+        cluster['count'] += 1
+        if len(cluster['examples']) < max_examples:
+            cluster['examples'].append(test.get('test_name'))
+    return sorted(clusters.values(), key=lambda c: (-c['count'], c['category'], c['signature']))
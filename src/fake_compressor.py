@@ -0,0 +1,367 @@
+"""
+오프라인 NetsPresso compressor 대역 (벤치마크/부하 테스트용)
+netspresso.NetsPresso().compressor_v2()와 같은 automatic_compression 인터페이스를 제공.
+실제 SDK처럼 실패해도 예외를 내지 않고 status='error' metadata(error_detail에 원인)를 반환 (raise_errors=True면 예외)
+submit_compression / get_compression_status / cancel_compression은 async_client용 비동기 작업 API
+"""
+
+import os
+import heapq
+import json
+import random
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from tracing import span
+
+
+class NotValidFrameworkException(Exception):
+    """
+    NetsPresso 서버가 지원하지 않는 프레임워크/모델 형식일 때의 오류 (SDK 예외가 아니라 서버 오류 응답의 name).
+    기본 모드에서는 error_detail의 name/message로만 나타나고 raise_errors=True일 때만 예외로 발생
+    """
+
+
+class FakeCompressionResult:
+    """CompressorMetadata 중 클라이언트가 사용하는 필드만 흉내 낸 결과 객체"""
+
+    def __init__(self, metadata):
+        self.metadata = metadata
+        self.status = metadata['status']
+        self.input_model_path = metadata['input_model_path']
+        self.compressed_model_path = metadata['compressed_model_path']
+        self.error_detail = metadata.get('error_detail', {})
+
+
+class FakeCompressor:
+    """
+    지연/처리량 제한/오류 주입이 가능한 로컬 compressor
+
+    Args:
+        latency (float): 압축 단계 기본 지연 시간(초)
+        latency_jitter (float): 지연 시간에 더해지는 0~jitter 사이의 난수(초)
+        upload_bandwidth (float): 업로드 대역폭(bytes/s). None이면 업로드 지연 없음
+        max_concurrent (int): 서버 측 동시 처리 슬롯 수. 초과 작업은 대기
+        failure_rate (float): 작업이 failure_exception으로 실패할 확률(0~1)
+        failure_exception (type): 주입할 예외 타입
+        fail_first (int): 처음 N번의 호출을 ConnectionError로 실패시킴 (재시도 측정용)
+        unsupported_extensions (tuple): 업로드 후 압축 단계에서 NotValidFrameworkException을 내는 확장자
+        credits_per_job (int): 작업당 소모 크레딧
+        seed (int): 난수 시드
+        raise_errors (bool): 실패를 SDK처럼 error metadata로 반환하지 않고 예외로 냄
+    """
+
+    def __init__(self, latency=0.0, latency_jitter=0.0, upload_bandwidth=None, max_concurrent=None,
+                 failure_rate=0.0, failure_exception=NotValidFrameworkException, fail_first=0,
+                 unsupported_extensions=('.onnx',), credits_per_job=25, seed=None, raise_errors=False):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.upload_bandwidth = upload_bandwidth
+        self.failure_rate = failure_rate
+        self.failure_exception = failure_exception
+        self.fail_first = fail_first
+        self.unsupported_extensions = tuple(unsupported_extensions)
+        self.credits_per_job = credits_per_job
+        self.raise_errors = raise_errors
+        self._random = random.Random(seed)
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self._lock = threading.Lock()
+        # 비동기 작업: job_id → 일정(업로드 완료/시작/종료 시각)과 상태. 슬롯별 다음 빈 시각은 min-heap
+        self._jobs = {}
+        self._slot_schedule = [0.0] * max_concurrent if max_concurrent else None
+        self.stats = {
+            'calls': 0,
+            'completed': 0,
+            'failed': 0,
+            'cancelled': 0,
+            'polls': 0,
+            'active': 0,
+            'peak_concurrency': 0,
+            'queue_wait': 0.0,
+            'credits_consumed': 0
+        }
+
+    def automatic_compression(self, input_model_path, output_dir, input_shapes,
+                              framework='pytorch', compression_ratio=0.5):
+        """
+        NetsPresso automatic_compression과 같은 인자로 압축을 흉내 냄
+
+        SDK처럼 실패하면 출력 폴더에 status='error' metadata.json을 남기고 그 결과를 반환
+        """
+        with self._lock:
+            self.stats['calls'] += 1
+            call_number = self.stats['calls']
+            failure_roll = self._random.random()
+            jitter = self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0.0
+
+        try:
+            if call_number <= self.fail_first:
+                raise ConnectionError(f"연결 실패 (주입된 오류 {call_number}/{self.fail_first})")
+            if not os.path.exists(input_model_path):
+                raise FileNotFoundError(f"모델 파일이 존재하지 않음: {input_model_path}")
+
+            # 업로드: 대역폭 제한만큼 지연
+            model_size = os.path.getsize(input_model_path)
+            with span('upload', bytes=model_size):
+                if self.upload_bandwidth:
+                    time.sleep(model_size / self.upload_bandwidth)
+
+            # 서버 처리 슬롯 대기
+            wait_start = time.perf_counter()
+            if self._slots is not None:
+                with span('queue_wait'):
+                    self._slots.acquire()
+            try:
+                with self._lock:
+                    self.stats['queue_wait'] += time.perf_counter() - wait_start
+                    self.stats['active'] += 1
+                    self.stats['peak_concurrency'] = max(self.stats['peak_concurrency'], self.stats['active'])
+
+                with span('compression', ratio=compression_ratio):
+                    time.sleep(self.latency + jitter)
+
+                    # 실제 서비스처럼 업로드는 성공하고 압축 단계에서 실패
+                    if Path(input_model_path).suffix.lower() in self.unsupported_extensions:
+                        raise NotValidFrameworkException(
+                            f"NotValidFrameworkException: {Path(input_model_path).suffix} 모델은 "
+                            f"Python SDK 압축을 지원하지 않습니다 (torch.fx.GraphModule 필요)"
+                        )
+                    if failure_roll < self.failure_rate:
+                        raise self.failure_exception(f"{self.failure_exception.__name__}: 주입된 압축 실패")
+
+                with span('download'):
+                    metadata = self._write_output(input_model_path, output_dir, input_shapes,
+                                                  framework, compression_ratio, model_size)
+            finally:
+                with self._lock:
+                    self.stats['active'] -= 1
+                if self._slots is not None:
+                    self._slots.release()
+        except Exception as e:
+            with self._lock:
+                self.stats['failed'] += 1
+            if self.raise_errors:
+                raise
+            return FakeCompressionResult(write_error_metadata(input_model_path, output_dir, input_shapes,
+                                                              framework, compression_ratio, e))
+
+        with self._lock:
+            self.stats['completed'] += 1
+            self.stats['credits_consumed'] += self.credits_per_job
+        return FakeCompressionResult(metadata)
+
+    def submit_compression(self, input_model_path, output_dir, input_shapes, framework='pytorch', compression_ratio=0.5):
+        """
+        압축 작업을 등록하고 바로 job_id 반환
+
+        업로드 → 슬롯 대기 → 압축 일정을 등록 시각 기준으로 미리 계산하고, 상태는 조회 시점에 진행시킴.
+        스레드를 쓰지 않으므로 수백 개 작업을 동시에 걸어 둘 수 있음
+        """
+        with self._lock:
+            self.stats['calls'] += 1
+            call_number = self.stats['calls']
+            failure_roll = self._random.random()
+            jitter = self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0.0
+
+        if call_number <= self.fail_first:
+            with self._lock:
+                self.stats['failed'] += 1
+            raise ConnectionError(f"연결 실패 (주입된 오류 {call_number}/{self.fail_first})")
+        if not os.path.exists(input_model_path):
+            raise FileNotFoundError(f"모델 파일이 존재하지 않음: {input_model_path}")
+
+        error = None
+        if Path(input_model_path).suffix.lower() in self.unsupported_extensions:
+            error = NotValidFrameworkException(
+                f"NotValidFrameworkException: {Path(input_model_path).suffix} 모델은 "
+                f"Python SDK 압축을 지원하지 않습니다 (torch.fx.GraphModule 필요)"
+            )
+        elif failure_roll < self.failure_rate:
+            error = self.failure_exception(f"{self.failure_exception.__name__}: 주입된 압축 실패")
+
+        model_size = os.path.getsize(input_model_path)
+        now = time.monotonic()
+        uploaded_at = now + (model_size / self.upload_bandwidth if self.upload_bandwidth else 0.0)
+        with self._lock:
+            # 가장 먼저 비는 슬롯에 배정 (FIFO)
+            started_at = uploaded_at
+            if self._slot_schedule is not None:
+                started_at = max(uploaded_at, heapq.heappop(self._slot_schedule))
+            finished_at = started_at + self.latency + jitter
+            if self._slot_schedule is not None:
+                heapq.heappush(self._slot_schedule, finished_at)
+            self.stats['queue_wait'] += started_at - uploaded_at
+
+            job_id = str(uuid.uuid4())
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'status': 'uploading',
+                'args': (input_model_path, output_dir, input_shapes, framework, compression_ratio, model_size),
+                'error': error,
+                'submitted_at': now,
+                'uploaded_at': uploaded_at,
+                'started_at': started_at,
+                'finished_at': finished_at,
+                'compressed_model_path': None
+            }
+        return job_id
+
+    def get_compression_status(self, job_id):
+        """
+        작업 상태 조회. 종료 시각이 지난 작업은 이때 결과 파일을 기록하고 completed/failed로 바뀜
+
+        Returns:
+            dict: job_id, status(uploading/queued/in_progress/completed/failed/cancelled), progress(0~1),
+                  retry_after(다음 상태 변화까지 남은 초), compressed_model_path, error, error_type
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise KeyError(f"알 수 없는 작업: {job_id}")
+            self.stats['polls'] += 1
+            now = time.monotonic()
+            if job['status'] not in ('completed', 'failed', 'cancelled'):
+                for status, until in (('uploading', job['uploaded_at']), ('queued', job['started_at']),
+                                      ('in_progress', job['finished_at'])):
+                    if now < until:
+                        job['status'] = status
+                        break
+                else:
+                    self._finish_job(job)
+            return self._job_status(job, now)
+
+    def cancel_compression(self, job_id):
+        """끝나지 않은 작업을 취소. 취소했으면 True (이미 끝난 작업이면 False)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise KeyError(f"알 수 없는 작업: {job_id}")
+            if job['status'] in ('completed', 'failed', 'cancelled'):
+                return False
+            job['status'] = 'cancelled'
+            self.stats['cancelled'] += 1
+            return True
+
+    def _finish_job(self, job):
+        """(잠금 안에서 호출) 종료 시각이 지난 작업의 결과 확정"""
+        if job['error'] is None:
+            try:
+                metadata = self._write_output(*job['args'])
+                job['compressed_model_path'] = metadata['compressed_model_path']
+            except Exception as e:
+                job['error'] = e
+        if job['error'] is None:
+            job['status'] = 'completed'
+            self.stats['completed'] += 1
+            self.stats['credits_consumed'] += self.credits_per_job
+        else:
+            job['status'] = 'failed'
+            self.stats['failed'] += 1
+
+    def _job_status(self, job, now):
+        total = job['finished_at'] - job['submitted_at']
+        progress = 1.0 if total <= 0 else min(1.0, max(0.0, (now - job['submitted_at']) / total))
+        if job['status'] in ('completed', 'failed', 'cancelled'):
+            retry_after = 0.0
+        else:
+            retry_after = min(t for t in (job['uploaded_at'], job['started_at'], job['finished_at']) if t > now) - now
+        error = job['error']
+        return {
+            'job_id': job['job_id'],
+            'status': job['status'],
+            'progress': progress if job['status'] != 'completed' else 1.0,
+            'retry_after': retry_after,
+            'compressed_model_path': job['compressed_model_path'],
+            'error': str(error) if error is not None else None,
+            'error_type': type(error).__name__ if error is not None else None
+        }
+
+    def _write_output(self, input_model_path, output_dir, input_shapes, framework, compression_ratio, model_size):
+        """압축 모델(.pt)과 metadata.json을 SDK와 같은 구조로 기록"""
+        output_path = _create_unique_folder(output_dir)
+        compressed_path = output_path / f"{Path(input_model_path).stem}_compressed.pt"
+        shutil.copyfile(input_model_path, compressed_path)
+
+        metadata = {
+            'status': 'completed',
+            'task_type': 'compress',
+            'input_model_path': Path(input_model_path).resolve().as_posix(),
+            'compressed_model_path': str(compressed_path),
+            'model_id': str(uuid.uuid4()),
+            'compressed_model_id': str(uuid.uuid4()),
+            'model_info': {
+                'framework': str(framework),
+                'input_shapes': input_shapes
+            },
+            'compression_info': {
+                'method': 'PR_L2',
+                'ratio': compression_ratio
+            },
+            'results': {
+                'original_model': {'size': model_size},
+                'compressed_model': {'size': int(model_size * (1 - compression_ratio))}
+            },
+            'credits_consumed': self.credits_per_job,
+            'backend': 'fake'
+        }
+        with open(output_path / 'metadata.json', 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        return metadata
+
+
+class FakeNetsPresso:
+    """NetsPresso 객체 대역: compressor_v2()로 FakeCompressor를 반환"""
+
+    def __init__(self, **compressor_options):
+        self.compressor_options = compressor_options
+
+    def compressor_v2(self):
+        return FakeCompressor(**self.compressor_options)
+
+
+def write_error_metadata(input_model_path, output_dir, input_shapes, framework, compression_ratio, error,
+                         method='PR_L2', backend='fake'):
+    """SDK의 handle_error처럼 status='error'와 error_detail을 담은 metadata.json을 새 출력 폴더에 기록"""
+    output_path = _create_unique_folder(output_dir)
+    metadata = {
+        'status': 'error',
+        'task_type': 'compress',
+        'input_model_path': Path(input_model_path).resolve().as_posix(),
+        'compressed_model_path': '',
+        'model_info': {
+            'framework': str(framework),
+            'input_shapes': input_shapes
+        },
+        'compression_info': {
+            'method': method,
+            'ratio': compression_ratio
+        },
+        'error_detail': {
+            'data': {},
+            'error_code': '',
+            'name': type(error).__name__,
+            'message': str(error)
+        },
+        'credits_consumed': 0,
+        'backend': backend
+    }
+    with open(output_path / 'metadata.json', 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    return metadata
+
+
+def _create_unique_folder(folder_path):
+    """SDK의 FileHandler.create_unique_folder와 같이 기존 폴더가 있으면 ' (n)'을 붙임"""
+    folder_path = Path(folder_path)
+    candidate = folder_path
+    count = 1
+    while True:
+        try:
+            candidate.mkdir(parents=True)
+            return candidate
+        except FileExistsError:
+            candidate = folder_path.with_name(f"{folder_path.name} ({count})")
+            count += 1
@@ -0,0 +1,188 @@
+"""
+mmap 친화적인 GraphModule 아티팩트 포맷 (.fxa)
+그래프 구조(가중치를 뺀 meta 디바이스 GraphModule)와 정렬된 평면 텐서 blob을 한 파일에 분리 저장하고,
+로드 시 blob을 mmap하여 텐서를 복사 없이 view로 연결
+
+파일 구조:
+    MAGIC(8) | 헤더 길이(8, little endian) | 헤더 JSON | 패딩 | 그래프 pickle | 패딩 | 텐서 blob
+"""
+
+import io
+import json
+import mmap
+import copy
+import ctypes
+import struct
+import threading
+
+import torch
+import torch.fx
+
+MAGIC = b'NPFXART1'
+ALIGNMENT = 64
+FORMAT_VERSION = 2
+
+# torch.fx 트레이싱(GraphModule unpickle 시의 재트레이싱 포함)은 torch.nn.Module.__call__을 전역으로 바꿔치기하므로
+# 그동안 다른 스레드에서 모델을 실행/트레이싱하면 서로 깨짐 → 프로세스 안에서 직렬화
+FX_LOCK = threading.RLock()
+
+_DTYPES = {str(dtype): dtype for dtype in (
+    torch.float32, torch.float64, torch.float16, torch.bfloat16,
+    torch.int64, torch.int32, torch.int16, torch.int8, torch.uint8, torch.bool,
+)}
+
+
+def _align(offset, alignment=ALIGNMENT):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def is_fx_artifact(path):
+    """파일 앞부분의 MAGIC으로 .fxa 포맷 여부 판별"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _named_tensors(graph_module):
+    """
+    (이름 목록, 종류, 텐서) 목록: 파라미터와 버퍼 모두
+
+    named_parameters()는 공유(tied) 텐서를 첫 이름으로만 돌려주므로 remove_duplicate=False로 모든 이름을 모으고
+    같은 텐서 객체는 한 항목으로 묶음 (첫 이름이 대표, 나머지는 별칭)
+    """
+    tensors = []
+    by_id = {}
+    named = [(name, 'parameter', p) for name, p in graph_module.named_parameters(remove_duplicate=False)]
+    named += [(name, 'buffer', b) for name, b in graph_module.named_buffers(remove_duplicate=False)]
+    for name, kind, tensor in named:
+        if id(tensor) in by_id:
+            by_id[id(tensor)][0].append(name)
+            continue
+        entry = ([name], kind, tensor)
+        by_id[id(tensor)] = entry
+        tensors.append(entry)
+    return tensors
+
+
+def save_fx_artifact(model, path):
+    """
+    모델을 .fxa 포맷으로 저장
+
+    Returns:
+        dict: 저장된 헤더 (텐서 목록과 오프셋 포함)
+    """
+    if isinstance(model, torch.fx.GraphModule):
+        graph_module = model
+    else:
+        with FX_LOCK:
+            graph_module = torch.fx.symbolic_trace(model)
+
+    tensors = []
+    blob_size = 0
+    for names, kind, tensor in _named_tensors(graph_module):
+        name = names[0]
+        dtype = str(tensor.dtype)
+        if dtype not in _DTYPES:
+            raise ValueError(f"지원되지 않는 dtype: {name} ({dtype})")
+        offset = _align(blob_size)
+        nbytes = tensor.numel() * tensor.element_size()
+        tensors.append({
+            'name': name,
+            'aliases': names[1:],
+            'kind': kind,
+            'dtype': dtype,
+            'shape': list(tensor.shape),
+            'offset': offset,
+            'nbytes': nbytes,
+            'requires_grad': bool(tensor.requires_grad)
+        })
+        blob_size = offset + nbytes
+
+    # 가중치 없는 그래프 구조만 pickle
+    skeleton = io.BytesIO()
+    torch.save(copy.deepcopy(graph_module).to('meta'), skeleton)
+    skeleton_bytes = skeleton.getvalue()
+
+    header = json.dumps({
+        'version': FORMAT_VERSION,
+        'alignment': ALIGNMENT,
+        'torch_version': torch.__version__,
+        'code': graph_module.code,
+        'skeleton_length': len(skeleton_bytes),
+        'blob_size': blob_size,
+        'tensors': tensors
+    }, ensure_ascii=False).encode('utf-8')
+
+    skeleton_offset = _align(len(MAGIC) + 8 + len(header))
+    blob_offset = _align(skeleton_offset + len(skeleton_bytes))
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        f.write(b'\0' * (skeleton_offset - f.tell()))
+        f.write(skeleton_bytes)
+        f.write(b'\0' * (blob_offset - f.tell()))
+        named = {names[0]: tensor for names, _, tensor in _named_tensors(graph_module)}
+        for entry in tensors:
+            f.write(b'\0' * (blob_offset + entry['offset'] - f.tell()))
+            if entry['nbytes']:
+                tensor = named[entry['name']].detach().to('cpu').contiguous()
+                f.write(ctypes.string_at(tensor.data_ptr(), entry['nbytes']))
+    return json.loads(header)
+
+
+def read_fx_artifact_header(path):
+    """텐서 blob을 읽지 않고 헤더만 반환"""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f".fxa 아티팩트가 아님: {path}")
+        (header_length,) = struct.unpack('<Q', f.read(8))
+        return json.loads(f.read(header_length).decode('utf-8'))
+
+
+def load_fx_artifact(path):
+    """
+    .fxa 아티팩트를 로드. 텐서는 mmap(copy-on-write)된 blob의 view이므로
+    로드 시 가중치를 복사하지 않고, 읽기 전용 페이지는 프로세스 간에 공유됨.
+    공유(tied) 파라미터/버퍼는 blob에 한 번만 저장되고 로드 후에도 같은 텐서 객체로 연결됨
+    """
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    if mapped[:len(MAGIC)] != MAGIC:
+        mapped.close()
+        raise ValueError(f".fxa 아티팩트가 아님: {path}")
+    (header_length,) = struct.unpack_from('<Q', mapped, len(MAGIC))
+    header_start = len(MAGIC) + 8
+    header = json.loads(mapped[header_start:header_start + header_length].decode('utf-8'))
+    skeleton_offset = _align(header_start + header_length, header['alignment'])
+    blob_offset = _align(skeleton_offset + header['skeleton_length'], header['alignment'])
+
+    skeleton = io.BytesIO(mapped[skeleton_offset:skeleton_offset + header['skeleton_length']])
+    with FX_LOCK:
+        graph_module = torch.load(skeleton, map_location='meta', weights_only=False)
+
+    for entry in header['tensors']:
+        dtype = _DTYPES[entry['dtype']]
+        count = entry['nbytes'] // torch.empty((), dtype=dtype).element_size()
+        if count:
+            tensor = torch.frombuffer(mapped, dtype=dtype, count=count, offset=blob_offset + entry['offset'])
+            tensor = tensor.view(entry['shape'])
+        else:
+            tensor = torch.empty(entry['shape'], dtype=dtype)
+
+        if entry['kind'] == 'parameter':
+            tensor = torch.nn.Parameter(tensor, requires_grad=entry['requires_grad'])
+        # 공유 텐서는 같은 객체를 모든 이름에 연결 (버전 1 아티팩트에는 aliases가 없음)
+        for name in [entry['name']] + entry.get('aliases', []):
+            module_path, _, leaf = name.rpartition('.')
+            module = graph_module.get_submodule(module_path) if module_path else graph_module
+            if entry['kind'] == 'parameter':
+                module._parameters[leaf] = tensor
+            else:
+                module._buffers[leaf] = tensor
+
+    return graph_module
@@ -0,0 +1,540 @@
+"""
+내구성 있는 압축 작업 큐 (SQLite)
+(모델 + 설정) 조합 하나가 작업 하나이고, precheck → upload → compress → download → verify 단계를
+원자적 상태 전이로 기록. CI의 timeout이나 크래시로 실행이 중간에 죽어도 같은 배치를 다시 실행하면
+끝나지 않은 작업만 마지막 단계부터 이어서 처리하고, 이미 끝난 압축은 다시 하지 않음
+
+- 점유는 lease 방식: 실행(run)이 작업을 가져가면 lease_expires까지 독점하고 단계가 바뀔 때마다 연장.
+  원격 압축 호출 동안은 heartbeat 스레드가 lease/3마다 연장 (서버 측 압축 대기에는 단계 전이가 없음).
+  lease가 지났거나 같은 호스트의 점유 프로세스가 죽었으면 다른 실행이 이어받음 (자기 실행의 작업은 가져가지 않음)
+- 모든 전이는 BEGIN IMMEDIATE 트랜잭션 안의 compare-and-set (owner가 그대로일 때만 반영)
+- 크레딧 예산은 실행 단위: 원격 압축을 시작하기 전에 runs 테이블에서 원자적으로 예약하고,
+  예산을 넘으면 새 압축은 시작하지 않고 검증만 남은 작업만 마저 처리
+- 동시 처리 수 상한은 run_queue의 작업 스레드 수 (runs.max_concurrent에 기록)
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import hashlib
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from failure_patterns import classify_failure
+from netspresso_client import DEFAULT_COMPRESSION_RATIO, DEFAULT_INPUT_SHAPES, SDK_STAGE_SPANS, compression_error
+from tracing import Tracer, instrument_methods
+from utils import hash_file
+
+DEFAULT_JOB_QUEUE_DB = os.path.join('.', 'results', 'jobs.db')
+DEFAULT_LEASE = 600
+DEFAULT_MAX_ATTEMPTS = 3
+# FakeCompressor와 같은 작업당 소모 크레딧 (실제 서비스 요금에 맞춰 조정)
+DEFAULT_CREDITS_PER_JOB = 25
+
+STAGES = ('precheck', 'upload', 'compress', 'download', 'verify')
+REMOTE_STAGES = ('upload', 'compress', 'download')
+
+# compressor 안에서 시작되는 span 이름 → 작업 단계 (SDK는 SDK_STAGE_SPANS, 대역은 fake_compressor의 span)
+SPAN_STAGES = {
+    'upload': 'upload',
+    'queue_wait': 'compress',
+    'compression': 'compress',
+    'status_polling': 'compress',
+    'download': 'download'
+}
+
+# 다시 시도하면 성공할 수 있는 실패 유형 (failure_patterns 분류)
+RETRYABLE_CATEGORIES = ('network_issues', 'timeout_issues')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_key TEXT NOT NULL UNIQUE,
+    batch TEXT NOT NULL,
+    model_path TEXT NOT NULL,
+    output_dir TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    status TEXT NOT NULL,
+    owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    credits REAL NOT NULL DEFAULT 0,
+    compressed_path TEXT,
+    result TEXT,
+    error TEXT,
+    error_type TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_batch_status ON jobs (batch, status);
+
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    batch TEXT NOT NULL,
+    credit_budget REAL,
+    credits_used REAL NOT NULL DEFAULT 0,
+    max_concurrent INTEGER,
+    started_at TEXT NOT NULL,
+    finished_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS job_events (
+    id INTEGER PRIMARY KEY,
+    job_id INTEGER NOT NULL,
+    run_id TEXT,
+    stage TEXT NOT NULL,
+    event TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_events_job ON job_events (job_id);
+"""
+
+# 이어받을 때 뒤 단계 작업부터 (이미 크레딧을 쓴 작업을 먼저 끝냄)
+_STAGE_ORDER = "CASE stage " + " ".join(
+    f"WHEN '{stage}' THEN {index}" for index, stage in enumerate(reversed(STAGES))) + " END"
+
+
+class JobLeaseLost(Exception):
+    """점유가 만료되어 다른 실행이 작업을 가져갔을 때 발생하는 예외"""
+
+
+class CompressionFailed(Exception):
+    """SDK가 예외 대신 반환한 error / stopped metadata. error_type은 SDK가 알려준 오류 이름"""
+
+    def __init__(self, message, error_type):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def default_batch():
+    """작업 묶음 이름: GitHub Actions 재실행(run_attempt)끼리는 같은 GITHUB_RUN_ID를 공유"""
+    return os.getenv('GITHUB_RUN_ID') or 'local'
+
+
+def _now():
+    return datetime.now().isoformat()
+
+
+def _new_run_id():
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _owner_dead(owner):
+    """같은 호스트에서 점유 프로세스가 이미 종료되었는지 (다른 호스트면 lease 만료로만 판단)"""
+    try:
+        host, pid, _ = owner.rsplit(':', 2)
+        if host != socket.gethostname():
+            return False
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except (ValueError, OSError):
+        return False
+    return False
+
+
+def _job_dict(row):
+    job = dict(row)
+    job['settings'] = json.loads(job['settings'])
+    job['result'] = json.loads(job['result']) if job['result'] else None
+    return job
+
+
+class JobQueue:
+    """
+    압축 작업 큐 SQLite 래퍼 (스레드/프로세스 간 공유 가능)
+
+    Args:
+        db_path (str): DB 경로. None이면 NETSPRESSO_JOB_QUEUE_DB 또는 results/jobs.db
+        lease (float): 점유 유지 시간(초). 단계 전이/heartbeat마다 연장
+        max_attempts (int): 네트워크/타임아웃 실패 시 최대 시도 횟수 (실행을 넘어 누적)
+    """
+
+    def __init__(self, db_path=None, lease=DEFAULT_LEASE, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.db_path = str(db_path or os.getenv('NETSPRESSO_JOB_QUEUE_DB', DEFAULT_JOB_QUEUE_DB))
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        # 트랜잭션은 _transaction()에서 직접 관리 (isolation_level=None)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        if self.db_path != ':memory:':
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (다른 프로세스와의 점유 경쟁도 직렬화)"""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def _log(self, conn, job_id, run_id, stage, event):
+        conn.execute("INSERT INTO job_events (job_id, run_id, stage, event, timestamp) VALUES (?, ?, ?, ?, ?)",
+                     (job_id, run_id, stage, event, _now()))
+
+    def add(self, model_path, output_dir, input_shapes=None, compression_ratio=DEFAULT_COMPRESSION_RATIO,
+            batch=None):
+        """
+        작업 등록. 같은 배치에 같은 (모델 내용, 설정, 출력 폴더)가 이미 있으면 새로 만들지 않음
+
+        Returns:
+            int: 작업 id
+        """
+        batch = batch or default_batch()
+        settings = {'input_shapes': input_shapes or DEFAULT_INPUT_SHAPES, 'compression_ratio': compression_ratio}
+        key = hashlib.sha256(json.dumps([batch, hash_file(model_path), settings, str(output_dir)],
+                                        sort_keys=True).encode()).hexdigest()
+        now = _now()
+        with self._transaction() as conn:
+            cursor = conn.execute("INSERT OR IGNORE INTO jobs (job_key, batch, model_path, output_dir, settings, "
+                                  "stage, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, ?)",
+                                  (key, batch, str(model_path), str(output_dir), json.dumps(settings),
+                                   STAGES[0], now, now))
+            job_id = conn.execute("SELECT id FROM jobs WHERE job_key = ?", (key,)).fetchone()['id']
+            if cursor.rowcount:
+                self._log(conn, job_id, None, STAGES[0], 'added')
+        return job_id
+
+    def start_run(self, batch=None, credit_budget=None, max_concurrent=None):
+        """실행 등록 후 run_id 반환 (크레딧 예산은 이 run_id 단위)"""
+        run_id = _new_run_id()
+        with self._transaction() as conn:
+            conn.execute("INSERT INTO runs (run_id, batch, credit_budget, max_concurrent, started_at) "
+                         "VALUES (?, ?, ?, ?, ?)",
+                         (run_id, batch or default_batch(), credit_budget, max_concurrent, _now()))
+        return run_id
+
+    def finish_run(self, run_id):
+        """실행 종료 기록. 아직 점유 중인 작업은 대기 상태로 돌려놓음"""
+        with self._transaction() as conn:
+            conn.execute("UPDATE runs SET finished_at = ? WHERE run_id = ?", (_now(), run_id))
+            conn.execute("UPDATE jobs SET status = 'pending', owner = NULL, lease_expires = NULL, updated_at = ? "
+                         "WHERE owner = ? AND status = 'running'", (_now(), run_id))
+
+    def run_info(self, run_id):
+        row = self.conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def claim(self, run_id, batch=None, stages=None):
+        """
+        처리할 작업 하나를 점유해 반환 (없으면 None)
+
+        대기 중인 작업과, lease가 지났거나 점유 프로세스가 죽은 작업이 대상이며 뒤 단계 작업부터 가져감.
+        run_id 자신이 점유한 작업은 lease가 지나도 가져가지 않음 (같은 실행의 다른 스레드가 아직 처리 중)
+
+        Args:
+            stages (tuple): 지정하면 이 단계에 있는 작업만 가져감
+        """
+        batch = batch or default_batch()
+        now = time.time()
+        stage_filter = ""
+        params = [batch, now, run_id]
+        if stages is not None:
+            stage_filter = f" AND stage IN ({', '.join('?' * len(stages))})"
+            params.extend(stages)
+        with self._transaction() as conn:
+            row = conn.execute(f"SELECT id, stage, status FROM jobs WHERE batch = ? AND (status = 'pending' OR "
+                               f"(status = 'running' AND lease_expires < ? AND owner != ?)){stage_filter} "
+                               f"ORDER BY {_STAGE_ORDER}, id LIMIT 1", params).fetchone()
+            if row is None:
+                # lease는 남았지만 점유 프로세스가 이미 죽은 작업 (timeout으로 kill된 직후 재실행)
+                owners = [r['owner'] for r in conn.execute(
+                    "SELECT DISTINCT owner FROM jobs WHERE batch = ? AND status = 'running'", (batch,))]
+                dead = [owner for owner in owners if owner != run_id and _owner_dead(owner)]
+                if dead:
+                    row = conn.execute(f"SELECT id, stage, status FROM jobs WHERE batch = ? AND status = 'running' "
+                                       f"AND owner IN ({', '.join('?' * len(dead))}){stage_filter} "
+                                       f"ORDER BY {_STAGE_ORDER}, id LIMIT 1",
+                                       [batch] + dead + list(stages or ())).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE jobs SET status = 'running', owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                         "updated_at = ? WHERE id = ?", (run_id, now + self.lease, _now(), row['id']))
+            resumed = row['status'] == 'running' or row['stage'] != STAGES[0]
+            self._log(conn, row['id'], run_id, row['stage'], 'resumed' if resumed else 'claimed')
+            return _job_dict(conn.execute("SELECT * FROM jobs WHERE id = ?", (row['id'],)).fetchone())
+
+    def _update_owned(self, job, assignments, params, event=None, stage=None):
+        """점유가 유효할 때만 반영하는 compare-and-set. 아니면 JobLeaseLost"""
+        with self._transaction() as conn:
+            cursor = conn.execute(f"UPDATE jobs SET {assignments}, updated_at = ? "
+                                  f"WHERE id = ? AND owner = ? AND status = 'running'",
+                                  list(params) + [_now(), job['id'], job['owner']])
+            if cursor.rowcount == 0:
+                raise JobLeaseLost(f"작업 {job['id']}의 점유가 만료됨 (run {job['owner']})")
+            if event is not None:
+                self._log(conn, job['id'], job['owner'], stage or job['stage'], event)
+
+    def advance(self, job, stage, compressed_path=None):
+        """작업을 stage로 전이하고 lease 연장 (job dict도 갱신)"""
+        assignments = "stage = ?, lease_expires = ?"
+        params = [stage, time.time() + self.lease]
+        if compressed_path is not None:
+            assignments += ", compressed_path = ?"
+            params.append(str(compressed_path))
+        self._update_owned(job, assignments, params, event='advanced' if stage != job['stage'] else None,
+                           stage=stage)
+        job['stage'] = stage
+        if compressed_path is not None:
+            job['compressed_path'] = str(compressed_path)
+
+    def heartbeat(self, job):
+        """단계 변화 없이 lease만 연장 (stage는 건드리지 않으므로 다른 스레드의 advance와 겹쳐도 안전)"""
+        self._update_owned(job, "lease_expires = ?", [time.time() + self.lease])
+
+    def complete(self, job, result=None):
+        self._update_owned(job, "stage = 'done', status = 'done', owner = NULL, lease_expires = NULL, result = ?, "
+                                "error = NULL, error_type = NULL",
+                           [json.dumps(result or {}, ensure_ascii=False, default=str)], event='done', stage='done')
+        job.update(stage='done', status='done')
+
+    def fail(self, job, error, error_type=None, retryable=False):
+        """
+        실패 기록. 재시도 가능하고 시도 횟수가 남았으면 같은 단계에서 다시 대기
+
+        Returns:
+            str: 새 상태 ('pending' 또는 'failed')
+        """
+        status = 'pending' if retryable and job['attempts'] < self.max_attempts else 'failed'
+        self._update_owned(job, "status = ?, owner = NULL, lease_expires = NULL, error = ?, error_type = ?",
+                           [status, str(error), error_type], event='retry' if status == 'pending' else 'failed')
+        job.update(status=status, error=str(error), error_type=error_type)
+        return status
+
+    def release(self, job):
+        """처리하지 않고 대기 상태로 돌려놓음 (시도 횟수에 포함하지 않음)"""
+        self._update_owned(job, "status = 'pending', owner = NULL, lease_expires = NULL, attempts = attempts - 1",
+                           [], event='released')
+        job['status'] = 'pending'
+
+    def reserve_credits(self, run_id, job, amount):
+        """실행 예산 안에서 크레딧을 원자적으로 예약. 예산을 넘으면 False"""
+        with self._transaction() as conn:
+            cursor = conn.execute("UPDATE runs SET credits_used = credits_used + ? WHERE run_id = ? AND "
+                                  "(credit_budget IS NULL OR credits_used + ? <= credit_budget)",
+                                  (amount, run_id, amount))
+            if cursor.rowcount == 0:
+                return False
+            conn.execute("UPDATE jobs SET credits = credits + ? WHERE id = ?", (amount, job['id']))
+        job['credits'] = job.get('credits', 0) + amount
+        return True
+
+    def counts(self, batch=None):
+        """상태별 작업 수"""
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM jobs WHERE batch = ? GROUP BY status",
+                                 (batch or default_batch(),)).fetchall()
+        return {row['status']: row['n'] for row in rows}
+
+    def jobs(self, batch=None, status=None):
+        query = "SELECT * FROM jobs WHERE batch = ?"
+        params = [batch or default_batch()]
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        return [_job_dict(row) for row in self.conn.execute(query + " ORDER BY id", params)]
+
+    def events(self, job_id):
+        """작업의 전이 이력 (오래된 순)"""
+        return [dict(row) for row in self.conn.execute(
+            "SELECT run_id, stage, event, timestamp FROM job_events WHERE job_id = ? ORDER BY id", (job_id,))]
+
+
+def _find_download(job):
+    """
+    이전 실행이 다운로드까지 마치고 기록 전에 죽었으면 그 결과를 찾아 재사용 (크레딧 재소모 방지)
+
+    SDK/대역 모두 출력 폴더(이미 있으면 ' (n)'이 붙은 폴더)에 metadata.json을 남김.
+    SDK는 input_model_path를 절대 경로로 기록하므로 양쪽을 resolve해서 비교
+    """
+    model_path = Path(job['model_path']).resolve()
+    output_dir = Path(job['output_dir'])
+    for folder in [output_dir] + sorted(output_dir.parent.glob(f"{output_dir.name} (*)")):
+        try:
+            with open(folder / 'metadata.json', encoding='utf-8') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            continue
+        compressed_path = metadata.get('compressed_model_path')
+        input_model_path = metadata.get('input_model_path')
+        if (metadata.get('status') == 'completed' and input_model_path
+                and Path(input_model_path).resolve() == model_path
+                and compressed_path and os.path.exists(compressed_path)):
+            return compressed_path
+    return None
+
+
+@contextmanager
+def _lease_heartbeat(queue, job):
+    """블록을 실행하는 동안 lease/3마다 lease 연장. 점유를 잃으면 연장을 멈춤"""
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(queue.lease / 3):
+            try:
+                queue.heartbeat(job)
+            except JobLeaseLost:
+                return
+
+    thread = threading.Thread(target=beat, name=f"lease-heartbeat-{job['id']}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _compress_remote(queue, job, compressor):
+    """automatic_compression 실행. compressor 안의 span으로 upload/compress/download 전이를 기록"""
+    def on_span_start(name, args):
+        stage = SPAN_STAGES.get(name)
+        if stage is None:
+            return
+        if STAGES.index(stage) > STAGES.index(job['stage']):
+            queue.advance(job, stage)
+        else:
+            queue.heartbeat(job)
+
+    settings = job['settings']
+    # SDK의 서버 측 압축(compress_model_with_automatic)은 감쌀 단계가 없으므로 호출 전체를 heartbeat로 덮음
+    with _lease_heartbeat(queue, job), Tracer(on_span_start=on_span_start).activate():
+        result = compressor.automatic_compression(
+            input_model_path=job['model_path'],
+            output_dir=job['output_dir'],
+            input_shapes=settings['input_shapes'],
+            compression_ratio=settings['compression_ratio']
+        )
+    # SDK는 실패해도 예외 대신 error metadata를 반환하므로 그 메시지로 재시도 여부를 판단
+    error = compression_error(result)
+    if error is not None:
+        raise CompressionFailed(*error)
+    return result.compressed_model_path
+
+
+def _process_job(queue, run_id, job, compressor, credits_per_job, verify, budget_exhausted):
+    """작업 하나를 현재 단계부터 끝까지 진행하고 결과 유형 반환"""
+    settings = job['settings']
+    try:
+        if job['stage'] == 'precheck':
+            from precheck import precheck_model
+            precheck = precheck_model(job['model_path'], settings['input_shapes'])
+            if not precheck['compatible']:
+                queue.fail(job, precheck['reason'], 'PrecheckError')
+                return 'failed'
+            queue.advance(job, 'upload')
+
+        if job['stage'] in REMOTE_STAGES:
+            compressed_path = _find_download(job) if job['stage'] == 'download' else None
+            if compressed_path is None:
+                if not queue.reserve_credits(run_id, job, credits_per_job):
+                    budget_exhausted.set()
+                    queue.release(job)
+                    return 'budget_exhausted'
+                compressed_path = _compress_remote(queue, job, compressor)
+            queue.advance(job, 'verify', compressed_path=compressed_path)
+
+        result = {'compressed_path': job['compressed_path']}
+        if verify:
+            from model_tests import verify_fx_model
+            from precheck import input_shapes_to_tensor_shapes
+            ok, message = verify_fx_model(job['compressed_path'],
+                                          input_shapes_to_tensor_shapes(settings['input_shapes'])[0])
+            if not ok:
+                queue.fail(job, message, 'VerificationError')
+                return 'failed'
+            result['verify'] = message
+        result.update(original_size=os.path.getsize(job['model_path']),
+                      compressed_size=os.path.getsize(job['compressed_path']))
+        queue.complete(job, result)
+        return 'done'
+    except JobLeaseLost:
+        return 'lease_lost'
+    except Exception as e:
+        error_type = getattr(e, 'error_type', None) or type(e).__name__
+        retryable = classify_failure({'error': str(e), 'error_type': error_type}) in RETRYABLE_CATEGORIES
+        try:
+            return 'retry' if queue.fail(job, e, error_type, retryable=retryable) == 'pending' else 'failed'
+        except JobLeaseLost:
+            return 'lease_lost'
+
+
+def run_queue(queue, compressor=None, batch=None, credit_budget=None, max_concurrent=2,
+              credits_per_job=DEFAULT_CREDITS_PER_JOB, verify=True):
+    """
+    배치의 끝나지 않은 작업을 처리
+
+    Args:
+        queue (JobQueue): 작업 큐
+        compressor: automatic_compression을 가진 객체. None이면 NetsPresssoQAClient와 같은 방식으로 생성
+            (NETSPRESSO_FAKE_BACKEND=1 이면 오프라인 대역)
+        credit_budget (float): 이번 실행에서 쓸 수 있는 최대 크레딧 (None이면 제한 없음)
+        max_concurrent (int): 동시에 처리할 최대 작업 수
+        credits_per_job (float): 압축 한 번에 예약할 크레딧
+        verify (bool): 다운로드한 모델을 로드해 한 번 실행해 보는 검증 단계 수행
+
+    Returns:
+        dict: run_id, batch, outcomes(결과 유형별 수), credits_used, credit_budget, budget_exhausted, counts(상태별 작업 수)
+    """
+    if compressor is None:
+        from netspresso_client import NetsPresssoQAClient
+        compressor = NetsPresssoQAClient(use_cache=False, precheck=False).compressor
+    instrument_methods(compressor, SDK_STAGE_SPANS)
+    batch = batch or default_batch()
+    run_id = queue.start_run(batch, credit_budget, max_concurrent)
+    budget_exhausted = threading.Event()
+    outcomes = Counter()
+    outcomes_lock = threading.Lock()
+
+    def worker():
+        while True:
+            # 예산을 다 쓰면 크레딧이 필요 없는 검증 단계 작업만 마저 처리
+            job = queue.claim(run_id, batch, stages=('verify',) if budget_exhausted.is_set() else None)
+            if job is None:
+                return
+            outcome = _process_job(queue, run_id, job, compressor, credits_per_job, verify, budget_exhausted)
+            with outcomes_lock:
+                outcomes[outcome] += 1
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            for future in [executor.submit(worker) for _ in range(max_concurrent)]:
+                future.result()
+    finally:
+        queue.finish_run(run_id)
+
+    run = queue.run_info(run_id)
+    return {
+        'run_id': run_id,
+        'batch': batch,
+        'outcomes': dict(outcomes),
+        'credits_used': run['credits_used'],
+        'credit_budget': credit_budget,
+        'budget_exhausted': budget_exhausted.is_set(),
+        'counts': queue.counts(batch)
+    }
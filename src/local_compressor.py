@@ -0,0 +1,370 @@
+"""
+오프라인 로컬 구조적 프루닝 엔진
+torch.fx.GraphModule의 Conv2d(+BatchNorm2d) 출력 채널을 필터 L1/L2 norm이 작은 순으로 compression_ratio만큼 제거하고
+뒤따르는 Conv2d / Linear의 입력 채널을 맞춰 줄임.
+NetsPresso automatic_compression과 같은 인자와 출력 폴더(metadata.json) 구조를 사용하므로
+서비스를 쓸 수 없거나 서비스가 모델을 거부할 때의 대체 압축, 원격 압축 결과를 비교할 로컬 기준선으로 사용
+"""
+
+import os
+import json
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import torch
+import torch.fx
+import torch.nn.functional as F
+
+from fake_compressor import FakeCompressionResult, NotValidFrameworkException, _create_unique_folder, write_error_metadata
+from model_tests import load_fx_model, run_fx_model
+from precheck import input_shapes_to_tensor_shapes
+from tracing import span
+from utils import save_test_result
+
+NORMS = {'l1': 1, 'l2': 2}
+# NetsPresso 압축 방식 이름
+METHODS = {'l1': 'PR_L1', 'l2': 'PR_L2'}
+
+# 값마다 독립적으로 동작하는 연산 (flatten 뒤에도 채널 순서를 그대로 전달)
+ELEMENTWISE_MODULES = (
+    torch.nn.ReLU, torch.nn.ReLU6, torch.nn.LeakyReLU, torch.nn.SiLU, torch.nn.GELU, torch.nn.Sigmoid,
+    torch.nn.Tanh, torch.nn.Hardswish, torch.nn.Hardsigmoid, torch.nn.Dropout, torch.nn.Identity,
+)
+ELEMENTWISE_FUNCTIONS = (
+    torch.relu, torch.sigmoid, torch.tanh, F.relu, F.relu6, F.leaky_relu, F.silu, F.gelu, F.hardswish, F.dropout,
+)
+ELEMENTWISE_METHODS = ('relu', 'sigmoid', 'tanh', 'contiguous')
+# 채널별로 공간 크기만 바꾸는 연산
+SPATIAL_MODULES = (
+    torch.nn.MaxPool2d, torch.nn.AvgPool2d, torch.nn.AdaptiveAvgPool2d, torch.nn.AdaptiveMaxPool2d, torch.nn.Upsample,
+)
+SPATIAL_FUNCTIONS = (F.max_pool2d, F.avg_pool2d, F.adaptive_avg_pool2d, F.adaptive_max_pool2d, F.interpolate)
+
+
+def channel_importance(weight, norm='l2'):
+    """출력 채널(필터)별 L1/L2 norm"""
+    return weight.detach().flatten(1).norm(p=NORMS[norm], dim=1)
+
+
+def _flattens_channels(node, modules):
+    """(N, C, ...) 텐서를 (N, C*...)로 펴는 노드인지 (채널이 열 방향으로 연속 배치됨)"""
+    if node.op == 'call_module':
+        module = modules[node.target]
+        return isinstance(module, torch.nn.Flatten) and module.start_dim == 1 and module.end_dim == -1
+    if node.op == 'call_function' and node.target is torch.flatten:
+        start_dim = node.args[1] if len(node.args) > 1 else node.kwargs.get('start_dim', 0)
+        end_dim = node.args[2] if len(node.args) > 2 else node.kwargs.get('end_dim', -1)
+        return start_dim == 1 and end_dim == -1
+    if node.op == 'call_method' and node.target == 'flatten':
+        start_dim = node.args[1] if len(node.args) > 1 else node.kwargs.get('start_dim', 0)
+        end_dim = node.args[2] if len(node.args) > 2 else node.kwargs.get('end_dim', -1)
+        return start_dim == 1 and end_dim == -1
+    return False
+
+
+def _channel_group(conv_node, modules, module_calls):
+    """
+    Conv2d 출력 채널을 따라가며 함께 줄여야 할 레이어 수집
+
+    채널별 연산(BatchNorm2d, 활성화, pooling, flatten)만 거쳐 Conv2d(groups=1) / Linear 입력으로 끝나야 함.
+    residual add, concat, 모델 출력처럼 채널 수가 다른 곳에 묶이는 경로가 하나라도 있으면 None
+
+    Returns:
+        dict: norms(BatchNorm2d), convs(입력 채널을 줄일 Conv2d), linears(flatten 뒤의 Linear) 또는 None
+    """
+    group = {'norms': [], 'convs': [], 'linears': []}
+    stack = [(conv_node, False)]
+    while stack:
+        node, flattened = stack.pop()
+        for user in node.users:
+            # 이 채널 텐서 하나만 입력으로 받는 노드만 따라감
+            if user.all_input_nodes != [node] or not user.args or user.args[0] is not node:
+                return None
+            if user.op == 'call_module':
+                module = modules[user.target]
+                # 여러 번 호출되는 모듈은 다른 경로의 채널 수도 바뀌므로 제외
+                if module_calls[user.target] != 1:
+                    return None
+                if isinstance(module, torch.nn.Conv2d) and module.groups == 1 and not flattened:
+                    group['convs'].append(module)
+                elif isinstance(module, torch.nn.Linear) and flattened:
+                    group['linears'].append(module)
+                elif isinstance(module, torch.nn.BatchNorm2d) and not flattened:
+                    group['norms'].append(module)
+                    stack.append((user, flattened))
+                elif isinstance(module, ELEMENTWISE_MODULES):
+                    stack.append((user, flattened))
+                elif isinstance(module, SPATIAL_MODULES) and not flattened:
+                    stack.append((user, flattened))
+                elif _flattens_channels(user, modules) and not flattened:
+                    stack.append((user, True))
+                else:
+                    return None
+            elif user.op == 'call_function' and user.target in ELEMENTWISE_FUNCTIONS:
+                stack.append((user, flattened))
+            elif user.op == 'call_function' and user.target in SPATIAL_FUNCTIONS and not flattened:
+                stack.append((user, flattened))
+            elif user.op == 'call_method' and user.target in ELEMENTWISE_METHODS:
+                stack.append((user, flattened))
+            elif _flattens_channels(user, modules) and not flattened:
+                stack.append((user, True))
+            else:
+                return None
+    return group
+
+
+def _select(module, name, dim, index):
+    """파라미터/버퍼를 index 위치만 남긴 텐서로 교체"""
+    tensor = getattr(module, name)
+    if tensor is None:
+        return
+    selected = tensor.detach().index_select(dim, index).clone()
+    if isinstance(tensor, torch.nn.Parameter):
+        selected = torch.nn.Parameter(selected, requires_grad=tensor.requires_grad)
+    setattr(module, name, selected)
+
+
+def prune_graph_module(graph_module, compression_ratio, norm='l2'):
+    """
+    GraphModule을 제자리에서 채널 프루닝
+
+    프루닝 가능한 Conv2d마다 출력 채널의 compression_ratio 비율(최소 1개는 남김)을 필터 norm이 작은 순으로 제거.
+    그래프 구조는 그대로이고 모듈의 가중치와 채널 수만 바뀜
+
+    Returns:
+        list: 줄인 레이어별 {'layer', 'channels', 'kept'}
+    """
+    if norm not in NORMS:
+        raise ValueError(f"지원하지 않는 norm: {norm} (지원: {', '.join(NORMS)})")
+    if not 0 <= compression_ratio < 1:
+        raise ValueError(f"compression_ratio는 0 이상 1 미만이어야 함: {compression_ratio}")
+
+    modules = dict(graph_module.named_modules())
+    module_calls = Counter(node.target for node in graph_module.graph.nodes if node.op == 'call_module')
+    pruned = []
+    for node in graph_module.graph.nodes:
+        if node.op != 'call_module' or not isinstance(modules[node.target], torch.nn.Conv2d):
+            continue
+        conv = modules[node.target]
+        if conv.groups != 1 or module_calls[node.target] != 1:
+            continue
+        group = _channel_group(node, modules, module_calls)
+        if group is None:
+            continue
+
+        channels = conv.out_channels
+        if any(linear.in_features % channels for linear in group['linears']):
+            continue
+        kept = max(1, channels - int(channels * compression_ratio + 0.5))
+        if kept == channels:
+            continue
+        keep = channel_importance(conv.weight, norm).topk(kept).indices.sort().values
+
+        with torch.no_grad():
+            _select(conv, 'weight', 0, keep)
+            _select(conv, 'bias', 0, keep)
+            conv.out_channels = kept
+            for bn in group['norms']:
+                for name in ('weight', 'bias', 'running_mean', 'running_var'):
+                    _select(bn, name, 0, keep)
+                bn.num_features = kept
+            for consumer in group['convs']:
+                _select(consumer, 'weight', 1, keep)
+                consumer.in_channels = kept
+            for linear in group['linears']:
+                # flatten 결과는 채널마다 공간 위치 spatial개가 이어진 열
+                spatial = linear.in_features // channels
+                columns = (keep[:, None] * spatial + torch.arange(spatial)).flatten()
+                _select(linear, 'weight', 1, columns)
+                linear.in_features = kept * spatial
+        pruned.append({'layer': node.target, 'channels': channels, 'kept': kept})
+    return pruned
+
+
+def _count_params(model):
+    return sum(p.numel() for p in model.parameters())
+
+
+class LocalCompressor:
+    """
+    NetsPresso compressor_v2()와 같은 automatic_compression 인터페이스의 로컬 채널 프루닝 backend
+
+    Args:
+        norm (str): 채널 중요도 기준 'l2'(PR_L2) 또는 'l1'(PR_L1)
+        verify (bool): 저장 전에 input_shapes 입력으로 한 번 실행해 출력 형태가 원본과 같은지 확인
+        raise_errors (bool): 실패를 SDK처럼 status='error' metadata로 반환하지 않고 예외로 냄
+    """
+
+    backend = 'local'
+
+    def __init__(self, norm='l2', verify=True, raise_errors=False):
+        if norm not in NORMS:
+            raise ValueError(f"지원하지 않는 norm: {norm} (지원: {', '.join(NORMS)})")
+        self.norm = norm
+        self.verify = verify
+        self.raise_errors = raise_errors
+        self._lock = threading.Lock()
+        self.stats = {'calls': 0, 'completed': 0, 'failed': 0, 'credits_consumed': 0}
+
+    def automatic_compression(self, input_model_path, output_dir, input_shapes,
+                              framework='pytorch', compression_ratio=0.5):
+        """
+        NetsPresso automatic_compression과 같은 인자로 로컬 프루닝 후 결과 폴더 기록
+
+        SDK처럼 실패하면 출력 폴더에 status='error' metadata.json을 남기고 그 결과를 반환
+        """
+        with self._lock:
+            self.stats['calls'] += 1
+        try:
+            metadata = self._compress(input_model_path, output_dir, input_shapes, framework, compression_ratio)
+        except Exception as e:
+            with self._lock:
+                self.stats['failed'] += 1
+            if self.raise_errors:
+                raise
+            return FakeCompressionResult(write_error_metadata(input_model_path, output_dir, input_shapes, framework,
+                                                              compression_ratio, e, method=METHODS[self.norm],
+                                                              backend=self.backend))
+        with self._lock:
+            self.stats['completed'] += 1
+        return FakeCompressionResult(metadata)
+
+    def _compress(self, input_model_path, output_dir, input_shapes, framework, compression_ratio):
+        if not os.path.exists(input_model_path):
+            raise FileNotFoundError(f"모델 파일이 존재하지 않음: {input_model_path}")
+        if framework != 'pytorch':
+            raise NotValidFrameworkException(f"NotValidFrameworkException: 로컬 압축은 pytorch만 지원 ({framework})")
+
+        with span('load'):
+            try:
+                model = load_fx_model(input_model_path)
+            except Exception as e:
+                raise NotValidFrameworkException(
+                    f"NotValidFrameworkException: torch.fx.GraphModule로 로드할 수 없음 ({type(e).__name__}: {e})"
+                ) from e
+            if not isinstance(model, torch.fx.GraphModule):
+                raise NotValidFrameworkException(
+                    f"NotValidFrameworkException: torch.fx.GraphModule이 아님: {type(model).__name__}"
+                )
+
+        example_inputs = [torch.randn(*shape) for shape in input_shapes_to_tensor_shapes(input_shapes)]
+        if self.verify:
+            expected_shape = run_fx_model(model, *example_inputs).shape
+        original_params = _count_params(model)
+
+        with span('compression', ratio=compression_ratio):
+            pruned = prune_graph_module(model, compression_ratio, norm=self.norm)
+            if self.verify:
+                actual_shape = run_fx_model(model, *example_inputs).shape
+                if actual_shape != expected_shape:
+                    raise RuntimeError(f"프루닝 후 출력 형태가 바뀜: {tuple(expected_shape)} → {tuple(actual_shape)}")
+
+        with span('save'):
+            output_path = _create_unique_folder(output_dir)
+            compressed_path = output_path / f"{Path(input_model_path).stem}_compressed.pt"
+            torch.save(model, compressed_path)
+
+            metadata = {
+                'status': 'completed',
+                'task_type': 'compress',
+                'input_model_path': Path(input_model_path).resolve().as_posix(),
+                'compressed_model_path': str(compressed_path),
+                'model_id': str(uuid.uuid4()),
+                'compressed_model_id': str(uuid.uuid4()),
+                'model_info': {
+                    'framework': str(framework),
+                    'input_shapes': input_shapes
+                },
+                'compression_info': {
+                    'method': METHODS[self.norm],
+                    'ratio': compression_ratio,
+                    'layers': pruned
+                },
+                'results': {
+                    'original_model': {'size': os.path.getsize(input_model_path), 'params': original_params},
+                    'compressed_model': {'size': os.path.getsize(compressed_path), 'params': _count_params(model)}
+                },
+                'credits_consumed': 0,
+                'backend': self.backend
+            }
+            with open(output_path / 'metadata.json', 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, ensure_ascii=False, indent=2)
+        return metadata
+
+
+class LocalNetsPresso:
+    """NetsPresso 객체 대역: compressor_v2()로 LocalCompressor를 반환"""
+
+    def __init__(self, **compressor_options):
+        self.compressor_options = compressor_options
+
+    def compressor_v2(self):
+        return LocalCompressor(**self.compressor_options)
+
+
+def compare_backends(clients, model_path, output_root, input_shapes=None, compression_ratio=0.5,
+                     warmup=3, iterations=20, seed=0):
+    """
+    같은 모델을 여러 backend로 압축해 크기 / 파라미터 수 / 지연 시간 / 출력 편차를 나란히 비교
+
+    Args:
+        clients (dict): backend 이름 → NetsPresssoQAClient (예: {'local': ..., 'remote': ...})
+
+    Returns:
+        dict: model_path, compression_ratio, original(size, params, latency), backends(clients 순서의 backend별 행 목록)
+    """
+    from ratio_sweep import DEFAULT_INPUT_SHAPES, measure_latency, output_deviation
+
+    input_shapes = input_shapes or DEFAULT_INPUT_SHAPES
+    generator = torch.Generator().manual_seed(seed)
+    example_inputs = [torch.randn(*shape, generator=generator)
+                      for shape in input_shapes_to_tensor_shapes(input_shapes)]
+    original = load_fx_model(model_path)
+    original_size = os.path.getsize(model_path)
+    original_latency = measure_latency(original, *example_inputs, warmup=warmup, iterations=iterations)
+
+    rows = []
+    for name, client in clients.items():
+        result = client.compress(model_path, os.path.join(output_root, name),
+                                 input_shapes=input_shapes, compression_ratio=compression_ratio)
+        row = {
+            'backend': name,
+            'success': result['success'],
+            'status': result['status'],
+            'error': result.get('error'),
+            'error_type': result.get('error_type'),
+            'compression_time': result.get('duration'),
+            'compressed_path': result.get('compressed_path')
+        }
+        if result['success'] and row['compressed_path']:
+            compressed = load_fx_model(row['compressed_path'])
+            latency = measure_latency(compressed, *example_inputs, warmup=warmup, iterations=iterations)
+            compressed_size = os.path.getsize(row['compressed_path'])
+            row.update({
+                'compressed_size': compressed_size,
+                'size_ratio': compressed_size / original_size if original_size else None,
+                'params': _count_params(compressed),
+                'latency': latency,
+                'speedup': original_latency / latency if latency > 0 else None,
+                'deviation': output_deviation(original, compressed, *example_inputs)
+            })
+        rows.append(row)
+
+    return {
+        'model_path': str(model_path),
+        'input_shapes': input_shapes,
+        'compression_ratio': compression_ratio,
+        'original': {'size': original_size, 'params': _count_params(original), 'latency': original_latency},
+        'backends': rows,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def save_backend_comparison(comparison, output_path):
+    """backend 비교 결과를 표준 결과 JSON으로 저장 (generate_qa_report가 로컬 vs 원격 섹션으로 표시)"""
+    success = any(row['success'] for row in comparison['backends'])
+    save_test_result({'success': success, 'backend_comparison': comparison}, output_path)
+    return output_path
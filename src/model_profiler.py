@@ -0,0 +1,179 @@
+"""
+정적 모델 프로파일러
+torch.fx shape propagation으로 노드별 파라미터 수, MACs/FLOPs, 활성화 메모리와 최대 활성화 메모리를 계산
+"""
+
+import os
+import json
+from pathlib import Path
+
+import torch
+import torch.fx
+from torch.fx.passes.shape_prop import ShapeProp
+
+from model_tests import load_fx_model, trace_fx_model
+from utils import hash_file
+
+DEFAULT_PROFILE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'netspresso_qa', 'profiles')
+
+ELEMENTWISE_MODULES = (
+    torch.nn.BatchNorm1d, torch.nn.BatchNorm2d, torch.nn.ReLU, torch.nn.ReLU6, torch.nn.LeakyReLU,
+    torch.nn.SiLU, torch.nn.GELU, torch.nn.Sigmoid, torch.nn.Tanh, torch.nn.Hardswish,
+    torch.nn.Hardsigmoid, torch.nn.MaxPool2d, torch.nn.AvgPool2d, torch.nn.AdaptiveAvgPool2d,
+    torch.nn.AdaptiveMaxPool2d, torch.nn.Upsample, torch.nn.Softmax, torch.nn.LayerNorm, torch.nn.GroupNorm,
+)
+
+
+def _tensor_metas(node):
+    """노드 출력의 TensorMetadata 목록 (튜플 출력이면 여러 개)"""
+    meta = node.meta.get('tensor_meta')
+    if meta is None:
+        return []
+    if isinstance(meta, (list, tuple)) and not hasattr(meta, 'shape'):
+        return [m for m in meta if hasattr(m, 'shape')]
+    return [meta]
+
+
+def _numel(shape):
+    count = 1
+    for dim in shape:
+        count *= dim
+    return count
+
+
+def _activation_bytes(node):
+    return sum(_numel(m.shape) * torch.empty((), dtype=m.dtype).element_size() for m in _tensor_metas(node))
+
+
+def _module_macs(module, input_shape, output_shape):
+    """모듈 한 번 호출의 MAC 수"""
+    if isinstance(module, torch.nn.Conv2d) or isinstance(module, torch.nn.Conv1d):
+        kernel = _numel(module.kernel_size)
+        return _numel(output_shape) * (module.in_channels // module.groups) * kernel
+    if isinstance(module, torch.nn.ConvTranspose2d):
+        kernel = _numel(module.kernel_size)
+        return _numel(input_shape) * (module.out_channels // module.groups) * kernel
+    if isinstance(module, torch.nn.Linear):
+        return _numel(output_shape) * module.in_features
+    return 0
+
+
+def profile_graph_module(graph_module, input_shape=(1, 3, 224, 224)):
+    """
+    GraphModule을 input_shape로 shape propagation하여 노드별 비용 계산
+
+    Returns:
+        dict: nodes(노드별 params/macs/flops/activation_bytes), totals, peak_activation_bytes
+    """
+    graph_module = trace_fx_model(graph_module)
+    graph_module.eval()
+    with torch.no_grad():
+        ShapeProp(graph_module).propagate(torch.zeros(*input_shape))
+
+    modules = dict(graph_module.named_modules())
+    nodes = list(graph_module.graph.nodes)
+    counted_modules = set()
+    rows = []
+
+    for node in nodes:
+        metas = _tensor_metas(node)
+        output_shape = tuple(metas[0].shape) if metas else ()
+        params = macs = flops = 0
+
+        if node.op == 'call_module':
+            module = modules[node.target]
+            # 같은 모듈을 여러 번 호출해도 파라미터는 한 번만 집계
+            if node.target not in counted_modules:
+                params = sum(p.numel() for p in module.parameters(recurse=False))
+                counted_modules.add(node.target)
+            input_node = next((a for a in node.args if isinstance(a, torch.fx.Node)), None)
+            input_metas = _tensor_metas(input_node) if input_node is not None else []
+            input_shape_ = tuple(input_metas[0].shape) if input_metas else ()
+            macs = _module_macs(module, input_shape_, output_shape)
+            flops = 2 * macs
+            if not macs and isinstance(module, ELEMENTWISE_MODULES):
+                flops = _numel(output_shape)
+        elif node.op in ('call_function', 'call_method') and metas:
+            flops = _numel(output_shape)
+
+        rows.append({
+            'name': node.name,
+            'op': node.op,
+            'target': type(modules[node.target]).__name__ if node.op == 'call_module'
+            else getattr(node.target, '__name__', str(node.target)),
+            'output_shape': list(output_shape),
+            'params': params,
+            'macs': macs,
+            'flops': flops,
+            'activation_bytes': _activation_bytes(node) if node.op != 'output' else 0
+        })
+
+    return {
+        'input_shape': list(input_shape),
+        'nodes': rows,
+        'totals': {
+            'params': sum(r['params'] for r in rows),
+            'macs': sum(r['macs'] for r in rows),
+            'flops': sum(r['flops'] for r in rows),
+            'activation_bytes': sum(r['activation_bytes'] for r in rows)
+        },
+        'peak_activation_bytes': _peak_activation_bytes(nodes)
+    }
+
+
+def _peak_activation_bytes(nodes):
+    """실행 순서대로 노드 출력을 할당하고 마지막 사용 직후 해제했을 때 동시에 살아 있는 최대 바이트"""
+    position = {node: i for i, node in enumerate(nodes)}
+    last_use = {}
+    for node in nodes:
+        for user in node.users:
+            last_use[node] = max(last_use.get(node, 0), position[user])
+
+    releases = {}
+    for node, index in last_use.items():
+        releases.setdefault(index, []).append(node)
+
+    live = peak = 0
+    sizes = {}
+    for index, node in enumerate(nodes):
+        if node.op != 'output':
+            sizes[node] = _activation_bytes(node)
+            live += sizes[node]
+            peak = max(peak, live)
+        for released in releases.get(index, []):
+            live -= sizes.get(released, 0)
+    return peak
+
+
+def profile_model(model_path, input_shape=(1, 3, 224, 224), cache_dir=None):
+    """
+    모델 파일 프로파일링. 결과는 (모델 해시, input_shape) 단위로 디스크에 캐시
+
+    Returns:
+        dict: profile_graph_module 결과에 model_hash, cached 추가
+    """
+    cache_dir = Path(cache_dir or os.getenv('NETSPRESSO_PROFILE_CACHE_DIR', DEFAULT_PROFILE_CACHE_DIR))
+    model_hash = hash_file(model_path)
+    shape_key = 'x'.join(str(d) for d in input_shape)
+    cache_path = cache_dir / f"{model_hash}_{shape_key}.json"
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                profile = json.load(f)
+            profile['cached'] = True
+            return profile
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    profile = profile_graph_module(load_fx_model(model_path), input_shape)
+    profile['model_hash'] = model_hash
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
+    profile['cached'] = False
+    return profile
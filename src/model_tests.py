@@ -5,6 +5,9 @@
 import torch
 import torch.fx
 
+from fx_artifact import FX_LOCK, is_fx_artifact, load_fx_artifact, save_fx_artifact
+from tracing import span
+
 def create_simple_test_model():
     """간단한 테스트용 CNN 모델"""
     class SimpleCNN(torch.nn.Module):
@@ -70,27 +73,115 @@ def create_yolo_compatible_model():
     
     return YOLOCompatibleModel()
 
-def save_fx_model(model, path):
-    """모델을 torch.fx.GraphModule로 변환 후 저장"""
+def create_parametric_model(depth=4, width=32, head_channels=512, num_classes=80, kind='yolo',
+                            max_channels=1024, batch_norm=True, max_pools=5):
+    """
+    크기를 조절할 수 있는 torch.fx 호환 CNN / YOLO 유사 모델
+
+    backbone은 Conv3x3(+BN)+ReLU(+MaxPool) 블록 depth개이며 채널은 width부터 블록마다 2배 (max_channels 상한).
+    기본값(depth=4, width=32, head_channels=512)은 create_yolo_compatible_model과 같은 구조
+
+    Args:
+        depth (int): backbone 블록 수
+        width (int): 첫 블록 채널 수
+        head_channels (int): kind='yolo'면 detection head의 3x3 conv 채널, 'cnn'이면 분류기 은닉층 크기
+        num_classes (int): 클래스 수 (yolo 출력 채널은 5 + num_classes)
+        kind (str): 'yolo'(conv detection head) 또는 'cnn'(global pool + fc 분류기)
+        max_pools (int): 앞에서부터 MaxPool을 붙일 블록 수 (224 입력이면 5개에서 7x7)
+    """
+    if kind not in ('yolo', 'cnn'):
+        raise ValueError(f"지원하지 않는 모델 종류: {kind}")
+
+    class ParametricModel(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            layers = []
+            in_channels = 3
+            for index in range(depth):
+                out_channels = min(width * 2 ** index, max_channels)
+                layers.append(torch.nn.Conv2d(in_channels, out_channels, 3, padding=1))
+                if batch_norm:
+                    layers.append(torch.nn.BatchNorm2d(out_channels))
+                layers.append(torch.nn.ReLU())
+                if index < max_pools:
+                    layers.append(torch.nn.MaxPool2d(2))
+                in_channels = out_channels
+            self.backbone = torch.nn.Sequential(*layers)
+
+            if kind == 'yolo':
+                self.head = torch.nn.Sequential(
+                    torch.nn.Conv2d(in_channels, head_channels, 3, padding=1),
+                    torch.nn.ReLU(),
+                    torch.nn.Conv2d(head_channels, 5 + num_classes, 1),  # bbox + classes
+                )
+            else:
+                self.head = torch.nn.Sequential(
+                    torch.nn.AdaptiveAvgPool2d((1, 1)),
+                    torch.nn.Flatten(),
+                    torch.nn.Linear(in_channels, head_channels),
+                    torch.nn.ReLU(),
+                    torch.nn.Linear(head_channels, num_classes),
+                )
+
+        def forward(self, x):
+            return self.head(self.backbone(x))
+
+    return ParametricModel()
+
+def trace_fx_model(model):
+    """모델을 torch.fx.GraphModule로 변환 (이미 GraphModule이면 그대로 반환)"""
+    if isinstance(model, torch.fx.GraphModule):
+        return model
+    with FX_LOCK:
+        return torch.fx.symbolic_trace(model)
+
+def save_fx_model(model, path, format='torch'):
+    """
+    모델을 torch.fx.GraphModule로 변환 후 저장
+    
+    format='torch'는 NetsPresso 업로드용 torch.save 포맷,
+    format='fxa'는 로컬 검증용 mmap 아티팩트 포맷(fx_artifact)
+    """
     try:
-        fx_model = torch.fx.symbolic_trace(model)
-        torch.save(fx_model, path)
+        with span('trace'):
+            fx_model = trace_fx_model(model)
+        with span('save', format=format):
+            if format == 'fxa':
+                save_fx_artifact(fx_model, path)
+            else:
+                torch.save(fx_model, path)
         return True
     except Exception as e:
         print(f"FX 변환 실패: {e}")
         return False
 
-def verify_fx_model(model_path):
+def load_fx_model(model_path):
+    """
+    저장된 모델 로드 (.fxa 아티팩트는 자동 감지하여 mmap으로 로드)
+    
+    torch.save 포맷의 GraphModule은 pickle 객체이므로 weights_only=False
+    """
+    if is_fx_artifact(model_path):
+        return load_fx_artifact(model_path)
+    with FX_LOCK:
+        return torch.load(model_path, map_location='cpu', weights_only=False)
+
+def run_fx_model(model, *example_inputs):
+    """추론 모드로 1회 실행하여 출력 반환 (다른 스레드의 트레이싱과 겹치지 않게 FX_LOCK 안에서)"""
+    model.eval()
+    with FX_LOCK, torch.no_grad():
+        return model(*example_inputs)
+
+def verify_fx_model(model_path, input_shape=(1, 3, 224, 224)):
     """저장된 모델이 올바른 torch.fx.GraphModule인지 확인"""
     try:
-        model = torch.load(model_path, map_location='cpu')
+        model = load_fx_model(model_path)
         is_fx = isinstance(model, torch.fx.GraphModule)
         
         if is_fx:
             # 간단한 실행 테스트
-            example_input = torch.randn(1, 3, 224, 224)
-            with torch.no_grad():
-                output = model(example_input)
+            example_input = torch.randn(*input_shape)
+            output = run_fx_model(model, example_input)
             return True, f"FX 모델 검증 성공. 출력 형태: {output.shape}"
         else:
             return False, f"torch.fx.GraphModule이 아님: {type(model)}"
@@ -3,43 +3,205 @@ NetsPresso QA 테스트용 클라이언트
 """
 
 import os
-from netspresso import NetsPresso
-import torch
-import torch.fx
+import shutil
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# torch에 의존하는 precheck / trace_cache는 사용하는 곳에서 import (모듈 import만으로 torch를 불러오지 않음)
+from client_pool import get_pooled_netspresso
+from compression_cache import CompressionCache
+from fake_compressor import FakeNetsPresso
+from tracing import Tracer, current_tracer, export_chrome_trace, instrument_methods, span, stage_durations
+
+DEFAULT_INPUT_SHAPES = [{"batch": 1, "channel": 3, "dimension": [224, 224]}]
+DEFAULT_COMPRESSION_RATIO = 0.5
+
+# NetsPresso SDK compressor 내부 단계 → span 이름
+# 서버 측 압축 요청은 SDK 모듈 함수라 감쌀 수 없으므로 automatic_compression span의 self 시간으로 나타남
+SDK_STAGE_SPANS = {
+    'validate_token_and_check_credit': 'credit_check',
+    'upload_model': 'upload',
+    'get_compression': 'status_polling',
+    'get_model': 'status_polling',
+    'download_model': 'download'
+}
+
+def compression_error(result):
+    """
+    automatic_compression 결과가 실패면 (오류 메시지, 오류 유형), 성공이면 None
+
+    실제 SDK는 예외를 밖으로 내지 않고 status='error'(또는 중단 시 'stopped') metadata를 반환하며
+    원인은 error_detail(name, message)에 담김. completed인데 모델 경로가 없어도 실패로 봄
+    """
+    status = getattr(result, 'status', None)
+    status = getattr(status, 'value', status)
+    compressed_path = getattr(result, 'compressed_model_path', None)
+    if status == 'completed' and compressed_path:
+        return None
+
+    detail = getattr(result, 'error_detail', None)
+    if isinstance(detail, dict):
+        message, name = detail.get('message'), detail.get('name')
+    else:
+        message, name = getattr(detail, 'message', None), getattr(detail, 'name', None)
+    if status == 'stopped':
+        return message or "압축 작업이 중단됨 (status=stopped)", name or 'CompressionStopped'
+    if status == 'completed':
+        return "압축은 완료됐지만 결과에 모델 경로가 없음", 'MissingCompressedModel'
+    return message or f"압축 실패 (status={status})", name or 'CompressionError'
+
 
 class NetsPresssoQAClient:
     """QA 테스트용 NetsPresso 클라이언트"""
     
-    def __init__(self):
-        api_key = os.getenv('NETSPRESSO_API_KEY', 'np-rlKs4kiEU5n27qLmtFySjD1pAX79IENd')
-        self.netspresso = NetsPresso(api_key=api_key)
-        self.compressor = self.netspresso.compressor_v2()
+    def __init__(self, compressor=None, use_cache=True, cache=None, precheck=True):
+        # compressor를 직접 넘기면 로그인 없이 해당 백엔드를 사용
+        # NETSPRESSO_FAKE_BACKEND=1 이면 오프라인 대역(fake_compressor),
+        # NETSPRESSO_LOCAL_BACKEND=1 이면 로컬 채널 프루닝 엔진(local_compressor, torch 필요) 사용
+        if compressor is None:
+            if os.getenv('NETSPRESSO_FAKE_BACKEND') == '1':
+                self.netspresso = FakeNetsPresso()
+            elif os.getenv('NETSPRESSO_LOCAL_BACKEND') == '1':
+                from local_compressor import LocalNetsPresso
+                self.netspresso = LocalNetsPresso()
+            else:
+                api_key = os.getenv('NETSPRESSO_API_KEY', 'np-rlKs4kiEU5n27qLmtFySjD1pAX79IENd')
+                # 프로세스 안에서 공유하는 객체 (연결 풀 + 디스크 토큰 캐시, 토큰은 첫 요청 때 발급 / 401이면 재발급)
+                self.netspresso = get_pooled_netspresso(api_key)
+            compressor = self.netspresso.compressor_v2()
+        else:
+            self.netspresso = None
+        # 캐시 키에 넣을 backend 이름 (원격 서비스와 대역은 None)
+        self.backend = getattr(compressor, 'backend', None)
+        self.compressor = instrument_methods(compressor, SDK_STAGE_SPANS)
+        
+        # NETSPRESSO_NO_CACHE=1 이면 캐시 비활성화 (CLI/pytest의 --no-cache)
+        if os.getenv('NETSPRESSO_NO_CACHE') == '1':
+            use_cache = False
+        self.cache = (cache or CompressionCache()) if use_cache else None
+        self.precheck = precheck
     
     def test_simple_compression(self, model_path, output_dir):
         """간단한 모델 압축 테스트"""
+        return self.compress(model_path, output_dir)
+    
+    def compress(self, model_path, output_dir, input_shapes=None, compression_ratio=DEFAULT_COMPRESSION_RATIO):
+        """
+        automatic_compression 1회 실행 후 결과 dict 반환
+        
+        결과의 spans는 단계별 타이밍(tracing.Tracer 형식), stages는 단계별 총/self 시간.
+        바깥에 활성 Tracer가 있으면 같은 span을 그 Tracer에도 넣음
+        """
+        start = time.perf_counter()
+        tracer = Tracer()
+        with tracer.activate(), tracer.span('compress', model_path=model_path, ratio=compression_ratio):
+            result = self._compress(model_path, output_dir, input_shapes or DEFAULT_INPUT_SHAPES, compression_ratio)
+        result['duration'] = time.perf_counter() - start
+        result['spans'] = tracer.spans
+        result['stages'] = stage_durations(tracer.spans)
+        outer = current_tracer()
+        if outer is not None:
+            outer.add_spans(tracer.spans)
+        return result
+    
+    def _compress(self, model_path, output_dir, input_shapes, compression_ratio):
         try:
-            result = self.compressor.automatic_compression(
-                input_model_path=model_path,
-                output_dir=output_dir,
-                input_shapes=[{"batch": 1, "channel": 3, "dimension": [224, 224]}],
-                compression_ratio=0.5
-            )
-            return {
+            cache_key = None
+            if self.cache is not None:
+                with span('cache_lookup') as span_args:
+                    cache_key = self.cache.make_key(model_path, input_shapes, compression_ratio, backend=self.backend)
+                    cached = self.cache.get(cache_key, output_dir)
+                    span_args['hit'] = cached is not None
+                if cached is not None:
+                    return cached
+            
+            # 업로드 전 로컬 호환성 검사: 서버에서 실패할 모델은 즉시 거부
+            if self.precheck:
+                from precheck import precheck_model
+                with span('precheck'):
+                    precheck = precheck_model(model_path, input_shapes)
+                if not precheck['compatible']:
+                    return {
+                        'success': False,
+                        'status': 'precheck_failed',
+                        'compressed_path': None,
+                        'error': precheck['reason'],
+                        'error_type': 'PrecheckError',
+                        'precheck': precheck
+                    }
+            
+            with span('automatic_compression'):
+                result = self.compressor.automatic_compression(
+                    input_model_path=model_path,
+                    output_dir=output_dir,
+                    input_shapes=input_shapes,
+                    compression_ratio=compression_ratio
+                )
+            # SDK는 실패해도 예외 대신 status='error' metadata를 반환
+            error = compression_error(result)
+            if error is not None:
+                return {
+                    'success': False,
+                    'status': getattr(result.status, 'value', result.status),
+                    'compressed_path': None,
+                    'error': error[0],
+                    'error_type': error[1]
+                }
+            compressed = {
                 'success': True,
                 'status': result.status,
-                'compressed_path': getattr(result, 'compressed_model_path', None),
-                'error': None
+                'compressed_path': result.compressed_model_path,
+                'error': None,
+                'cached': False
             }
+            if cache_key is not None:
+                with span('cache_store'):
+                    self.cache.put(cache_key, compressed)
+            return compressed
         except Exception as e:
             return {
                 'success': False,
                 'status': 'error',
                 'compressed_path': None,
-                'error': str(e)
+                'error': str(e),
+                'error_type': type(e).__name__
+            }
+    
+    def compress_many(self, jobs, max_workers=4):
+        """
+        여러 모델을 스레드 풀로 동시에 압축하고, 끝나는 순서대로 결과를 yield
+        
+        Args:
+            jobs (list): 각 항목은 compress()의 인자 dict
+                (model_path, output_dir, [input_shapes], [compression_ratio])
+            max_workers (int): 동시에 실행할 최대 작업 수
+        
+        Yields:
+            dict: compress() 결과에 job_index, model_path, wall_time(배치 시작 후 경과 시간) 추가
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return
+        
+        batch_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+            futures = {
+                executor.submit(self.compress, **job): index
+                for index, job in enumerate(jobs)
             }
+            for future in as_completed(futures):
+                index = futures[future]
+                result = future.result()
+                result['job_index'] = index
+                result['model_path'] = jobs[index]['model_path']
+                result['wall_time'] = time.perf_counter() - batch_start
+                yield result
 
 def create_simple_test_model():
     """간단한 테스트용 CNN 모델"""
+    import torch
+
     class SimpleCNN(torch.nn.Module):
         def __init__(self):
             super().__init__()
@@ -58,16 +220,30 @@ def create_simple_test_model():
     return SimpleCNN()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NetsPresso 기본 압축 테스트")
+    parser.add_argument('--no-cache', action='store_true', help="압축 결과 캐시를 사용하지 않음")
+    parser.add_argument('--fake', action='store_true', help="실제 서비스 대신 오프라인 대역 backend 사용")
+    parser.add_argument('--trace', metavar='PATH', help="단계별 타이밍을 Chrome trace JSON으로 저장 (Perfetto에서 열기)")
+    args = parser.parse_args()
+    if args.fake:
+        os.environ['NETSPRESSO_FAKE_BACKEND'] = '1'
+    
     # 기본 테스트
-    client = NetsPresssoQAClient()
+    client = NetsPresssoQAClient(use_cache=not args.no_cache)
     
-    # 간단한 모델 생성 및 테스트
-    model = create_simple_test_model()
-    fx_model = torch.fx.symbolic_trace(model)
+    from trace_cache import get_traced_model_path
     
-    # 임시 저장
-    torch.save(fx_model, "temp_simple_model.pt")
+    tracer = Tracer()
+    with tracer.activate():
+        # 간단한 모델 생성 및 테스트 (trace 결과는 세션 간 캐시에서 재사용)
+        shutil.copyfile(get_traced_model_path(create_simple_test_model), "temp_simple_model.pt")
+        
+        # 압축 테스트
+        result = client.test_simple_compression("temp_simple_model.pt", "./results/test")
     
-    # 압축 테스트
-    result = client.test_simple_compression("temp_simple_model.pt", "./results/test")
-    print(f"테스트 결과: {result}")
\ No newline at end of file
+    spans = result.pop('spans')
+    print(f"테스트 결과: {result}")
+    for name, stage in result['stages'].items():
+        print(f"   {name}: {stage['total']:.3f}초 (self {stage['self']:.3f}초, {stage['count']}회)")
+    if args.trace:
+        print(f"trace 저장됨: {export_chrome_trace(tracer.spans, args.trace)}")
\ No newline at end of file
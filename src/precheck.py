@@ -0,0 +1,187 @@
+"""
+업로드 전 로컬 호환성 사전 검증
+네트워크 호출 전에 NetsPresso Python SDK가 거부할 모델을 빠르게 걸러냄
+"""
+
+import os
+import time
+import operator
+
+import torch
+import torch.fx
+import torch.nn.functional as F
+
+from fx_artifact import FX_LOCK, is_fx_artifact
+from model_tests import load_fx_model, run_fx_model
+
+SUPPORTED_EXTENSIONS = ('.pt', '.pth')
+
+SUPPORTED_MODULES = (
+    torch.nn.Conv1d, torch.nn.Conv2d, torch.nn.ConvTranspose2d, torch.nn.Linear,
+    torch.nn.BatchNorm1d, torch.nn.BatchNorm2d, torch.nn.LayerNorm, torch.nn.GroupNorm,
+    torch.nn.ReLU, torch.nn.ReLU6, torch.nn.LeakyReLU, torch.nn.SiLU, torch.nn.GELU,
+    torch.nn.Sigmoid, torch.nn.Tanh, torch.nn.Hardswish, torch.nn.Hardsigmoid,
+    torch.nn.MaxPool2d, torch.nn.AvgPool2d, torch.nn.AdaptiveAvgPool2d, torch.nn.AdaptiveMaxPool2d,
+    torch.nn.Upsample, torch.nn.Dropout, torch.nn.Identity, torch.nn.Flatten, torch.nn.Softmax,
+)
+
+SUPPORTED_FUNCTIONS = {
+    torch.relu, torch.sigmoid, torch.tanh, torch.flatten, torch.cat, torch.add, torch.mul,
+    torch.reshape, torch.mean, torch.softmax,
+    F.relu, F.relu6, F.silu, F.gelu, F.sigmoid, F.hardswish, F.leaky_relu,
+    F.max_pool2d, F.avg_pool2d, F.adaptive_avg_pool2d, F.interpolate, F.softmax,
+    operator.add, operator.mul, operator.sub, operator.truediv, operator.getitem,
+    # x.shape[0] // 2 처럼 shape에서 계산하는 정수 연산
+    operator.floordiv, operator.mod, operator.neg,
+}
+
+# x.shape / x.dtype / x.device 접근은 builtin getattr 호출 노드로 trace됨. 이 속성들만 허용
+SUPPORTED_ATTRIBUTES = {'shape', 'dtype', 'device'}
+
+SUPPORTED_METHODS = {
+    'view', 'reshape', 'flatten', 'size', 'permute', 'contiguous', 'mean', 'add', 'mul',
+    'relu', 'sigmoid', 'chunk', 'split', 'transpose', 'squeeze', 'unsqueeze',
+}
+
+
+def input_shapes_to_tensor_shapes(input_shapes):
+    """NetsPresso input_shapes 형식을 텐서 shape 튜플 목록으로 변환"""
+    shapes = []
+    for index, shape in enumerate(input_shapes):
+        missing = {'batch', 'channel', 'dimension'} - set(shape)
+        if missing:
+            raise ValueError(f"input_shapes[{index}]에 필수 키 누락: {sorted(missing)}")
+        dimension = list(shape['dimension'])
+        if not dimension or not all(isinstance(d, int) and d > 0 for d in dimension):
+            raise ValueError(f"input_shapes[{index}]의 dimension이 올바르지 않음: {shape['dimension']}")
+        shapes.append((shape['batch'], shape['channel'], *dimension))
+    return shapes
+
+
+def find_unsupported_ops(graph_module):
+    """지원 목록에 없는 노드를 '노드명(연산)' 문자열 목록으로 반환"""
+    modules = dict(graph_module.named_modules())
+    unsupported = []
+    for node in graph_module.graph.nodes:
+        if node.op == 'call_module':
+            module = modules[node.target]
+            if not isinstance(module, SUPPORTED_MODULES):
+                unsupported.append(f"{node.name}({type(module).__name__})")
+        elif node.op == 'call_function':
+            if node.target is getattr:
+                if len(node.args) < 2 or node.args[1] not in SUPPORTED_ATTRIBUTES:
+                    unsupported.append(f"{node.name}(getattr .{node.args[1] if len(node.args) > 1 else '?'})")
+            elif node.target not in SUPPORTED_FUNCTIONS:
+                unsupported.append(f"{node.name}({getattr(node.target, '__name__', node.target)})")
+        elif node.op == 'call_method':
+            if node.target not in SUPPORTED_METHODS:
+                unsupported.append(f"{node.name}(.{node.target})")
+    return unsupported
+
+
+def precheck_model(model_path, input_shapes):
+    """
+    업로드 전 모델 호환성 검사
+
+    Args:
+        model_path (str): 검사할 모델 파일 경로
+        input_shapes (list): automatic_compression에 넘길 input_shapes
+
+    Returns:
+        dict: compatible(bool), reason(str), checks(단계별 결과 목록), elapsed(초)
+    """
+    start = time.perf_counter()
+    checks = []
+
+    def result(compatible, reason):
+        return {
+            'compatible': compatible,
+            'reason': reason,
+            'checks': checks,
+            'elapsed': time.perf_counter() - start
+        }
+
+    def record(name, passed, message):
+        checks.append({'name': name, 'passed': passed, 'message': message})
+        return passed
+
+    # 1. 파일 / 형식 (모델을 읽지 않고 즉시 판단)
+    if not os.path.exists(model_path):
+        record('file', False, "파일이 존재하지 않음")
+        return result(False, f"모델 파일이 존재하지 않음: {model_path}")
+    extension = os.path.splitext(model_path)[1].lower()
+    if extension not in SUPPORTED_EXTENSIONS:
+        reason = (f"지원되지 않는 모델 형식 '{extension}': Python SDK 압축은 torch.fx.GraphModule(.pt)만 지원 "
+                  f"(업로드 시 NotValidFrameworkException 예상). torch 모델로 변환 후 save_fx_model로 저장하세요.")
+        record('format', False, reason)
+        return result(False, reason)
+    if is_fx_artifact(model_path):
+        reason = ".fxa는 로컬 검증 전용 아티팩트 포맷입니다. save_fx_model(format='torch')로 저장해 업로드하세요."
+        record('format', False, reason)
+        return result(False, reason)
+    record('format', True, extension)
+
+    # 2. input_shapes 형식
+    try:
+        tensor_shapes = input_shapes_to_tensor_shapes(input_shapes)
+    except (ValueError, TypeError) as e:
+        record('input_shapes', False, str(e))
+        return result(False, f"input_shapes 오류: {e}")
+
+    # 3. 로드
+    try:
+        model = load_fx_model(model_path)
+    except Exception as e:
+        record('load', False, str(e))
+        return result(False, f"모델 로드 실패: {e}")
+    record('load', True, type(model).__name__)
+
+    # 4. GraphModule 여부 / trace 가능 여부
+    if not isinstance(model, torch.fx.GraphModule):
+        if not isinstance(model, torch.nn.Module):
+            reason = f"torch.fx.GraphModule이 아님: {type(model)}"
+            record('graph_module', False, reason)
+            return result(False, reason)
+        try:
+            with FX_LOCK:
+                torch.fx.symbolic_trace(model)
+        except Exception as e:
+            reason = f"torch.fx.GraphModule이 아니며 symbolic_trace도 실패: {e}"
+        else:
+            reason = (f"torch.fx.GraphModule이 아님: {type(model).__name__}. "
+                      f"symbolic_trace는 가능하므로 save_fx_model로 변환 후 업로드하세요.")
+        record('graph_module', False, reason)
+        return result(False, reason)
+    record('graph_module', True, "torch.fx.GraphModule")
+
+    try:
+        model.graph.lint()
+    except Exception as e:
+        record('graph', False, str(e))
+        return result(False, f"손상된 FX 그래프: {e}")
+    record('graph', True, f"{len(model.graph.nodes)}개 노드")
+
+    # 5. 지원 연산
+    unsupported = find_unsupported_ops(model)
+    if unsupported:
+        shown = ', '.join(unsupported[:10])
+        more = f" 외 {len(unsupported) - 10}개" if len(unsupported) > 10 else ""
+        record('ops', False, shown)
+        return result(False, f"지원되지 않는 연산 {len(unsupported)}개: {shown}{more}")
+    record('ops', True, "모든 연산 지원")
+
+    # 6. 입력 shape 검증
+    placeholders = [node for node in model.graph.nodes if node.op == 'placeholder']
+    if len(placeholders) != len(tensor_shapes):
+        reason = f"모델 입력 수({len(placeholders)})와 input_shapes 수({len(tensor_shapes)})가 다름"
+        record('input_shapes', False, reason)
+        return result(False, reason)
+    try:
+        output = run_fx_model(model, *[torch.zeros(shape) for shape in tensor_shapes])
+    except Exception as e:
+        record('input_shapes', False, str(e))
+        return result(False, f"input_shapes {tensor_shapes}로 실행 실패: {e}")
+    output_shape = tuple(output.shape) if isinstance(output, torch.Tensor) else type(output).__name__
+    record('input_shapes', True, f"출력 형태: {output_shape}")
+
+    return result(True, "호환성 검사 통과")
@@ -0,0 +1,146 @@
+"""
+압축률 스윕 스케줄러
+여러 compression_ratio로 병렬 압축 후 (압축률, 크기, 지연 시간, 출력 편차)의 파레토 프런티어를 계산
+"""
+
+import os
+import time
+from datetime import datetime
+
+import torch
+
+from benchmark import percentile, time_model
+from model_tests import load_fx_model, run_fx_model
+from precheck import input_shapes_to_tensor_shapes
+from utils import save_test_result
+
+DEFAULT_INPUT_SHAPES = [{"batch": 1, "channel": 3, "dimension": [224, 224]}]
+OBJECTIVES = ('compressed_size', 'latency', 'deviation')
+
+
+def measure_latency(model, example_input, warmup=3, iterations=20):
+    """추론 지연 시간의 중앙값(초)"""
+    return percentile(time_model(model, example_input, warmup=warmup, iterations=iterations), 50)
+
+
+def output_deviation(original, compressed, example_input):
+    """같은 입력에 대한 두 모델 출력의 최대 절대 오차 (출력 형태가 다르면 None)"""
+    expected = run_fx_model(original, example_input)
+    actual = run_fx_model(compressed, example_input)
+    if expected.shape != actual.shape:
+        return None
+    return (expected - actual).abs().max().item()
+
+
+def dominates(a, b, objectives=OBJECTIVES):
+    """a가 모든 목표에서 b 이하이고 하나 이상에서 더 작으면 True (None은 최악으로 취급)"""
+    def value(point, key):
+        v = point.get(key)
+        return float('inf') if v is None else v
+
+    not_worse = all(value(a, key) <= value(b, key) for key in objectives)
+    better = any(value(a, key) < value(b, key) for key in objectives)
+    return not_worse and better
+
+
+def pareto_frontier(points, objectives=OBJECTIVES):
+    """다른 어떤 점에도 지배되지 않는 점들을 압축률 순으로 반환"""
+    frontier = [
+        p for p in points
+        if not any(dominates(q, p, objectives) for q in points if q is not p)
+    ]
+    return sorted(frontier, key=lambda p: p['ratio'])
+
+
+def _improved(best, current, min_improvement):
+    return best is None or current < best * (1 - min_improvement)
+
+
+def sweep_compression_ratios(client, model_path, output_root, ratios, input_shapes=None,
+                             max_workers=4, patience=1, min_improvement=0.01, seed=0):
+    """
+    압축률 목록을 오름차순으로 max_workers개씩 병렬 압축하며 스윕
+
+    묶음의 압축이 모두 끝난 뒤 지연 시간과 출력 편차를 직렬로 측정.
+    한 묶음(wave)에서 최소 크기/지연 시간이 min_improvement 이상 개선되지 않는 상태가
+    patience번 이어지면 남은 압축률은 건너뜀
+
+    Returns:
+        dict: points(측정값 목록), pareto_frontier, skipped_ratios, stopped_early
+    """
+    input_shapes = input_shapes or DEFAULT_INPUT_SHAPES
+    ratios = sorted(set(ratios))
+    generator = torch.Generator().manual_seed(seed)
+    example_inputs = [torch.randn(*shape, generator=generator)
+                      for shape in input_shapes_to_tensor_shapes(input_shapes)]
+    original = load_fx_model(model_path)
+    original_size = os.path.getsize(model_path)
+    original_latency = measure_latency(original, *example_inputs)
+
+    points = []
+    failures = []
+    best_size = best_latency = None
+    stale_waves = 0
+    remaining = list(ratios)
+    start = time.perf_counter()
+
+    while remaining and stale_waves < patience:
+        wave, remaining = remaining[:max_workers], remaining[max_workers:]
+        jobs = [
+            {
+                'model_path': model_path,
+                'output_dir': os.path.join(output_root, f"ratio_{ratio:.2f}"),
+                'input_shapes': input_shapes,
+                'compression_ratio': ratio
+            }
+            for ratio in wave
+        ]
+
+        # 묶음의 압축이 모두 끝난 뒤 지연 시간을 하나씩 측정 (아직 압축 중인 스레드와 CPU를 나눠 쓰지 않도록)
+        results = sorted(client.compress_many(jobs, max_workers=max_workers), key=lambda r: r['job_index'])
+        improved = False
+        for result in results:
+            ratio = wave[result['job_index']]
+            if not result['success'] or not result.get('compressed_path'):
+                failures.append({'ratio': ratio, 'error': result.get('error')})
+                continue
+
+            compressed = load_fx_model(result['compressed_path'])
+            point = {
+                'ratio': ratio,
+                'compressed_size': os.path.getsize(result['compressed_path']),
+                'latency': measure_latency(compressed, *example_inputs),
+                'deviation': output_deviation(original, compressed, *example_inputs),
+                'compressed_path': result['compressed_path'],
+                'compression_time': result.get('duration')
+            }
+            points.append(point)
+
+            if _improved(best_size, point['compressed_size'], min_improvement):
+                best_size = point['compressed_size']
+                improved = True
+            if _improved(best_latency, point['latency'], min_improvement):
+                best_latency = point['latency']
+                improved = True
+
+        stale_waves = 0 if improved else stale_waves + 1
+
+    return {
+        'model_path': model_path,
+        'input_shapes': input_shapes,
+        'ratios_requested': ratios,
+        'original': {'size': original_size, 'latency': original_latency},
+        'points': sorted(points, key=lambda p: p['ratio']),
+        'pareto_frontier': pareto_frontier(points),
+        'failures': failures,
+        'skipped_ratios': remaining,
+        'stopped_early': bool(remaining),
+        'duration': time.perf_counter() - start,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def save_sweep_result(sweep, output_path):
+    """스윕 결과를 표준 결과 JSON으로 저장 (generate_qa_report가 스윕 섹션으로 표시)"""
+    save_test_result({'success': bool(sweep['points']), 'sweep': sweep}, output_path)
+    return output_path
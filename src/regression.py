@@ -0,0 +1,274 @@
+"""
+성능 회귀 추적
+실행마다 (모델, 커밋) 단위로 기록한 지표를 결과 DB의 metrics 테이블에 쌓고,
+현재 커밋의 값을 직전 실행들(rolling baseline)과 robust 통계로 비교
+
+- 현재 표본이 충분하면 단측 Mann-Whitney U 검정 (현재 값이 더 큰지)
+- 표본이 적으면 중앙값/MAD 기반 robust z-score
+- 두 경우 모두 상대 변화가 min_relative_change 이상이어야 회귀로 판정 (측정 잡음 방지)
+- 한 번에 여러 지표를 검정하므로 Mann-Whitney p-value는 Holm 방식으로 다중 비교 보정
+- 결정적인 지표(압축 크기, 최대 메모리)는 항상 실패 판정 대상.
+  시간 지표는 실행 환경(runner_id)마다 값이 달라지므로 같은 runner의 기준 값이 min_baseline개 이상 쌓였을 때
+  그 기준과 비교해 실패 판정하고, 그 전까지는 전체 기준과 비교한 결과를 참고용(advisory)으로만 보고
+
+scipy 없이 동작하도록 통계 함수는 순수 파이썬으로 구현
+"""
+
+import os
+import math
+import platform
+
+# 지표 이름 → 설명. 모두 값이 작을수록 좋은 지표
+METRICS = {
+    'compression_wall_time': '압축 소요 시간(초)',
+    'compressed_size': '압축 모델 크기(bytes)',
+    'inference_p50': '추론 p50(초)',
+    'inference_p99': '추론 p99(초)',
+    'peak_memory': '최대 활성화 메모리(bytes)'
+}
+
+# 같은 입력이면 항상 같은 값이 나오는 지표. 기본적으로 이 지표의 회귀만 실패로 판정
+DETERMINISTIC_METRICS = ('compressed_size', 'peak_memory')
+
+DEFAULT_WINDOW = 20
+DEFAULT_MIN_BASELINE = 5
+DEFAULT_MAD_THRESHOLD = 3.0
+DEFAULT_MIN_RELATIVE_CHANGE = 0.05
+DEFAULT_ALPHA = 0.05
+# 현재 표본이 이 개수 이상이면 Mann-Whitney, 미만이면 robust z-score
+MIN_SAMPLES_FOR_RANK_TEST = 3
+
+# 정규분포 가정에서 MAD → 표준편차 환산 계수
+MAD_SCALE = 1.4826
+
+
+def _cpu_model():
+    try:
+        with open('/proc/cpuinfo', 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def runner_id():
+    """
+    시간 지표의 기준을 나누는 실행 환경 식별자
+
+    NETSPRESSO_RUNNER가 있으면 그 값, 없으면 OS 이미지(GitHub Actions의 ImageOS/ImageVersion) + CPU 모델 + 코어 수
+    """
+    if os.getenv('NETSPRESSO_RUNNER'):
+        return os.environ['NETSPRESSO_RUNNER']
+    image = '-'.join(filter(None, (os.getenv('ImageOS'), os.getenv('ImageVersion'))))
+    return f"{image or platform.platform()}/{_cpu_model()}/{os.cpu_count()}cpu"
+
+
+def median(values):
+    """중앙값"""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("빈 표본의 중앙값은 정의되지 않음")
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def mad(values):
+    """중앙값 절대 편차 (MAD_SCALE 적용 전)"""
+    center = median(values)
+    return median(abs(v - center) for v in values)
+
+
+def _ranks(values):
+    """동점은 평균 순위. (순위 목록, 동점 그룹 크기 목록) 반환"""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    ties = []
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = rank
+        if j > i:
+            ties.append(j - i + 1)
+        i = j + 1
+    return ranks, ties
+
+
+def mann_whitney_u(current, baseline):
+    """
+    단측 Mann-Whitney U 검정 (대립가설: current가 baseline보다 큼)
+
+    정규 근사 + 동점 보정 + 연속성 보정을 사용
+
+    Returns:
+        tuple: (current의 U 통계량, p-value)
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        raise ValueError("두 표본 모두 값이 있어야 함")
+    ranks, ties = _ranks(list(current) + list(baseline))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+
+    n = n1 + n2
+    tie_term = sum(t ** 3 - t for t in ties) / (n * (n - 1)) if n > 1 else 0.0
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term)
+    if variance <= 0:
+        # 모든 값이 같음
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def holm_adjust(p_values):
+    """
+    Holm-Bonferroni 단계적 보정 (family-wise error rate 제어)
+
+    Returns:
+        list: 입력 순서대로 보정된 p-value
+    """
+    order = sorted(range(len(p_values)), key=lambda i: p_values[i])
+    adjusted = [1.0] * len(p_values)
+    running = 0.0
+    for rank, index in enumerate(order):
+        running = max(running, min(1.0, (len(p_values) - rank) * p_values[index]))
+        adjusted[index] = running
+    return adjusted
+
+
+def compare_to_baseline(current, baseline, mad_threshold=DEFAULT_MAD_THRESHOLD,
+                        min_relative_change=DEFAULT_MIN_RELATIVE_CHANGE, alpha=DEFAULT_ALPHA):
+    """
+    현재 표본과 기준 표본 비교
+
+    Returns:
+        dict: status('regressed' / 'improved' / 'ok'), method, current/baseline 중앙값,
+              baseline_mad, relative_change, p_value 또는 z_score
+    """
+    current_median = median(current)
+    baseline_median = median(baseline)
+    baseline_mad = mad(baseline) * MAD_SCALE
+    if baseline_median:
+        relative_change = (current_median - baseline_median) / abs(baseline_median)
+    else:
+        relative_change = 0.0 if current_median == baseline_median else math.copysign(math.inf, current_median)
+
+    comparison = {
+        'current_median': current_median,
+        'baseline_median': baseline_median,
+        'baseline_mad': baseline_mad,
+        'relative_change': relative_change,
+        'current_samples': len(current),
+        'baseline_samples': len(baseline)
+    }
+
+    if len(current) >= MIN_SAMPLES_FOR_RANK_TEST:
+        _, p_worse = mann_whitney_u(current, baseline)
+        _, p_better = mann_whitney_u(baseline, current)
+        comparison.update(method='mann_whitney', p_value=p_worse, p_value_better=p_better)
+    else:
+        difference = current_median - baseline_median
+        if baseline_mad:
+            z_score = difference / baseline_mad
+        else:
+            # 기준 값이 모두 같으면(예: 결정적인 모델 크기) 차이가 있으면 바로 유의
+            z_score = 0.0 if not difference else math.copysign(math.inf, difference)
+        comparison.update(method='robust_z', z_score=z_score)
+
+    comparison['status'] = _classify(comparison, mad_threshold, min_relative_change, alpha)
+    return comparison
+
+
+def _classify(comparison, mad_threshold, min_relative_change, alpha):
+    """비교 결과를 'regressed' / 'improved' / 'ok'로 판정 (보정된 p-value가 있으면 그 값 사용)"""
+    if comparison['method'] == 'mann_whitney':
+        worse = comparison.get('p_adjusted', comparison['p_value']) < alpha
+        better = comparison.get('p_adjusted_better', comparison['p_value_better']) < alpha
+    else:
+        worse = comparison['z_score'] > mad_threshold
+        better = comparison['z_score'] < -mad_threshold
+
+    relative_change = comparison['relative_change']
+    if worse and relative_change > min_relative_change:
+        return 'regressed'
+    if better and relative_change < -min_relative_change:
+        return 'improved'
+    return 'ok'
+
+
+def check_regressions(results_db, model, commit, metrics=None, window=DEFAULT_WINDOW,
+                      min_baseline=DEFAULT_MIN_BASELINE, gating=DETERMINISTIC_METRICS, runner=None,
+                      mad_threshold=DEFAULT_MAD_THRESHOLD, min_relative_change=DEFAULT_MIN_RELATIVE_CHANGE,
+                      alpha=DEFAULT_ALPHA):
+    """
+    결과 DB에 기록된 commit의 지표를 같은 모델의 직전 window개 값(다른 커밋)과 비교
+
+    Mann-Whitney로 비교한 지표들의 p-value는 Holm 방식으로 함께 보정한 뒤 판정
+
+    Args:
+        results_db (results_db.ResultsDB): metrics 테이블이 있는 결과 DB
+        metrics (iterable): 비교할 지표. None이면 commit에 기록된 모든 지표
+        gating (iterable): 항상 실패로 판정할 지표. None이면 모든 지표
+        runner (str): 현재 실행 환경. 주면 gating 밖의 지표도 이 runner의 기준 값이 min_baseline개 이상이면
+            그 기준과 비교해 실패로 판정. 아니면 전체 기준과 비교해 advisory로만 보고
+        mad_threshold, min_relative_change, alpha: compare_to_baseline 인자
+
+    Returns:
+        dict: model, commit, runner, metrics(지표별 비교 결과, gating/baseline_scope 포함),
+              regressions(실패로 판정된 회귀 지표), advisory(참고용 회귀 지표), regressed
+    """
+    names = list(metrics) if metrics is not None else results_db.metric_names(model, commit=commit)
+    rows = []
+    for name in names:
+        current = results_db.metric_values(model, name, commit=commit)
+        if not current:
+            continue
+        baseline = results_db.metric_values(model, name, exclude_commit=commit, limit=window)
+        gates, scope = gating is None or name in gating, 'all'
+        if not gates and runner is not None:
+            same_runner = results_db.metric_values(model, name, exclude_commit=commit, limit=window, runner=runner)
+            if len(same_runner) >= min_baseline:
+                current = results_db.metric_values(model, name, commit=commit, runner=runner) or current
+                baseline, gates, scope = same_runner, True, 'runner'
+        if len(baseline) < min_baseline:
+            rows.append({
+                'metric': name,
+                'status': 'insufficient_baseline',
+                'current_median': median(current),
+                'current_samples': len(current),
+                'baseline_samples': len(baseline),
+                'gating': gates,
+                'baseline_scope': scope
+            })
+            continue
+        row = compare_to_baseline(current, baseline, mad_threshold=mad_threshold,
+                                  min_relative_change=min_relative_change, alpha=alpha)
+        row.update(metric=name, gating=gates, baseline_scope=scope)
+        rows.append(row)
+
+    ranked = [row for row in rows if row.get('method') == 'mann_whitney']
+    if ranked:
+        worse = holm_adjust([row['p_value'] for row in ranked])
+        better = holm_adjust([row['p_value_better'] for row in ranked])
+        for row, p_worse, p_better in zip(ranked, worse, better):
+            row.update(p_adjusted=p_worse, p_adjusted_better=p_better)
+            row['status'] = _classify(row, mad_threshold, min_relative_change, alpha)
+
+    regressions = [row['metric'] for row in rows if row['status'] == 'regressed' and row['gating']]
+    advisory = [row['metric'] for row in rows if row['status'] == 'regressed' and not row['gating']]
+    return {
+        'model': model,
+        'commit': commit,
+        'runner': runner,
+        'window': window,
+        'metrics': rows,
+        'regressions': regressions,
+        'advisory': advisory,
+        'regressed': bool(regressions)
+    }
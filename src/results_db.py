@@ -0,0 +1,335 @@
+"""
+SQLite 결과 데이터베이스
+테스트 이름 / 모델 / 시각 / 상태 / 실패 유형에 인덱스를 두어, JSON을 다시 파싱하지 않고
+"yolo_like 압축 시간 최근 30회", "이번 주 프레임워크 실패" 같은 질의와 추이 표를 바로 만들 수 있게 함
+metrics 테이블은 (모델, 커밋, 실행 환경) 단위 성능 지표 이력 (regression.py의 회귀 판정에 사용)
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from functools import lru_cache
+from datetime import datetime, timedelta
+
+from failure_patterns import classify_failure
+
+DEFAULT_RESULTS_DB = os.path.join('.', 'results', 'results.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    test_name TEXT NOT NULL,
+    model TEXT,
+    timestamp TEXT NOT NULL,
+    status TEXT NOT NULL,
+    failure_category TEXT,
+    duration REAL,
+    error TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_test_time ON results (test_name, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_model_time ON results (model, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_timestamp ON results (timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results (status, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_failure ON results (failure_category, timestamp);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    id INTEGER PRIMARY KEY,
+    model TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    commit_sha TEXT,
+    timestamp TEXT NOT NULL,
+    runner TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_metrics_model_metric_time ON metrics (model, metric, timestamp);
+CREATE INDEX IF NOT EXISTS idx_metrics_commit ON metrics (commit_sha);
+"""
+
+# runner 컬럼이 없던 예전 DB에도 적용 (컬럼 추가 후 인덱스 생성)
+METRICS_RUNNER_INDEX = "CREATE INDEX IF NOT EXISTS idx_metrics_runner ON metrics (model, metric, runner, timestamp)"
+
+# details 밖으로 꺼내 컬럼으로 저장하는 지표 (나머지는 json_extract로 조회)
+COLUMN_METRICS = ('duration',)
+
+# 대량 적재 시 호출마다 인코더를 만들지 않도록 재사용
+_DETAILS_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+# add_results로 이 건수 이상을, 기존 행 수 이상 한 번에 넣으면 results 인덱스를 지웠다가 적재 후 다시 만듦
+# (행마다 인덱스 5개를 갱신하는 것보다 한 번에 정렬해 만드는 쪽이 빠름)
+BULK_INDEX_THRESHOLD = 10_000
+_RESULTS_INDEXES = [line for line in SCHEMA.splitlines() if line.startswith("CREATE INDEX") and " ON results " in line]
+
+
+@lru_cache(maxsize=4096)
+def _file_stem(path):
+    """경로의 확장자 뺀 파일명. Path(...).stem은 행마다 경로 객체를 만들어 대량 적재에서 가장 비쌈"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _model_name(details):
+    """details에서 모델 이름 추출 (model 키 → model_path/original_path 파일명)"""
+    if details.get('model'):
+        return str(details['model'])
+    for key in ('model_path', 'original_path'):
+        if details.get(key):
+            return _file_stem(str(details[key]))
+    return None
+
+
+def _row(test_name, success, details, timestamp=None, model=None, categories=None):
+    """
+    results 테이블 한 행
+
+    Args:
+        categories (dict): (error, error_type) → 실패 유형 캐시. 대량 적재에서 같은 오류를 다시 분류하지 않음
+    """
+    details = details or {}
+    duration = details.get('duration')
+    error = details.get('error')
+    category = None
+    if not success:
+        if categories is None:
+            category = classify_failure(details)
+        else:
+            key = (str(error), details.get('error_type'))
+            category = categories.get(key)
+            if category is None:
+                category = categories[key] = classify_failure(details)
+    return (
+        test_name,
+        model or _model_name(details),
+        timestamp or datetime.now().isoformat(),
+        'passed' if success else 'failed',
+        category,
+        float(duration) if isinstance(duration, (int, float)) else None,
+        str(error) if error is not None else None,
+        _DETAILS_ENCODER.encode(details)
+    )
+
+
+class ResultsDB:
+    """테스트 결과 저장/조회용 SQLite 래퍼 (스레드 간 공유 가능)"""
+
+    def __init__(self, db_path=None):
+        self.db_path = str(db_path or os.getenv('NETSPRESSO_RESULTS_DB', DEFAULT_RESULTS_DB))
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if self.db_path != ':memory:':
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.executescript(SCHEMA)
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(metrics)")}
+        if 'runner' not in columns:
+            self.conn.execute("ALTER TABLE metrics ADD COLUMN runner TEXT")
+        self.conn.execute(METRICS_RUNNER_INDEX)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add_result(self, test_name, success, details=None, timestamp=None, model=None):
+        """결과 한 건 저장"""
+        with self._lock, self.conn:
+            self.conn.execute("INSERT INTO results (test_name, model, timestamp, status, failure_category, "
+                              "duration, error, details) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                              _row(test_name, success, details, timestamp, model))
+
+    def add_results(self, records):
+        """
+        여러 결과를 한 트랜잭션으로 저장
+
+        BULK_INDEX_THRESHOLD건 이상이고 기존 행 수 이상이면 인덱스를 적재 뒤 다시 만들고,
+        적재하는 동안만 synchronous=OFF (트랜잭션이 끝나면 원래 값으로 되돌림)
+
+        Args:
+            records (iterable): test_name, success, details(, timestamp, model) 키를 가진 dict들
+
+        Returns:
+            int: 저장된 건수
+        """
+        categories = {}
+        rows = [_row(r['test_name'], r['success'], r.get('details'), r.get('timestamp'), r.get('model'), categories)
+                for r in records]
+        with self._lock:
+            rebuild = (len(rows) >= BULK_INDEX_THRESHOLD and
+                       len(rows) >= self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0])
+            synchronous = self.conn.execute("PRAGMA synchronous").fetchone()[0]
+            self.conn.execute("PRAGMA synchronous=OFF")
+            try:
+                with self.conn:
+                    if rebuild:
+                        for statement in _RESULTS_INDEXES:
+                            self.conn.execute(f"DROP INDEX IF EXISTS {statement.split()[5]}")
+                    cursor = self.conn.executemany("INSERT INTO results (test_name, model, timestamp, status, "
+                                                   "failure_category, duration, error, details) "
+                                                   "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                    if rebuild:
+                        for statement in _RESULTS_INDEXES:
+                            self.conn.execute(statement)
+            finally:
+                self.conn.execute(f"PRAGMA synchronous={synchronous}")
+        return cursor.rowcount
+
+    def add_metrics(self, model, metrics, commit=None, timestamp=None, runner=None):
+        """
+        한 번의 실행에서 측정한 지표들을 (모델, 커밋) 단위로 저장
+
+        Args:
+            metrics (dict): 지표 이름 → 값 (None은 건너뜀)
+            runner (str): 측정한 실행 환경 식별자 (regression.runner_id)
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        rows = [(model, name, float(value), commit, timestamp, runner)
+                for name, value in metrics.items() if value is not None]
+        with self._lock, self.conn:
+            self.conn.executemany("INSERT INTO metrics (model, metric, value, commit_sha, timestamp, runner) "
+                                  "VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def metric_values(self, model, metric, commit=None, exclude_commit=None, limit=None, runner=None):
+        """
+        지표 값 목록 (오래된 순)
+
+        commit을 주면 해당 커밋의 값만, exclude_commit을 주면 그 커밋을 제외한 최근 limit개.
+        runner를 주면 그 실행 환경에서 측정한 값만
+        """
+        query = "SELECT value FROM metrics WHERE model = ? AND metric = ?"
+        params = [model, metric]
+        if commit is not None:
+            query += " AND commit_sha = ?"
+            params.append(commit)
+        if exclude_commit is not None:
+            query += " AND (commit_sha IS NULL OR commit_sha != ?)"
+            params.append(exclude_commit)
+        if runner is not None:
+            query += " AND runner = ?"
+            params.append(runner)
+        query += " ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [row['value'] for row in reversed(self.conn.execute(query, params).fetchall())]
+
+    def metric_names(self, model, commit=None):
+        """모델(과 커밋)에 기록된 지표 이름"""
+        query = "SELECT DISTINCT metric FROM metrics WHERE model = ?"
+        params = [model]
+        if commit is not None:
+            query += " AND commit_sha = ?"
+            params.append(commit)
+        return sorted(row['metric'] for row in self.conn.execute(query, params))
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _metric_expression(self, metric):
+        if metric in COLUMN_METRICS:
+            return metric
+        if not metric.replace('_', '').replace('.', '').isalnum():
+            raise ValueError(f"잘못된 지표 이름: {metric}")
+        return f"json_extract(details, '$.{metric}')"
+
+    def metric_history(self, test_name=None, model=None, metric='duration', limit=30, status=None):
+        """
+        지표의 최근 limit회 이력 (오래된 순)
+
+        Returns:
+            list: {timestamp, test_name, model, status, value} dict 목록
+        """
+        conditions, params = [], []
+        if test_name is not None:
+            conditions.append("test_name = ?")
+            params.append(test_name)
+        if model is not None:
+            conditions.append("model = ?")
+            params.append(model)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.conn.execute(
+            f"SELECT timestamp, test_name, model, status, {self._metric_expression(metric)} AS value "
+            f"FROM results {where} ORDER BY timestamp DESC LIMIT ?", (*params, limit)
+        ).fetchall()
+        return [dict(row) for row in reversed(rows)]
+
+    def recent_models(self, limit=10):
+        """최근에 결과가 기록된 모델 이름 (최신 순)"""
+        rows = self.conn.execute(
+            "SELECT model, MAX(timestamp) AS last FROM results WHERE model IS NOT NULL "
+            "GROUP BY model ORDER BY last DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [row['model'] for row in rows]
+
+    def model_history(self, model, limit=30):
+        """모델별 최근 결과 (오래된 순, details 포함)"""
+        rows = self.conn.execute(
+            "SELECT test_name, timestamp, status, failure_category, duration, error, details FROM results "
+            "WHERE model = ? ORDER BY timestamp DESC LIMIT ?", (model, limit)
+        ).fetchall()
+        history = []
+        for row in reversed(rows):
+            entry = dict(row)
+            entry['details'] = json.loads(entry['details']) if entry['details'] else {}
+            history.append(entry)
+        return history
+
+    def failures(self, category=None, since=None, limit=None):
+        """실패 결과 목록 (최신 순). since는 datetime 또는 ISO 문자열"""
+        conditions, params = ["status = 'failed'"], []
+        if category is not None:
+            conditions.append("failure_category = ?")
+            params.append(category)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since.isoformat() if isinstance(since, datetime) else since)
+        query = (f"SELECT test_name, model, timestamp, failure_category, error FROM results "
+                 f"WHERE {' AND '.join(conditions)} ORDER BY timestamp DESC")
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.conn.execute(query, params)]
+
+    def failure_counts(self, since=None):
+        """실패 유형별 건수"""
+        query = "SELECT failure_category, COUNT(*) AS count FROM results WHERE status = 'failed'"
+        params = []
+        if since is not None:
+            query += " AND timestamp >= ?"
+            params.append(since.isoformat() if isinstance(since, datetime) else since)
+        query += " GROUP BY failure_category ORDER BY count DESC"
+        return {row['failure_category']: row['count'] for row in self.conn.execute(query, params)}
+
+    def daily_trend(self, days=7, test_name=None, now=None):
+        """
+        최근 days일의 일별 추이
+
+        Returns:
+            list: {day, total, passed, failed, success_rate, mean_duration} dict 목록 (날짜 순)
+        """
+        since = ((now or datetime.now()) - timedelta(days=days)).isoformat()
+        query = ("SELECT substr(timestamp, 1, 10) AS day, COUNT(*) AS total, "
+                 "SUM(status = 'passed') AS passed, SUM(status = 'failed') AS failed, "
+                 "AVG(duration) AS mean_duration FROM results WHERE timestamp >= ?")
+        params = [since]
+        if test_name is not None:
+            query += " AND test_name = ?"
+            params.append(test_name)
+        query += " GROUP BY day ORDER BY day"
+        trend = []
+        for row in self.conn.execute(query, params):
+            entry = dict(row)
+            entry['success_rate'] = entry['passed'] / entry['total'] * 100 if entry['total'] else 0
+            trend.append(entry)
+        return trend
@@ -0,0 +1,169 @@
+"""
+결과 파일 증분 인덱스
+results 폴더를 한 번만 순회하고, 경로별 mtime/크기가 바뀐 JSON 파일만 다시 파싱하여
+리포트 생성 비용이 누적된 결과 수가 아니라 새 결과 수에 비례하도록 함
+JSONL 결과 로그(results_log) 세그먼트는 파싱하지 않고 경로만 모아 스트리밍으로 읽게 함
+인덱스에는 결과 전체가 아니라 리포트에 쓰는 요약 필드(SUMMARY_FIELDS)만 보관하고, 바뀐 것이 없으면 다시 쓰지 않음
+"""
+
+import os
+import json
+from pathlib import Path
+
+from results_log import iter_log_records, order_segments
+
+INDEX_FILENAME = '.results_index.json'
+INDEX_VERSION = 2
+
+# 리포트(generate_qa_report)에서 읽는 details 필드. 그 밖의 필드(spans, 원본 metadata 등)는 인덱스에 저장하지 않음
+SUMMARY_FIELDS = (
+    'status', 'duration', 'stages', 'equivalence', 'compressed_path', 'compressed_files', 'original_size',
+    'compressed_size', 'model_id', 'compressed_model_id', 'error', 'error_type', 'stack_trace',
+    'sweep', 'benchmark', 'backend_comparison', 'scaling', 'regression'
+)
+# 리포트는 스택 트레이스 앞부분만 표시
+MAX_STACK_TRACE = 500
+
+
+def parse_result_data(file_path, data, test_name=None):
+    """
+    결과 JSON 한 개를 리포트용 레코드로 변환 (test_name을 주면 파일명 대신 사용)
+
+    Returns:
+        dict: test_name, success, details (인식할 수 없는 데이터면 None)
+    """
+    if not isinstance(data, dict) or not data:
+        return None
+    path = Path(file_path)
+    if 'result' in data:
+        # save_test_result 형식
+        result = data['result']
+        return {'test_name': test_name or path.stem, 'success': result.get('success', False), 'details': result}
+    if 'status' in data or 'compressed_model_id' in data:
+        # NetsPresso metadata.json 형식
+        success = data.get('status') == 'completed' or 'compressed_model_id' in data
+        return {'test_name': test_name or f"netspresso_test_{path.parent.name}", 'success': success, 'details': data}
+    # 일반적인 JSON 결과
+    return {'test_name': test_name or path.stem, 'success': data.get('success', 'error' not in data), 'details': data}
+
+
+def summarize_record(record):
+    """parse_result_data 레코드의 details를 SUMMARY_FIELDS만 남긴 사본으로 바꿔 반환"""
+    if record is None:
+        return None
+    details = {key: record['details'][key] for key in SUMMARY_FIELDS if key in record['details']}
+    if isinstance(details.get('stack_trace'), str):
+        details['stack_trace'] = details['stack_trace'][:MAX_STACK_TRACE]
+    return dict(record, details=details)
+
+
+def iter_result_files(root):
+    """root 아래 *.json / *.jsonl 파일을 (경로, stat) 으로 한 번의 순회로 나열"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.name.endswith(('.json', '.jsonl')) and entry.is_file():
+                yield entry.path, entry.stat()
+
+
+class ResultsIndex:
+    """results 폴더의 결과 파일별 (mtime, size, 요약 레코드)를 디스크에 유지하는 인덱스"""
+
+    def __init__(self, results_dir='./results', index_path=None):
+        self.results_dir = str(results_dir)
+        self.index_path = str(index_path or os.path.join(self.results_dir, INDEX_FILENAME))
+        self.entries = self._load()
+        self.log_segments = []
+        self.stats = {'total': 0, 'parsed': 0, 'reused': 0, 'removed': 0}
+        self.changed = False
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if index.get('version') != INDEX_VERSION:
+            return {}
+        return index.get('files', {})
+
+    def save(self):
+        """
+        마지막 refresh 이후 바뀐 항목이 있을 때만 인덱스를 원자적으로 저장
+
+        Returns:
+            bool: 저장했는지
+        """
+        if not self.changed:
+            return False
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'files': self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+        self.changed = False
+        return True
+
+    def refresh(self):
+        """
+        results 폴더를 한 번 순회하여 새로 생기거나 바뀐 파일만 파싱하고 삭제된 파일은 제거
+
+        Returns:
+            list: 새로 파싱된 파일 경로 목록
+        """
+        index_path = os.path.abspath(self.index_path)
+        seen = {}
+        parsed = []
+        log_segments = []
+        reused = 0
+
+        for file_path, stat in iter_result_files(self.results_dir):
+            if os.path.abspath(file_path) == index_path:
+                continue
+            if file_path.endswith('.jsonl'):
+                log_segments.append(file_path)
+                continue
+            key = os.path.relpath(file_path, self.results_dir)
+            entry = self.entries.get(key)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                seen[key] = entry
+                reused += 1
+                continue
+
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    record = summarize_record(parse_result_data(file_path, json.load(f)))
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+                record = None
+                print(f"오류: {file_path} 처리 중 문제 발생: {e}")
+            seen[key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'record': record}
+            parsed.append(file_path)
+
+        self.stats = {
+            'total': len(seen),
+            'parsed': len(parsed),
+            'reused': reused,
+            'removed': len(set(self.entries) - set(seen))
+        }
+        self.changed = self.changed or bool(parsed) or bool(self.stats['removed'])
+        self.entries = seen
+        self.log_segments = order_segments(log_segments)
+        return parsed
+
+    def records(self):
+        """유효한 레코드를 경로 순으로 반환"""
+        return [self.entries[key]['record'] for key in sorted(self.entries) if self.entries[key]['record']]
+
+    def iter_log_results(self):
+        """JSONL 결과 로그의 레코드를 리포트용 레코드로 하나씩 변환 (메모리에 모으지 않음)"""
+        for record in iter_log_records(self.log_segments):
+            parsed = parse_result_data(self.results_dir, record, record.get('test_name'))
+            if parsed:
+                yield parsed
@@ -0,0 +1,151 @@
+"""
+append-only JSONL 결과 로그
+결과 하나를 파일 하나로 저장하는 대신 한 줄씩 덧붙이고, 활성 세그먼트가 일정 크기를 넘으면
+번호가 붙은 세그먼트로 교체(rotation)함. 읽기는 세그먼트 순서대로 한 줄씩 스트리밍
+
+파일 구조 (log_path = results/test_results/results.jsonl):
+    results.000001.jsonl, results.000002.jsonl, ...  교체된(변경되지 않는) 세그먼트
+    results.jsonl                                     현재 덧붙이는 활성 세그먼트
+"""
+
+import os
+import re
+import json
+from datetime import datetime
+
+from utils import file_lock
+
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+
+def _segment_pattern(log_path):
+    stem, extension = os.path.splitext(os.path.basename(log_path))
+    return re.compile(rf"^{re.escape(stem)}\.(\d{{6}}){re.escape(extension)}$")
+
+
+def list_segments(log_path):
+    """로그의 세그먼트 경로를 오래된 순서로 반환 (활성 세그먼트가 마지막)"""
+    directory = os.path.dirname(os.path.abspath(log_path))
+    pattern = _segment_pattern(log_path)
+    rotated = []
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            match = pattern.match(name)
+            if match:
+                rotated.append((int(match.group(1)), os.path.join(directory, name)))
+    segments = [path for _, path in sorted(rotated)]
+    if os.path.exists(log_path):
+        segments.append(str(log_path))
+    return segments
+
+
+def order_segments(paths):
+    """
+    디렉토리 순회로 찾은 *.jsonl 경로들을 로그별로 묶어 세그먼트 순서(교체된 번호순 → 활성)로 정렬
+    """
+    def key(path):
+        match = re.match(r"^(.*)\.(\d{6})(\.jsonl)$", os.path.basename(path))
+        if match:
+            return (os.path.dirname(path), match.group(1) + match.group(3), int(match.group(2)))
+        return (os.path.dirname(path), os.path.basename(path), float('inf'))
+    return sorted(paths, key=key)
+
+
+class ResultsLog:
+    """여러 프로세스가 동시에 덧붙여도 줄 단위로 원자적인 결과 로그"""
+
+    def __init__(self, log_path, max_segment_bytes=DEFAULT_MAX_SEGMENT_BYTES, fsync=False):
+        self.log_path = str(log_path)
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync = fsync
+        self.lock_path = f"{self.log_path}.lock"
+
+    def append(self, record):
+        """레코드 하나를 한 줄로 덧붙임 (필요하면 먼저 세그먼트 교체)"""
+        line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+        with file_lock(self.lock_path):
+            try:
+                size = os.path.getsize(self.log_path)
+            except OSError:
+                size = 0
+            if size and size + len(line) > self.max_segment_bytes:
+                self._rotate()
+
+            # O_APPEND + 한 번의 write: 잠금 없이 쓰는 다른 프로세스와도 줄이 섞이지 않음
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                written = 0
+                while written < len(line):
+                    written += os.write(fd, line[written:])
+                if self.fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        return self.log_path
+
+    def _rotate(self):
+        segments = list_segments(self.log_path)
+        pattern = _segment_pattern(self.log_path)
+        numbers = [int(pattern.match(os.path.basename(p)).group(1)) for p in segments[:-1]]
+        stem, extension = os.path.splitext(self.log_path)
+        os.replace(self.log_path, f"{stem}.{max(numbers, default=0) + 1:06d}{extension}")
+
+    def __iter__(self):
+        return iter_log_records(list_segments(self.log_path))
+
+
+def iter_log_records(segment_paths):
+    """
+    세그먼트 파일들을 한 줄씩 읽어 레코드를 하나씩 반환 (전체를 메모리에 올리지 않음)
+
+    쓰는 도중 중단되어 잘린 마지막 줄 등 해석할 수 없는 줄은 건너뜀
+    """
+    for segment_path in segment_paths:
+        try:
+            f = open(segment_path, 'r', encoding='utf-8')
+        except OSError:
+            continue
+        with f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+
+def append_test_result(log_path, test_name, result, max_segment_bytes=DEFAULT_MAX_SEGMENT_BYTES):
+    """save_test_result와 같은 구조({timestamp, result})에 test_name을 더해 로그에 덧붙임"""
+    record = {
+        'test_name': test_name,
+        'timestamp': datetime.now().isoformat(),
+        'result': result
+    }
+    ResultsLog(log_path, max_segment_bytes).append(record)
+    return record
+
+
+def migrate_json_results(json_paths, log_path):
+    """
+    기존 결과 파일(파일 하나당 결과 하나)을 로그로 옮김. 원본 파일은 그대로 둠
+
+    Returns:
+        int: 옮긴 레코드 수
+    """
+    log = ResultsLog(log_path)
+    migrated = 0
+    for json_path in sorted(json_paths):
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        data.setdefault('test_name', os.path.splitext(os.path.basename(json_path))[0])
+        log.append(data)
+        migrated += 1
+    return migrated
@@ -0,0 +1,207 @@
+"""
+모델 크기별 확장성 벤치마크
+create_parametric_model로 만든 크기 사다리(수십 KB ~ 167MB)에서 trace / save / load / verify / (대역) 압축
+시간과 메모리를 측정하고, 파일 크기에 대해 거듭제곱 곡선(시간 ∝ 크기^k, 곡선 모양)과
+직선(고정 비용 + 바이트당 비용)을 맞춰 실제 모델 크기에서의 값을 추정
+작은 모델에서는 고정 비용이 커서 거듭제곱 추정은 낙관적일 수 있으므로 두 추정을 함께 봄
+"""
+
+import os
+import math
+import time
+import shutil
+import tempfile
+from datetime import datetime
+
+import torch
+
+from benchmark import percentile
+from fake_compressor import FakeCompressor
+from model_profiler import profile_graph_module
+from model_tests import create_parametric_model, load_fx_model, trace_fx_model, verify_fx_model
+from utils import save_test_result
+
+# 이름과 create_parametric_model 인자. yolo는 create_yolo_compatible_model과 같은 구조(6.4MB),
+# xlarge는 압축에 실패한 원본 YOLOv8 ONNX와 같은 크기(167MB)
+SIZE_LADDER = (
+    {'name': 'tiny', 'depth': 2, 'width': 8, 'head_channels': 32},
+    {'name': 'small', 'depth': 3, 'width': 16, 'head_channels': 128},
+    {'name': 'yolo', 'depth': 4, 'width': 32, 'head_channels': 512},
+    {'name': 'medium', 'depth': 5, 'width': 48, 'head_channels': 768},
+    {'name': 'large', 'depth': 6, 'width': 64, 'head_channels': 1024},
+    {'name': 'xlarge', 'depth': 7, 'width': 64, 'head_channels': 2000},
+)
+STAGES = ('trace', 'save', 'load', 'verify', 'compress')
+MEMORY_METRICS = ('param_bytes', 'peak_activation_bytes')
+TARGET_MODEL_SIZE = 167 * 1024 * 1024
+DEFAULT_INPUT_SHAPE = (1, 3, 224, 224)
+
+
+def fit_power_law(xs, ys):
+    """
+    log-log 최소제곱으로 y = coefficient * x^exponent 적합 (0 이하 값은 제외)
+
+    Returns:
+        dict: coefficient, exponent, r2, points. 점이 2개 미만이면 None
+    """
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+    intercept = mean_y - exponent * mean_x
+    ss_total = sum((y - mean_y) ** 2 for _, y in points)
+    ss_residual = sum((y - intercept - exponent * x) ** 2 for x, y in points)
+    return {
+        'coefficient': math.exp(intercept),
+        'exponent': exponent,
+        'r2': 1 - ss_residual / ss_total if ss_total > 0 else 1.0,
+        'points': len(points)
+    }
+
+
+def fit_linear(xs, ys):
+    """
+    최소제곱 직선 y = intercept + slope * x
+
+    Returns:
+        dict: intercept, slope, r2, points. 점이 2개 미만이면 None
+    """
+    points = list(zip(xs, ys))
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+    intercept = mean_y - slope * mean_x
+    ss_total = sum((y - mean_y) ** 2 for _, y in points)
+    ss_residual = sum((y - intercept - slope * x) ** 2 for x, y in points)
+    return {
+        'intercept': intercept,
+        'slope': slope,
+        'r2': 1 - ss_residual / ss_total if ss_total > 0 else 1.0,
+        'points': len(points)
+    }
+
+
+def predict(fit, x):
+    """적합 결과(fit_power_law 또는 fit_linear)의 x에서의 값"""
+    if 'exponent' in fit:
+        return fit['coefficient'] * x ** fit['exponent']
+    return fit['intercept'] + fit['slope'] * x
+
+
+def _timed(func):
+    start = time.perf_counter()
+    value = func()
+    return time.perf_counter() - start, value
+
+
+def measure_config(config, work_dir, repeats=3, compressor=None, input_shape=DEFAULT_INPUT_SHAPE):
+    """
+    모델 하나의 단계별 시간(반복 측정의 중앙값, 초)과 크기/메모리 측정
+
+    Args:
+        config (dict): name과 create_parametric_model 인자
+        compressor: 압축 단계에 쓸 대역 (기본: 지연 없는 FakeCompressor → 업로드/복사/메타데이터 기록 비용)
+    """
+    compressor = compressor or FakeCompressor()
+    model_kwargs = {key: value for key, value in config.items() if key != 'name'}
+    name = config.get('name') or "_".join(f"{key}{value}" for key, value in sorted(model_kwargs.items()))
+    model = create_parametric_model(**model_kwargs)
+    model_path = os.path.join(work_dir, f"{name}.pt")
+    input_shapes = [{"batch": input_shape[0], "channel": input_shape[1], "dimension": list(input_shape[2:])}]
+
+    timings = {stage: [] for stage in STAGES}
+    for repeat in range(repeats):
+        elapsed, graph_module = _timed(lambda: trace_fx_model(model))
+        timings['trace'].append(elapsed)
+        timings['save'].append(_timed(lambda: torch.save(graph_module, model_path))[0])
+        timings['load'].append(_timed(lambda: load_fx_model(model_path))[0])
+
+        elapsed, (verified, message) = _timed(lambda: verify_fx_model(model_path, input_shape))
+        if not verified:
+            raise RuntimeError(f"{name} 검증 실패: {message}")
+        timings['verify'].append(elapsed)
+
+        output_dir = os.path.join(work_dir, f"{name}_compressed_{repeat}")
+        timings['compress'].append(_timed(lambda: compressor.automatic_compression(
+            input_model_path=model_path, output_dir=output_dir, input_shapes=input_shapes))[0])
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    profile = profile_graph_module(graph_module, input_shape)
+    row = {
+        'name': name,
+        'config': model_kwargs,
+        'params': sum(p.numel() for p in graph_module.parameters()),
+        'param_bytes': sum(p.numel() * p.element_size() for p in graph_module.parameters()),
+        'peak_activation_bytes': profile['peak_activation_bytes'],
+        'macs': profile['totals']['macs'],
+        'file_size': os.path.getsize(model_path),
+        'stages': {stage: percentile(sorted(values), 50) for stage, values in timings.items()}
+    }
+    os.remove(model_path)
+    return row
+
+
+def scaling_curves(rows):
+    """
+    단계별 시간과 메모리 지표를 파일 크기에 대해 적합
+
+    Returns:
+        dict: 지표 → {'power': fit_power_law 결과, 'linear': fit_linear 결과}
+    """
+    sizes = [row['file_size'] for row in rows]
+    series = {stage: [row['stages'][stage] for row in rows] for stage in STAGES}
+    series.update({metric: [row[metric] for row in rows] for metric in MEMORY_METRICS})
+    return {key: {'power': fit_power_law(sizes, values), 'linear': fit_linear(sizes, values)}
+            for key, values in series.items()}
+
+
+def run_scaling_benchmark(configs=SIZE_LADDER, work_dir=None, repeats=3, compressor=None,
+                          input_shape=DEFAULT_INPUT_SHAPE, target_size=TARGET_MODEL_SIZE):
+    """
+    크기 사다리 전체 측정 후 확장 곡선과 target_size(바이트)에서의 추정값 계산
+
+    Returns:
+        dict: rows(작은 모델부터), curves(지표별 적합), target_size, projected(지표별 추정값), elapsed, timestamp
+    """
+    start = time.perf_counter()
+    temp_dir = None
+    if work_dir is None:
+        temp_dir = work_dir = tempfile.mkdtemp(prefix="netspresso_scaling_")
+    os.makedirs(work_dir, exist_ok=True)
+    try:
+        rows = [measure_config(config, work_dir, repeats=repeats, compressor=compressor, input_shape=input_shape)
+                for config in configs]
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    rows.sort(key=lambda row: row['file_size'])
+
+    curves = scaling_curves(rows)
+    return {
+        'rows': rows,
+        'curves': curves,
+        'input_shape': list(input_shape),
+        'repeats': repeats,
+        'target_size': target_size,
+        'projected': {key: {kind: predict(fit, target_size) if fit is not None else None
+                            for kind, fit in fits.items()}
+                      for key, fits in curves.items()},
+        'elapsed': time.perf_counter() - start,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def save_scaling_result(scaling, output_path):
+    """확장성 벤치마크 결과를 표준 결과 JSON으로 저장"""
+    save_test_result({'success': bool(scaling['rows']), 'scaling': scaling}, output_path)
+    return output_path
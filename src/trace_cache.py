@@ -0,0 +1,77 @@
+"""
+세션 간 공유되는 symbolic_trace 결과 캐시
+모델 클래스 소스 + 생성자 인자 + torch 버전을 키로 traced GraphModule 아티팩트를 디스크에 보관하고,
+파일 잠금으로 여러 프로세스(pytest-xdist 워커 등)가 동시에 접근해도 한 번만 trace되도록 함
+"""
+
+import os
+import inspect
+import hashlib
+from pathlib import Path
+
+import torch
+
+from model_tests import load_fx_model, save_fx_model
+from tracing import span
+from utils import file_lock
+
+DEFAULT_TRACE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'netspresso_qa', 'traces')
+
+
+def trace_cache_key(factory, args=(), kwargs=None, format='torch'):
+    """
+    캐시 키 계산
+
+    factory는 모델 클래스 또는 모델을 만드는 함수(model_tests.create_* 처럼 클래스를 내부에 정의한 함수)이며,
+    그 소스 코드가 바뀌면 키도 바뀜
+    """
+    try:
+        source = inspect.getsource(factory)
+    except (OSError, TypeError):
+        source = f"{factory.__module__}.{factory.__qualname__}"
+    digest = hashlib.sha256()
+    for part in (source, repr(tuple(args)), repr(sorted((kwargs or {}).items())), torch.__version__, format):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def get_traced_model_path(factory, *args, format='torch', cache_dir=None, **kwargs):
+    """
+    factory(*args, **kwargs)로 만든 모델을 trace한 아티팩트 경로 반환 (없으면 생성)
+
+    Args:
+        factory: 모델 클래스 또는 모델 생성 함수
+        format (str): 'torch'(NetsPresso 업로드용) 또는 'fxa'(mmap 로드용)
+        cache_dir (str): 캐시 디렉토리 (기본값: NETSPRESSO_TRACE_CACHE_DIR 또는 ~/.cache/netspresso_qa/traces)
+
+    Returns:
+        str: 캐시된 아티팩트 경로
+    """
+    cache_dir = Path(cache_dir or os.getenv('NETSPRESSO_TRACE_CACHE_DIR', DEFAULT_TRACE_CACHE_DIR))
+    key = trace_cache_key(factory, args, kwargs, format)
+    extension = '.fxa' if format == 'fxa' else '.pt'
+    artifact_path = cache_dir / f"{getattr(factory, '__name__', 'model')}_{key[:16]}{extension}"
+
+    with span('trace_cache', hit=True) as span_args:
+        if artifact_path.exists():
+            return str(artifact_path)
+
+        with file_lock(cache_dir / f".{key[:16]}.lock"):
+            # 잠금 대기 중 다른 프로세스가 만들었을 수 있음
+            if artifact_path.exists():
+                return str(artifact_path)
+
+            span_args['hit'] = False
+            tmp_path = artifact_path.with_name(f".{artifact_path.name}.{os.getpid()}.tmp")
+            if not save_fx_model(factory(*args, **kwargs), str(tmp_path), format=format):
+                tmp_path.unlink(missing_ok=True)
+                raise RuntimeError(f"symbolic_trace 실패: {getattr(factory, '__name__', factory)}")
+            os.replace(tmp_path, artifact_path)
+
+    return str(artifact_path)
+
+
+def load_traced_model(factory, *args, format='torch', cache_dir=None, **kwargs):
+    """캐시된 traced GraphModule 로드 (없으면 trace 후 저장)"""
+    return load_fx_model(get_traced_model_path(factory, *args, format=format, cache_dir=cache_dir, **kwargs))
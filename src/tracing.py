@@ -0,0 +1,189 @@
+"""
+압축 파이프라인 단계별 타이밍 span
+precheck / trace / 업로드 / 상태 조회 / 압축 / 다운로드가 각각 얼마나 걸렸는지 중첩 span으로 기록하고,
+Perfetto(ui.perfetto.dev)나 chrome://tracing에서 열 수 있는 Chrome trace-event JSON으로 내보냄
+
+활성 Tracer는 contextvars로 전달하므로 span()은 어디서 호출해도 되고, 활성 Tracer가 없으면 아무것도 하지 않음.
+새 스레드는 빈 context로 시작하므로 스레드 풀의 작업마다 독립된 Tracer를 쓸 수 있음
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+import contextvars
+from contextlib import contextmanager
+from functools import wraps
+
+_active_tracer = contextvars.ContextVar('netspresso_tracer', default=None)
+
+
+class Tracer:
+    """
+    span 기록기
+
+    각 span은 name, start(epoch 초), duration(초), depth(중첩 깊이), thread, args를 가진 dict
+
+    Args:
+        on_span_start (callable): span이 시작될 때 (name, args)로 호출 (진행 단계 추적용).
+            여기서 난 예외는 span 안의 코드에서 난 것처럼 전파됨
+    """
+
+    def __init__(self, on_span_start=None):
+        self.spans = []
+        self.on_span_start = on_span_start
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # perf_counter(단조 시계)로 재고 epoch 기준으로 환산해 여러 Tracer의 span을 한 타임라인에 놓을 수 있게 함
+        self._epoch_offset = time.time() - time.perf_counter()
+
+    @contextmanager
+    def span(self, name, **args):
+        """name 구간의 시간을 기록. 예외가 나면 args에 error 타입을 남기고 다시 던짐"""
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            if self.on_span_start is not None:
+                self.on_span_start(name, args)
+            yield args
+        except BaseException as e:
+            args['error'] = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            self._local.depth = depth
+            record = {
+                'name': name,
+                'start': self._epoch_offset + start,
+                'duration': duration,
+                'depth': depth,
+                'thread': threading.get_ident()
+            }
+            if args:
+                record['args'] = args
+            with self._lock:
+                self.spans.append(record)
+
+    def add_spans(self, spans):
+        """다른 Tracer가 기록한 span을 현재 스레드의 열린 span 아래로 옮겨 담음"""
+        depth = getattr(self._local, 'depth', 0)
+        with self._lock:
+            self.spans.extend(dict(record, depth=record['depth'] + depth) for record in spans)
+
+    @contextmanager
+    def activate(self):
+        """현재 context의 활성 Tracer로 지정 (module 수준 span()이 이 Tracer에 기록)"""
+        token = _active_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _active_tracer.reset(token)
+
+
+def current_tracer():
+    """활성 Tracer (없으면 None)"""
+    return _active_tracer.get()
+
+
+@contextmanager
+def span(name, **args):
+    """활성 Tracer가 있으면 span 기록, 없으면 아무것도 하지 않음"""
+    tracer = _active_tracer.get()
+    if tracer is None:
+        yield args
+        return
+    with tracer.span(name, **args) as span_args:
+        yield span_args
+
+
+def traced(name):
+    """함수 호출 전체를 name span으로 감싸는 데코레이터"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        wrapper.traced_span = name
+        return wrapper
+    return decorator
+
+
+def instrument_methods(obj, method_spans):
+    """
+    객체의 메서드를 span으로 감싼 인스턴스 속성으로 덮어씀 (소스를 고칠 수 없는 SDK 객체용)
+
+    Args:
+        method_spans (dict): 메서드 이름 → span 이름. 없거나 이미 감싼 메서드는 건너뜀
+    """
+    for method_name, span_name in method_spans.items():
+        method = getattr(obj, method_name, None)
+        if callable(method) and not hasattr(method, 'traced_span'):
+            setattr(obj, method_name, traced(span_name)(method))
+    return obj
+
+
+def stage_durations(spans):
+    """
+    span 이름별 총 시간(초)과 self 시간(자식 span을 뺀 시간)
+
+    Returns:
+        dict: 이름 → {'count', 'total', 'self'}
+    """
+    stages = {}
+    # 한 스레드의 span은 엄격히 중첩되므로, 시작 순으로 훑으면 바로 위 깊이의 마지막 span이 부모
+    by_thread = {}
+    for record in spans:
+        by_thread.setdefault(record['thread'], []).append(record)
+    for records in by_thread.values():
+        stack = []
+        for record in sorted(records, key=lambda r: (r['start'], r['depth'])):
+            while stack and stack[-1]['depth'] >= record['depth']:
+                stack.pop()
+            stage = stages.setdefault(record['name'], {'count': 0, 'total': 0.0, 'self': 0.0})
+            stage['count'] += 1
+            stage['total'] += record['duration']
+            stage['self'] += record['duration']
+            if stack:
+                stages[stack[-1]['name']]['self'] -= record['duration']
+            stack.append(record)
+    return stages
+
+
+def to_chrome_trace(spans, process_name="netspresso_qa"):
+    """span 목록을 Chrome trace-event 형식 dict로 변환 (완료 이벤트 'X', 마이크로초 단위)"""
+    origin = min((record['start'] for record in spans), default=0.0)
+    pid = os.getpid()
+    events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': process_name}}]
+    for record in sorted(spans, key=lambda r: (r['start'], r['depth'])):
+        event = {
+            'name': record['name'],
+            'cat': 'compression',
+            'ph': 'X',
+            'ts': round((record['start'] - origin) * 1e6, 3),
+            'dur': round(record['duration'] * 1e6, 3),
+            'pid': pid,
+            'tid': record['thread']
+        }
+        if record.get('args'):
+            event['args'] = {key: value if isinstance(value, (int, float, bool)) or value is None else str(value)
+                             for key, value in record['args'].items()}
+        events.append(event)
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def export_chrome_trace(spans, output_path, process_name="netspresso_qa"):
+    """Chrome trace-event JSON 파일로 저장 (임시 파일에 쓴 뒤 교체). 저장 경로 반환"""
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(to_chrome_trace(spans, process_name), f, ensure_ascii=False)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return output_path
@@ -4,9 +4,19 @@
 
 import os
 import json
+import hashlib
 import logging
+import tempfile
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 def setup_logging():
     """로깅 설정"""
     logging.basicConfig(
@@ -26,8 +36,43 @@ def ensure_dir(directory):
         return True
     return False
 
-def save_test_result(result, output_path):
-    """테스트 결과를 JSON 파일로 저장"""
+@contextmanager
+def file_lock(lock_path):
+    """프로세스 간 배타적 파일 잠금"""
+    os.makedirs(os.path.dirname(os.path.abspath(lock_path)), exist_ok=True)
+    with open(lock_path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def save_test_result(result, output_path, test_name=None):
+    """
+    테스트 결과를 JSON 파일로 저장
+    
+    output_path가 .jsonl이면 파일을 새로 만들지 않고 append-only 결과 로그(results_log)에 한 줄로 덧붙이고,
+    .db면 SQLite 결과 DB(results_db)에 저장.
+    이때 test_name을 주지 않으면 result['test_name'] 또는 'result'를 사용
+    """
+    if str(output_path).endswith('.jsonl'):
+        from results_log import append_test_result
+        append_test_result(output_path, test_name or result.get('test_name', 'result'), result)
+        return
+    if str(output_path).endswith('.db'):
+        from results_db import ResultsDB
+        with ResultsDB(output_path) as db:
+            db.add_result(test_name or result.get('test_name', 'result'), result.get('success', False), result)
+        return
+    
     ensure_dir(os.path.dirname(output_path))
     
     result_data = {
@@ -62,43 +107,163 @@ def format_file_size(size_bytes):
     
     return f"{size_bytes:.1f}{size_names[i]}"
 
-def get_model_info(model_path):
-    """모델 파일 정보 수집"""
+def hash_file(file_path, chunk_size=1024 * 1024):
+    """파일 내용의 SHA-256 해시 (청크 단위로 읽어 메모리 사용 최소화)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_model_info(model_path, input_shape=None):
+    """
+    모델 파일 정보 수집
+    
+    input_shape(예: (1, 3, 224, 224))를 주면 model_profiler로 파라미터 수, MACs/FLOPs,
+    최대 활성화 메모리를 함께 계산 (모델 해시 기준으로 캐시됨)
+    """
     if not os.path.exists(model_path):
         return {"error": "파일이 존재하지 않음"}
     
     file_size = os.path.getsize(model_path)
     file_ext = os.path.splitext(model_path)[1]
     
-    return {
+    info = {
         "path": model_path,
         "size": file_size,
         "size_readable": format_file_size(file_size),
         "extension": file_ext,
         "exists": True
     }
+    
+    if input_shape is not None:
+        # torch 로드 비용은 프로파일이 필요할 때만 부담
+        from model_profiler import profile_model
+        
+        try:
+            profile = profile_model(model_path, input_shape)
+            info["profile"] = profile
+            info["params"] = profile['totals']['params']
+            info["macs"] = profile['totals']['macs']
+            info["flops"] = profile['totals']['flops']
+            info["peak_activation_bytes"] = profile['peak_activation_bytes']
+            info["peak_activation_readable"] = format_file_size(profile['peak_activation_bytes'])
+        except Exception as e:
+            info["profile_error"] = str(e)
+    
+    return info
+
+class ResultRecord:
+    """스트리밍 수집기의 결과 메타데이터 (details는 spill 파일의 offset/length만 보관)"""
+    
+    __slots__ = ('test_name', 'success', 'timestamp', 'offset', 'length')
+    
+    def __init__(self, test_name, success, timestamp, offset, length):
+        self.test_name = test_name
+        self.success = success
+        self.timestamp = timestamp
+        self.offset = offset
+        self.length = length
+
+
+class SpilledResults:
+    """
+    spill 파일에 저장된 결과를 dict로 하나씩 읽어 주는 지연 시퀀스
+    
+    여러 번 순회할 수 있고 len / bool을 지원하므로 기존 results 리스트 자리에 그대로 쓸 수 있음
+    """
+    
+    def __init__(self, records, spill_file, lock):
+        self._records = records
+        self._spill_file = spill_file
+        self._lock = lock
+    
+    def __len__(self):
+        return len(self._records)
+    
+    def __bool__(self):
+        return bool(self._records)
+    
+    def __iter__(self):
+        for index in range(len(self._records)):
+            yield self._load(self._records[index])
+    
+    def _load(self, record):
+        with self._lock:
+            self._spill_file.flush()
+            self._spill_file.seek(record.offset)
+            data = self._spill_file.read(record.length)
+        return {
+            'test_name': record.test_name,
+            'success': record.success,
+            'timestamp': record.timestamp,
+            'details': json.loads(data)
+        }
+
 
 class TestResultCollector:
-    """테스트 결과 수집 및 정리"""
+    """
+    테스트 결과 수집 및 정리
     
-    def __init__(self):
-        self.results = []
+    db(results_db.ResultsDB 또는 DB 파일 경로)를 주면 추가되는 결과를 결과 DB에도 저장.
+    streaming=True면 details를 임시 spill 파일로 내보내고 메타데이터만 __slots__ 레코드로 보관하여
+    결과 수가 많아도 메모리 사용량이 작게 유지되며, results는 지연 시퀀스(SpilledResults)가 됨.
+    성공/실패 수와 소요 시간 집계는 추가 시점에 누적하므로 get_summary는 결과 수와 무관하게 O(1)
+    """
+    
+    def __init__(self, db=None, streaming=False, spill_dir=None):
         self.start_time = datetime.now()
+        self.success_count = 0
+        self.duration_count = 0
+        self.duration_total = 0.0
+        self.duration_max = 0.0
+        self.streaming = streaming
+        if streaming:
+            self._records = []
+            self._spill_lock = threading.Lock()
+            self._spill_file = tempfile.TemporaryFile(mode='a+b', dir=spill_dir)
+            self.results = SpilledResults(self._records, self._spill_file, self._spill_lock)
+        else:
+            self.results = []
+        if isinstance(db, (str, os.PathLike)):
+            from results_db import ResultsDB
+            db = ResultsDB(db)
+        self.db = db
     
     def add_result(self, test_name, success, details=None):
         """테스트 결과 추가"""
-        result = {
-            'test_name': test_name,
-            'success': success,
-            'timestamp': datetime.now().isoformat(),
-            'details': details or {}
-        }
-        self.results.append(result)
+        details = details or {}
+        timestamp = datetime.now().isoformat()
+        
+        if self.streaming:
+            data = json.dumps(details, ensure_ascii=False, default=str).encode('utf-8')
+            with self._spill_lock:
+                self._spill_file.seek(0, os.SEEK_END)
+                offset = self._spill_file.tell()
+                self._spill_file.write(data)
+                self._records.append(ResultRecord(test_name, success, timestamp, offset, len(data)))
+        else:
+            self.results.append({
+                'test_name': test_name,
+                'success': success,
+                'timestamp': timestamp,
+                'details': details
+            })
+        
+        if success:
+            self.success_count += 1
+        duration = details.get('duration')
+        if isinstance(duration, (int, float)):
+            self.duration_count += 1
+            self.duration_total += duration
+            self.duration_max = max(self.duration_max, duration)
+        if self.db is not None:
+            self.db.add_result(test_name, success, details, timestamp)
     
     def get_summary(self):
         """테스트 요약 정보 반환"""
         total = len(self.results)
-        success = sum(1 for r in self.results if r['success'])
+        success = self.success_count
         failed = total - success
         
         return {
@@ -107,11 +272,23 @@ class TestResultCollector:
             'failed_count': failed,
             'success_rate': (success / total * 100) if total > 0 else 0,
             'test_duration': (datetime.now() - self.start_time).total_seconds(),
+            'durations': {
+                'count': self.duration_count,
+                'total': self.duration_total,
+                'mean': self.duration_total / self.duration_count if self.duration_count else 0,
+                'max': self.duration_max
+            },
             'results': self.results
         }
     
     def save_summary(self, output_path):
         """요약 결과를 파일로 저장"""
         summary = self.get_summary()
+        summary['results'] = list(summary['results'])
         save_test_result(summary, output_path)
-        return summary
\ No newline at end of file
+        return summary
+    
+    def close(self):
+        """spill 파일 정리"""
+        if self.streaming:
+            self._spill_file.close()
@@ -0,0 +1,40 @@
+"""
+공통 pytest 설정
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="NetsPresso 압축 결과 캐시를 사용하지 않음"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--no-cache"):
+        os.environ['NETSPRESSO_NO_CACHE'] = '1'
+
+
+@pytest.fixture(scope="session")
+def simple_fx_model_path():
+    """trace 캐시에서 가져온 간단한 CNN GraphModule 경로 (머신당 한 번만 trace)"""
+    from model_tests import create_simple_test_model
+    from trace_cache import get_traced_model_path
+    return get_traced_model_path(create_simple_test_model)
+
+
+@pytest.fixture(scope="session")
+def yolo_fx_model_path():
+    """trace 캐시에서 가져온 YOLO 유사 GraphModule 경로"""
+    from model_tests import create_yolo_compatible_model
+    from trace_cache import get_traced_model_path
+    return get_traced_model_path(create_yolo_compatible_model)
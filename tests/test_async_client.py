@@ -0,0 +1,167 @@
+"""
+asyncio 압축 작업 API 테스트 (오프라인 대역 backend)
+"""
+
+import pytest
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from async_client import AsyncCompressionClient, ExecutorBackend
+from fake_compressor import FakeCompressor
+
+class BlockingOnlyCompressor:
+    """automatic_compression만 있는 SDK compressor 흉내"""
+
+    def __init__(self, **options):
+        self._compressor = FakeCompressor(**options)
+
+    def automatic_compression(self, **kwargs):
+        return self._compressor.automatic_compression(**kwargs)
+
+class SdkErrorCompressor:
+    """실제 SDK처럼 예외 대신 status='error' / 'stopped' metadata를 반환하는 compressor"""
+
+    def __init__(self, status='error', message="ConnectionError: Max retries exceeded"):
+        self.status = status
+        self.message = message
+
+    def automatic_compression(self, **kwargs):
+        return SimpleNamespace(status=self.status, compressed_model_path="",
+                               error_detail=SimpleNamespace(name="", message=self.message))
+
+class TestAsyncClient:
+
+    @pytest.fixture
+    def model_path(self, tmp_path):
+        path = tmp_path / "model.pt"
+        path.write_bytes(b"0" * 4096)
+        return str(path)
+
+    def test_hundreds_of_jobs_in_one_loop(self, model_path, tmp_path):
+        compressor = FakeCompressor(latency=0.3, latency_jitter=0.1, seed=0)
+        client = AsyncCompressionClient(compressor, precheck=False)
+        jobs = [{'model_path': model_path, 'output_dir': str(tmp_path / f"out_{i}")} for i in range(300)]
+
+        async def run():
+            return [result async for result in client.compress_many(jobs)]
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 300 and all(r['success'] for r in results)
+        assert sorted(r['job_index'] for r in results) == list(range(300))
+        assert all(os.path.exists(r['compressed_path']) for r in results)
+        assert elapsed < 3, f"{elapsed:.2f}초"
+        # 다음 상태 변화 시각(retry_after)을 따르므로 작업당 조회 수가 작음
+        assert compressor.stats['polls'] / 300 < 10
+
+    def test_server_slots_and_in_flight_limit(self, model_path, tmp_path):
+        compressor = FakeCompressor(latency=0.1, max_concurrent=2)
+        client = AsyncCompressionClient(compressor, precheck=False, max_in_flight=3)
+
+        async def run():
+            jobs = [await client.submit(model_path, str(tmp_path / f"out_{i}")) for i in range(3)]
+            in_flight_before = sum(not job.done() for job in jobs)
+            fourth = await client.submit(model_path, str(tmp_path / "out_3"))
+            return in_flight_before, [await job.result() for job in jobs + [fourth]]
+
+        start = time.perf_counter()
+        in_flight_before, results = asyncio.run(run())
+        assert in_flight_before == 3
+        assert all(r['success'] for r in results)
+        # 슬롯 2개에 4개 작업 → 최소 2번 차례를 기다림
+        assert time.perf_counter() - start >= 0.2
+
+    def test_cancel(self, model_path, tmp_path):
+        compressor = FakeCompressor(latency=5)
+        client = AsyncCompressionClient(compressor, precheck=False)
+
+        async def run():
+            job = await client.submit(model_path, str(tmp_path / "out"))
+            await asyncio.sleep(0.05)
+            assert job.cancel()
+            assert not job.cancel()
+            return await job.result(timeout=1)
+
+        result = asyncio.run(run())
+        assert result['status'] == 'cancelled' and not result['success']
+        assert compressor.stats['cancelled'] == 1
+        assert not (tmp_path / "out").exists()
+
+    def test_job_timeout_cancels_backend_job(self, model_path, tmp_path):
+        compressor = FakeCompressor(latency=5)
+        client = AsyncCompressionClient(compressor, precheck=False, timeout=0.2)
+
+        start = time.perf_counter()
+        result = asyncio.run(client.compress(model_path, str(tmp_path / "out")))
+        assert result['status'] == 'timeout' and result['error_type'] == 'TimeoutError'
+        assert time.perf_counter() - start < 1
+        assert compressor.stats['cancelled'] == 1
+
+    def test_result_wait_timeout_keeps_job_running(self, model_path, tmp_path):
+        client = AsyncCompressionClient(FakeCompressor(latency=0.3), precheck=False)
+
+        async def run():
+            job = await client.submit(model_path, str(tmp_path / "out"))
+            with pytest.raises(asyncio.TimeoutError):
+                await job.result(timeout=0.05)
+            return await job.result()
+
+        assert asyncio.run(run())['success']
+
+    def test_failures_are_results(self, model_path, tmp_path):
+        onnx_path = tmp_path / "model.onnx"
+        onnx_path.write_bytes(b"0" * 1024)
+        client = AsyncCompressionClient(FakeCompressor(fail_first=1), precheck=False)
+
+        async def run():
+            first = await client.compress(model_path, str(tmp_path / "a"))
+            second = await client.compress(str(onnx_path), str(tmp_path / "b"))
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first['status'] == 'error' and first['error_type'] == 'ConnectionError'
+        assert second['status'] == 'failed' and second['error_type'] == 'NotValidFrameworkException'
+
+    def test_precheck_rejects_before_submit(self, tmp_path):
+        bad_path = tmp_path / "model.txt"
+        bad_path.write_text("not a model")
+        compressor = FakeCompressor()
+        result = asyncio.run(AsyncCompressionClient(compressor).compress(str(bad_path), str(tmp_path / "out")))
+        assert result['status'] == 'precheck_failed'
+        assert compressor.stats['calls'] == 0
+
+    def test_executor_adapter_with_backoff(self, model_path, tmp_path):
+        blocking = BlockingOnlyCompressor(latency=0.4)
+        client = AsyncCompressionClient(blocking, precheck=False, poll_interval=0.01, backoff=2.0, jitter=0)
+        assert isinstance(client.backend, ExecutorBackend)
+
+        async def run():
+            jobs = [await client.submit(model_path, str(tmp_path / f"out_{i}")) for i in range(4)]
+            return [await job.result() for job in jobs]
+
+        results = asyncio.run(run())
+        client.backend.shutdown()
+        assert all(r['success'] for r in results)
+        # 0.01 → 0.02 → 0.04 … 로 늘어나므로 0.4초 작업에 조회 10회 미만
+        assert all(r['polls'] < 10 for r in results)
+
+    def test_executor_adapter_maps_sdk_error_metadata(self, model_path, tmp_path):
+        async def run(compressor):
+            client = AsyncCompressionClient(compressor, precheck=False, poll_interval=0.01)
+            result = await client.compress(model_path, str(tmp_path / "out"))
+            client.backend.shutdown()
+            return result
+
+        error = asyncio.run(run(SdkErrorCompressor()))
+        assert error['success'] is False and error['status'] == 'failed'
+        assert error['error'] == "ConnectionError: Max retries exceeded" and error['error_type'] == 'CompressionError'
+        assert error['compressed_path'] is None
+
+        stopped = asyncio.run(run(SdkErrorCompressor(status='stopped', message="")))
+        assert stopped['status'] == 'failed' and stopped['error_type'] == 'CompressionStopped'
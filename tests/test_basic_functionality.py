@@ -7,10 +7,24 @@ import torch
 import torch.fx
 import os
 import sys
+import time
+from types import SimpleNamespace
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from netspresso_client import NetsPresssoQAClient, create_simple_test_model
 
+class SleepingCompressor:
+    """모델 경로별로 지정된 시간만큼 대기하는 테스트용 compressor"""
+    
+    def __init__(self, delays):
+        self.delays = delays
+    
+    def automatic_compression(self, input_model_path, output_dir, input_shapes, compression_ratio):
+        time.sleep(self.delays[input_model_path])
+        if input_model_path == "broken.pt":
+            raise RuntimeError("압축 실패")
+        return SimpleNamespace(status='completed', compressed_model_path=f"{output_dir}/compressed.pt")
+
 class TestBasicFunctionality:
     
     @pytest.fixture
@@ -18,13 +32,9 @@ class TestBasicFunctionality:
         return NetsPresssoQAClient()
     
     @pytest.fixture
-    def simple_model_path(self, tmp_path):
-        """간단한 테스트 모델 생성"""
-        model = create_simple_test_model()
-        fx_model = torch.fx.symbolic_trace(model)
-        model_path = tmp_path / "simple_test_model.pt"
-        torch.save(fx_model, model_path)
-        return str(model_path)
+    def simple_model_path(self, simple_fx_model_path):
+        """간단한 테스트 모델 (trace 캐시 사용)"""
+        return simple_fx_model_path
     
     def test_client_initialization(self, client):
         """클라이언트 초기화 테스트"""
@@ -45,6 +55,24 @@ class TestBasicFunctionality:
             assert result['status'] == 'completed', "성공 시 상태는 completed여야 함"
         else:
             assert result['error'] is not None, "실패 시 에러 메시지가 제공되어야 함"
+    
+    def test_compress_many_streams_results(self):
+        """배치 압축은 먼저 끝난 작업부터 반환하고 가장 느린 작업 시간 수준에 끝나야 함"""
+        delays = {"slow.pt": 0.4, "fast.pt": 0.05, "broken.pt": 0.1, "mid.pt": 0.2}
+        client = NetsPresssoQAClient(compressor=SleepingCompressor(delays), use_cache=False, precheck=False)
+        jobs = [{"model_path": path, "output_dir": f"./results/{path}"} for path in delays]
+        
+        start = time.perf_counter()
+        results = list(client.compress_many(jobs, max_workers=4))
+        elapsed = time.perf_counter() - start
+        
+        assert [r['model_path'] for r in results] == ["fast.pt", "broken.pt", "mid.pt", "slow.pt"]
+        assert elapsed < sum(delays.values()), "작업이 병렬로 실행되어야 함"
+        for result in results:
+            assert {'success', 'status', 'compressed_path', 'error', 'duration', 'wall_time'} <= set(result)
+            assert result['duration'] >= delays[result['model_path']]
+        broken = next(r for r in results if r['model_path'] == "broken.pt")
+        assert broken['success'] is False and broken['error'] == "압축 실패"
 
 if __name__ == "__main__":
     # 직접 실행 시 간단한 테스트
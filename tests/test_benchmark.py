@@ -0,0 +1,79 @@
+"""
+추론 지연 시간 벤치마크 테스트
+"""
+
+import pytest
+import torch
+import os
+import sys
+import threading
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from benchmark import benchmark_model, compare_models, percentile, save_benchmark_result, time_model
+from generate_qa_report import generate_benchmark_section
+from fx_artifact import FX_LOCK
+from model_tests import load_fx_model
+from utils import load_test_result
+
+class TestBenchmark:
+
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([3.0], 90) == 3.0
+
+    def test_time_model_measures_plain_forward(self, simple_fx_model_path):
+        model = load_fx_model(simple_fx_model_path)
+        model.train()
+        train_calls = []
+        original_train = model.train
+        model.train = lambda mode=True: train_calls.append(mode) or original_train(mode)
+
+        # 다른 스레드가 FX_LOCK을 잡고 있어도 측정이 막히지 않고, eval()은 한 번만 호출
+        FX_LOCK.acquire()
+        try:
+            result = []
+            thread = threading.Thread(target=lambda: result.append(
+                time_model(model, torch.randn(1, 3, 32, 32), warmup=2, iterations=10)))
+            thread.start()
+            thread.join(timeout=30)
+        finally:
+            FX_LOCK.release()
+
+        assert not thread.is_alive() and len(result[0]) == 10
+        assert result[0] == sorted(result[0])
+        assert train_calls == [False] and not model.training
+
+    def test_benchmark_sweeps_batch_and_threads(self, simple_fx_model_path):
+        path = simple_fx_model_path
+        threads_before = torch.get_num_threads()
+
+        rows = benchmark_model(load_fx_model(path), sample_shape=(3, 32, 32), batch_sizes=(1, 4),
+                               num_threads=(1, 2), warmup=1, iterations=5)
+
+        assert [(r['batch_size'], r['num_threads']) for r in rows] == [(1, 1), (4, 1), (1, 2), (4, 2)]
+        for row in rows:
+            assert 0 < row['p50'] <= row['p90'] <= row['p99']
+            assert row['throughput'] > 0
+        assert torch.get_num_threads() == threads_before
+
+    def test_compare_and_report(self, tmp_path, simple_fx_model_path):
+        path = simple_fx_model_path
+
+        benchmark = compare_models(path, path, sample_shape=(3, 32, 32), batch_sizes=(2,),
+                                   num_threads=(1,), warmup=1, iterations=5)
+        assert len(benchmark['comparison']) == 1
+        assert benchmark['comparison'][0]['speedup_p50'] > 0
+
+        output_path = str(tmp_path / "results" / "simple_benchmark_result.json")
+        save_benchmark_result(benchmark, output_path)
+        saved = load_test_result(output_path)
+        section = generate_benchmark_section([{
+            'test_name': 'simple_benchmark_result',
+            'success': True,
+            'details': saved['result']
+        }])
+        assert "추론 벤치마크" in section
+        assert "| 2 | 1 |" in section
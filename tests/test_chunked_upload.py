@@ -0,0 +1,73 @@
+"""
+청크 단위 재개 가능 업로드 테스트
+"""
+
+import pytest
+import hashlib
+import os
+import sys
+import tracemalloc
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from chunked_upload import ChunkedUploader, LocalUploadServer, UploadError
+
+CHUNK = 64 * 1024
+
+class TestChunkedUpload:
+
+    @pytest.fixture
+    def model_file(self, tmp_path):
+        path = tmp_path / "model.pt"
+        path.write_bytes(os.urandom(CHUNK * 10 + 123))
+        return path
+
+    def test_roundtrip_integrity(self, tmp_path, model_file):
+        server = LocalUploadServer(tmp_path / "server")
+        stats = ChunkedUploader(server, chunk_size=CHUNK).upload(model_file)
+
+        assert stats['total_chunks'] == 11
+        assert stats['sent_chunks'] == 11 and stats['retries'] == 0
+        uploaded = tmp_path / "server" / "model.pt"
+        assert hashlib.sha256(uploaded.read_bytes()).digest() == hashlib.sha256(model_file.read_bytes()).digest()
+
+    def test_retry_resumes_from_acknowledged_chunk(self, tmp_path, model_file):
+        server = LocalUploadServer(tmp_path / "server", fail_chunks={3, 7})
+        stats = ChunkedUploader(server, chunk_size=CHUNK, retry_backoff=0).upload(model_file)
+
+        assert stats['retries'] == 2
+        assert server.received_chunks == 11, "실패한 청크만 다시 전송해야 함"
+        assert (tmp_path / "server" / "model.pt").read_bytes() == model_file.read_bytes()
+
+    def test_resume_after_abort(self, tmp_path, model_file):
+        server = LocalUploadServer(tmp_path / "server", fail_chunks={6})
+        with pytest.raises(UploadError):
+            ChunkedUploader(server, chunk_size=CHUNK, max_retries=0).upload(model_file)
+        assert server.received_chunks == 6
+
+        stats = ChunkedUploader(server, chunk_size=CHUNK).upload(model_file)
+
+        assert stats['skipped_chunks'] == 6
+        assert stats['sent_chunks'] == 5
+        assert (tmp_path / "server" / "model.pt").read_bytes() == model_file.read_bytes()
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.pt"
+        path.write_bytes(b"")
+        stats = ChunkedUploader(LocalUploadServer(tmp_path / "server"), chunk_size=CHUNK).upload(path)
+        assert stats['size'] == 0
+        assert (tmp_path / "server" / "empty.pt").read_bytes() == b""
+
+    def test_peak_memory_independent_of_file_size(self, tmp_path):
+        path = tmp_path / "large.pt"
+        with open(path, 'wb') as f:
+            for _ in range(32):
+                f.write(os.urandom(1024 * 1024))
+
+        tracemalloc.start()
+        try:
+            ChunkedUploader(LocalUploadServer(tmp_path / "server"), chunk_size=1024 * 1024).upload(path)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 1024 * 1024, f"32MB 업로드 중 최대 힙 사용량이 너무 큼: {peak} bytes"
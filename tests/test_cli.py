@@ -0,0 +1,87 @@
+"""
+통합 CLI 테스트 (하위 명령 동작 + report 경로의 import 시간 예산)
+"""
+
+import pytest
+import os
+import sys
+import json
+import subprocess
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from netspresso_qa import HEAVY_MODULES, build_parser, main
+
+CLI_PATH = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'netspresso_qa.py')
+
+# report / --help 경로의 import 시간 합계 상한 (torch 하나만 불러와도 1초를 훌쩍 넘음)
+IMPORT_BUDGET = 0.5
+
+
+def run_with_importtime(args, cwd):
+    """python -X importtime으로 CLI를 실행하고 (결과, {모듈: self 시간(초)}) 반환"""
+    completed = subprocess.run([sys.executable, '-X', 'importtime', CLI_PATH] + args, cwd=cwd,
+                               capture_output=True, text=True, timeout=60)
+    imports = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        imports[name.strip()] = int(self_us) / 1e6
+    return completed, imports
+
+
+class TestCLI:
+
+    @pytest.fixture
+    def results_dir(self, tmp_path):
+        results_dir = tmp_path / "results"
+        (results_dir / "test_results").mkdir(parents=True)
+        result = {'timestamp': "2026-01-01T00:00:00", 'result': {'success': True, 'details': {'duration': 1.0}}}
+        (results_dir / "test_results" / "simple_compression.json").write_text(json.dumps(result))
+        return results_dir
+
+    def assert_light(self, imports):
+        heavy = sorted(name for name in imports if name.split('.')[0] in HEAVY_MODULES)
+        assert not heavy, f"무거운 모듈 import: {heavy[:5]}"
+        assert sum(imports.values()) < IMPORT_BUDGET, f"import {sum(imports.values()):.3f}초"
+
+    def test_report_help_is_fast(self, tmp_path):
+        completed, imports = run_with_importtime(['report', '--help'], cwd=tmp_path)
+        assert completed.returncode == 0, completed.stderr
+        assert '--results-dir' in completed.stdout
+        self.assert_light(imports)
+
+    def test_report_is_fast(self, results_dir, tmp_path):
+        completed, imports = run_with_importtime(['report', '--results-dir', str(results_dir)], cwd=tmp_path)
+        assert completed.returncode == 0, completed.stdout
+        assert list((results_dir / "reports").glob("qa_report_*.md"))
+        self.assert_light(imports)
+
+    def test_subcommands(self):
+        parser = build_parser()
+        for command in ('compress', 'verify', 'bench', 'report', 'convert'):
+            assert command in parser.format_help()
+        args = parser.parse_args(['bench', 'a.pt', 'b.pt', '--batch-sizes', '1'])
+        assert args.batch_sizes == [1] and args.handler.__name__ == 'cmd_bench'
+        with pytest.raises(SystemExit):
+            parser.parse_args([])
+
+    def test_compress_with_fake_backend(self, simple_fx_model_path, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv('NETSPRESSO_FAKE_BACKEND', '0')  # --fake가 바꾼 값을 테스트 후 되돌림
+        trace_path = tmp_path / "trace.json"
+        exit_code = main(['compress', simple_fx_model_path, '--fake', '--no-cache',
+                          '--output-dir', str(tmp_path / "out"), '--trace', str(trace_path)])
+        assert exit_code == 0
+        assert "✅" in capsys.readouterr().out
+        assert list((tmp_path / "out").iterdir())
+        assert trace_path.exists()
+
+    def test_compress_with_local_backend(self, simple_fx_model_path, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv('NETSPRESSO_FAKE_BACKEND', '0')
+        monkeypatch.setenv('NETSPRESSO_LOCAL_BACKEND', '0')  # --local이 바꾼 값을 테스트 후 되돌림
+        exit_code = main(['compress', simple_fx_model_path, '--local', '--no-cache',
+                          '--output-dir', str(tmp_path / "out")])
+        assert exit_code == 0
+        with open(tmp_path / "out" / "metadata.json", encoding='utf-8') as f:
+            assert json.load(f)['backend'] == 'local'
@@ -0,0 +1,159 @@
+"""
+연결 풀 / 인증 토큰 디스크 캐시 테스트 (로컬 대역 HTTP 서버)
+"""
+
+import pytest
+import os
+import sys
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import requests
+
+import client_pool
+from client_pool import (LocalAuthServer, PooledAuth, SessionRequests, TokenCache, create_session,
+                         get_pooled_netspresso, install_session, make_test_token, token_expiry)
+
+class TestClientPool:
+
+    @pytest.fixture
+    def server(self):
+        with LocalAuthServer() as server:
+            yield server
+
+    @pytest.fixture
+    def token_cache(self, tmp_path):
+        return TokenCache(tmp_path / "auth")
+
+    def test_keep_alive_reuses_connection(self, server):
+        session = create_session(pool_size=2)
+        for _ in range(20):
+            assert session.get(f"{server.url}/ping").json() == {'ok': True}
+        assert server.stats['requests'] == 20
+        assert server.stats['connections'] == 1
+        session.close()
+
+    def test_pool_size_caps_connections(self, server):
+        session = create_session(pool_size=3)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: session.get(f"{server.url}/ping?delay=0.02").status_code, range(32)))
+        assert server.stats['requests'] == 32
+        assert server.stats['connections'] <= 3
+        session.close()
+
+    def test_token_cached_on_disk_across_clients(self, server, token_cache):
+        first = PooledAuth(server.auth_url, server.api_key, session=create_session(), token_cache=token_cache)
+        tokens = first.tokens()
+        assert first.tokens() is tokens
+        assert server.stats['logins'] == 1
+        assert token_expiry(tokens['access_token']) == tokens['expires_at']
+
+        # 새 프로세스 흉내: 새 Session + 같은 디스크 캐시 → 로그인 없음
+        second = PooledAuth(server.auth_url, server.api_key, session=create_session(), token_cache=token_cache)
+        assert second.tokens()['access_token'] == tokens['access_token']
+        assert server.stats['logins'] == 1
+
+        path = token_cache.path(server.api_key, server.auth_url)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert server.api_key not in path.name
+
+    def test_expiring_token_is_refreshed(self, server, token_cache):
+        server.token_ttl = 30  # 만료 여유(60초)보다 짧음
+        auth = PooledAuth(server.auth_url, server.api_key, session=create_session(), token_cache=token_cache)
+        first = auth.tokens()['access_token']
+        second = auth.tokens()['access_token']
+        assert first != second
+        assert server.stats['logins'] == 1 and server.stats['refreshes'] == 1
+
+        auth.invalidate()
+        assert token_cache.load(server.api_key, server.auth_url) is None
+
+    def test_invalid_api_key_is_not_cached(self, server, token_cache):
+        auth = PooledAuth(server.auth_url, "wrong-key", session=create_session(), token_cache=token_cache)
+        with pytest.raises(requests.HTTPError):
+            auth.tokens()
+        assert token_cache.load("wrong-key", server.auth_url) is None
+
+    def test_rejected_token_is_reissued_once(self, server, token_cache):
+        session = create_session()
+        auth = PooledAuth(server.auth_url, server.api_key, session=session, token_cache=token_cache)
+        pooled_requests = SessionRequests(session, [auth])
+        url = f"{server.url}/protected"
+        assert pooled_requests.get(url, headers={'Authorization': f"Bearer {auth.tokens()['access_token']}"}).ok
+
+        # 서버가 토큰을 폐기 → 401 → 무효화 후 새 토큰으로 한 번 재시도
+        rejected = auth.tokens()['access_token']
+        server.revoke_tokens()
+        response = pooled_requests.get(url, headers={'Authorization': f"Bearer {rejected}"})
+        assert response.status_code == 200
+        assert server.stats['unauthorized'] == 1 and server.stats['logins'] == 2
+        assert token_cache.load(server.api_key, server.auth_url)['access_token'] != rejected
+        assert response.request.headers['Authorization'] == f"Bearer {auth.tokens()['access_token']}"
+
+        # 이미 재발급된 뒤 옛 토큰으로 온 401은 다시 로그인하지 않고 현재 토큰으로 재시도
+        assert pooled_requests.get(url, headers={'Authorization': f"Bearer {rejected}"}).ok
+        assert server.stats['logins'] == 2
+
+        # 발급하지 않은 토큰은 재시도하지 않음
+        assert pooled_requests.get(url, headers={'Authorization': "Bearer unknown"}).status_code == 401
+        assert server.stats['unauthorized'] == 3
+        session.close()
+
+    def test_sdk_requests_use_pooled_session(self, server, monkeypatch):
+        from importlib import import_module
+        for name in client_pool.SDK_REQUEST_MODULES:
+            module = import_module(name)
+            monkeypatch.setattr(module, 'requests', module.requests)
+
+        session = create_session()
+        assert 'netspresso.clients.utils.requester' in install_session(session)
+        from netspresso.clients.utils.requester import Requester
+        for _ in range(5):
+            assert Requester.get(f"{server.url}/ping").json() == {'ok': True}
+        assert server.stats['connections'] == 1
+
+    def test_pooled_netspresso_starts_without_login(self, token_cache, monkeypatch):
+        from importlib import import_module
+        from netspresso.clients.auth import auth_client
+        for name in client_pool.SDK_REQUEST_MODULES:
+            module = import_module(name)
+            monkeypatch.setattr(module, 'requests', module.requests)
+        monkeypatch.setattr(client_pool, '_netspresso_pool', {})
+        monkeypatch.setattr(client_pool, '_pooled_auths', [])
+
+        api_key = "cached-key"
+        access_token = make_test_token(ttl=3600)
+        token_cache.put(api_key, auth_client.api_client.base_url, access_token, make_test_token(ttl=7200))
+
+        start = time.perf_counter()
+        netspresso = get_pooled_netspresso(api_key, token_cache=token_cache)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5, f"{elapsed:.3f}초"
+        assert get_pooled_netspresso(api_key, token_cache=token_cache) is netspresso
+        assert netspresso.token_handler.tokens is None
+        netspresso.token_handler.validate_token()
+        assert netspresso.token_handler.tokens.access_token == access_token
+        assert netspresso.token_handler.check_jwt_exp()
+        assert netspresso.auth.logins == 0
+        assert netspresso.compressor_v2().token_handler is netspresso.token_handler
+
+    def test_pooled_netspresso_logs_in_on_first_validate(self, server, token_cache, monkeypatch):
+        from importlib import import_module
+        from netspresso.clients.auth import auth_client
+        for name in client_pool.SDK_REQUEST_MODULES:
+            module = import_module(name)
+            monkeypatch.setattr(module, 'requests', module.requests)
+        monkeypatch.setattr(client_pool, '_netspresso_pool', {})
+        monkeypatch.setattr(client_pool, '_pooled_auths', [])
+        monkeypatch.setattr(auth_client.api_client, 'base_url', server.auth_url)
+
+        netspresso = get_pooled_netspresso(server.api_key, token_cache=token_cache)
+        assert server.stats['requests'] == 0
+
+        netspresso.token_handler.validate_token()
+        netspresso.token_handler.validate_token()
+        assert server.stats['logins'] == 1
+        assert netspresso.token_handler.tokens.access_token in server.issued_tokens
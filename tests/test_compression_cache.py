@@ -0,0 +1,129 @@
+"""
+압축 결과 캐시 테스트
+"""
+
+import pytest
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from compression_cache import CompressionCache
+from netspresso_client import NetsPresssoQAClient
+
+SHAPES = [{"batch": 1, "channel": 3, "dimension": [224, 224]}]
+
+class CountingCompressor:
+    """호출 횟수를 세고 압축 산출물을 흉내 내는 테스트용 compressor"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def automatic_compression(self, input_model_path, output_dir, input_shapes, compression_ratio):
+        self.calls += 1
+        os.makedirs(output_dir, exist_ok=True)
+        compressed_path = os.path.join(output_dir, "model_compressed.pt")
+        with open(compressed_path, 'wb') as f:
+            f.write(b"x" * 100)
+        with open(os.path.join(output_dir, "metadata.json"), 'w') as f:
+            json.dump({"status": "completed", "compression_ratio": compression_ratio}, f)
+        return SimpleNamespace(status='completed', compressed_model_path=compressed_path)
+
+class TestCompressionCache:
+    
+    @pytest.fixture
+    def model_path(self, tmp_path):
+        path = tmp_path / "model.pt"
+        path.write_bytes(b"model-bytes")
+        return str(path)
+    
+    def test_key_depends_on_content_and_settings(self, tmp_path, model_path):
+        cache = CompressionCache(cache_dir=tmp_path / "cache")
+        key = cache.make_key(model_path, SHAPES, 0.5)
+        
+        assert key == cache.make_key(model_path, SHAPES, 0.5)
+        assert key != cache.make_key(model_path, SHAPES, 0.3)
+        assert key != cache.make_key(model_path, [{"batch": 1, "channel": 3, "dimension": [320, 320]}], 0.5)
+        assert key != cache.make_key(model_path, SHAPES, 0.5, backend='local')
+        
+        with open(model_path, 'ab') as f:
+            f.write(b"changed")
+        assert key != cache.make_key(model_path, SHAPES, 0.5)
+    
+    def test_client_hit_skips_compression(self, tmp_path, model_path):
+        compressor = CountingCompressor()
+        cache = CompressionCache(cache_dir=tmp_path / "cache")
+        client = NetsPresssoQAClient(compressor=compressor, cache=cache, precheck=False)
+        
+        first = client.test_simple_compression(model_path, str(tmp_path / "out1"))
+        second = client.test_simple_compression(model_path, str(tmp_path / "out2"))
+        
+        assert compressor.calls == 1
+        assert first['cached'] is False and second['cached'] is True
+        assert second['success'] is True
+        assert second['compressed_path'] == str(tmp_path / "out2" / "model_compressed.pt")
+        assert os.path.exists(second['compressed_path'])
+        assert second['metadata']['compression_ratio'] == 0.5
+    
+    def test_no_cache_override(self, tmp_path, model_path, monkeypatch):
+        monkeypatch.setenv('NETSPRESSO_NO_CACHE', '1')
+        compressor = CountingCompressor()
+        client = NetsPresssoQAClient(compressor=compressor, cache=CompressionCache(cache_dir=tmp_path / "cache"), precheck=False)
+        
+        client.test_simple_compression(model_path, str(tmp_path / "out1"))
+        client.test_simple_compression(model_path, str(tmp_path / "out2"))
+        
+        assert client.cache is None
+        assert compressor.calls == 2
+    
+    def test_lru_eviction_by_size(self, tmp_path):
+        cache = CompressionCache(cache_dir=tmp_path / "cache", max_size_bytes=400)
+        compressor = CountingCompressor()
+        keys = []
+        for i in range(3):
+            out_dir = str(tmp_path / f"src{i}")
+            compressor.automatic_compression("m.pt", out_dir, SHAPES, 0.5)
+            key = f"key{i}"
+            cache.put(key, {'success': True, 'status': 'completed',
+                            'compressed_path': os.path.join(out_dir, "model_compressed.pt")})
+            keys.append(key)
+            if i == 1:
+                # key0을 최근 사용으로 갱신 → key1이 먼저 제거되어야 함
+                assert cache.get("key0", str(tmp_path / "hit")) is not None
+        
+        assert cache.get("key1", str(tmp_path / "miss")) is None
+        assert cache.get("key0", str(tmp_path / "hit0")) is not None
+        assert cache.get("key2", str(tmp_path / "hit2")) is not None
+        assert cache.total_size() <= 400
+        
+        # 인덱스는 디스크에 유지되어 새 인스턴스에서도 적중
+        reopened = CompressionCache(cache_dir=tmp_path / "cache", max_size_bytes=400)
+        assert reopened.get("key2", str(tmp_path / "hit3")) is not None
+
+    def test_instances_sharing_a_directory_merge_index(self, tmp_path):
+        # 같은 폴더를 쓰는 두 인스턴스(= 두 프로세스)가 번갈아/동시에 저장해도 서로의 항목을 덮어쓰지 않음
+        compressor = CountingCompressor()
+        out_dir = str(tmp_path / "src")
+        compressor.automatic_compression("m.pt", out_dir, SHAPES, 0.5)
+        result = {'success': True, 'status': 'completed',
+                  'compressed_path': os.path.join(out_dir, "model_compressed.pt")}
+        first = CompressionCache(cache_dir=tmp_path / "cache")
+        second = CompressionCache(cache_dir=tmp_path / "cache")
+
+        assert first.put("a", result) and second.put("b", result)
+        assert first.get("b", str(tmp_path / "hit_b")) is not None
+        assert second.get("a", str(tmp_path / "hit_a")) is not None
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: (first, second)[i % 2].put(f"k{i}", result), range(40)))
+        with open(tmp_path / "cache" / "index.json", 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        assert set(index) == {"a", "b"} | {f"k{i}" for i in range(40)}
+        assert index["a"]['hits'] == 1 and index["b"]['hits'] == 1
+
+        # 다른 인스턴스가 지운 항목은 되살아나지 않음
+        second.clear()
+        first.put("c", result)
+        assert set(CompressionCache(cache_dir=tmp_path / "cache")._load_index()) == {"c"}
@@ -0,0 +1,74 @@
+"""
+배치 수치 동등성 검증 테스트
+"""
+
+import pytest
+import copy
+import torch
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from equivalence import random_input_chunks, save_equivalence_result, verify_model_files, verify_numerical_equivalence
+from generate_qa_report import generate_test_details_section
+from model_tests import create_simple_test_model
+from utils import load_test_result
+
+SAMPLE_SHAPE = (3, 16, 16)
+
+class TestEquivalence:
+
+    @pytest.fixture
+    def fx_model(self):
+        torch.manual_seed(0)
+        return torch.fx.symbolic_trace(create_simple_test_model())
+
+    def test_identical_models_pass(self, fx_model):
+        result = verify_numerical_equivalence(fx_model, copy.deepcopy(fx_model), num_samples=2000,
+                                              chunk_size=128, sample_shape=SAMPLE_SHAPE, top_k=3)
+
+        assert result['passed'] is True, result['violations']
+        assert result['samples'] == 2000
+        assert result['max_abs_error'] == 0.0
+        assert result['mean_cosine_similarity'] == pytest.approx(1.0)
+        assert result['topk_agreement'] == 1.0
+
+    def test_perturbed_model_fails_tolerance(self, fx_model):
+        perturbed = copy.deepcopy(fx_model)
+        with torch.no_grad():
+            perturbed.fc.weight.add_(torch.randn_like(perturbed.fc.weight))
+
+        result = verify_numerical_equivalence(fx_model, perturbed, num_samples=512, chunk_size=64,
+                                              sample_shape=SAMPLE_SHAPE)
+
+        assert result['passed'] is False
+        assert any(v.startswith('max_abs_error') for v in result['violations'])
+
+        # 허용 오차를 넉넉히 주면 통과
+        loose = verify_numerical_equivalence(fx_model, perturbed, num_samples=512, chunk_size=64,
+                                             sample_shape=SAMPLE_SHAPE,
+                                             tolerances={'max_abs_error': 1e3, 'mean_abs_error': 1e3,
+                                                         'min_cosine_similarity': -1.0, 'min_topk_agreement': 0.0})
+        assert loose['passed'] is True
+
+    def test_shape_mismatch(self, fx_model):
+        other = torch.nn.Sequential(torch.nn.Flatten(), torch.nn.Linear(3 * 16 * 16, 5))
+        result = verify_numerical_equivalence(fx_model, other, num_samples=8, chunk_size=8, sample_shape=SAMPLE_SHAPE)
+        assert result['passed'] is False
+        assert "출력 형태 불일치" in result['violations'][0]
+
+    def test_input_chunks_are_bounded(self):
+        sizes = [chunk.shape[0] for chunk in random_input_chunks(1000, 256, SAMPLE_SHAPE)]
+        assert sizes == [256, 256, 256, 232]
+
+    def test_files_and_report(self, tmp_path, simple_fx_model_path):
+        path = simple_fx_model_path
+        result = verify_model_files(path, path, num_samples=64, chunk_size=32, sample_shape=SAMPLE_SHAPE)
+        assert result['passed'] is True
+
+        output_path = str(tmp_path / "equivalence.json")
+        save_equivalence_result(result, output_path)
+        saved = load_test_result(output_path)['result']
+        section = generate_test_details_section({'success': saved['success'], 'details': saved})
+        assert "수치 동등성**: 통과 (64개 입력" in section
@@ -0,0 +1,81 @@
+"""
+실패 분류 / 시그니처 군집화 테스트
+"""
+
+import pytest
+import os
+import sys
+import time
+import uuid
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from failure_patterns import classify_failure, classify_message, cluster_failures, normalize_signature
+from generate_qa_report import analyze_failure_patterns
+
+def failure(name, error, error_type=None):
+    details = {'error': error}
+    if error_type:
+        details['error_type'] = error_type
+    return {'test_name': name, 'success': False, 'details': details}
+
+class TestFailurePatterns:
+
+    def test_rules_are_not_overly_broad(self):
+        assert classify_message("processing time exceeded budget") == 'other_issues'
+        assert classify_message("Read timed out") == 'timeout_issues'
+        assert classify_message("Connection timeout after 30s") == 'timeout_issues'
+        assert classify_message("CUDA out of memory") == 'memory_issues'
+        assert classify_message("Max retries exceeded with url") == 'network_issues'
+        assert classify_failure({'error': "model rejected", 'error_type': "NotValidFrameworkException"}) == 'framework_issues'
+
+    def test_signature_strips_volatile_parts(self):
+        first = normalize_signature(f"model {uuid.uuid4()} at /tmp/run_1/model_12.pt failed after 3 retries")
+        second = normalize_signature(f"model {uuid.uuid4()} at /data/x/other.pt failed after 5 retries")
+        assert first == second == "model <uuid> at <path> failed after <n> retries"
+        assert normalize_signature("") == "(오류 메시지 없음)"
+
+    def test_signature_urls_and_plain_slashes(self):
+        assert normalize_signature("Failed GET https://a.b.com/x/y?z=1") == "Failed GET <url>"
+        assert normalize_signature("read/write error") == "read/write error"
+        assert normalize_signature("missing ./models/a.pt and C:\\tmp\\b.pt") == "missing <path> and <path>"
+        assert normalize_signature("cannot open ~/cache/x.pt") == "cannot open <path>"
+
+    def test_report_category_matches_classify_failure(self):
+        messages = [
+            "cannot read /data/frameworks/m.pt",
+            "failed to open /mnt/connection_pool/x",
+            "GET https://api.netspresso.ai/framework/v2 returned 500",
+            "read/write error",
+        ]
+        failed = [{'test_name': f"t{i}", 'details': {'error': message}} for i, message in enumerate(messages)]
+        categories = {cluster['sample_error']: cluster['category'] for cluster in cluster_failures(failed)}
+        assert categories == {message: classify_failure({'error': message}) for message in messages}
+        assert categories["cannot read /data/frameworks/m.pt"] == 'framework_issues'
+        assert categories["failed to open /mnt/connection_pool/x"] == 'network_issues'
+
+    def test_clusters_with_counts(self):
+        failed = [failure(f"job_{i}", f"Upload of /tmp/{i}/m.pt failed: Connection reset (id {uuid.uuid4()})")
+                  for i in range(5)]
+        failed += [failure("yolo", "NotValidFrameworkException: onnx")] * 2
+
+        clusters = cluster_failures(failed)
+        assert [(c['category'], c['count']) for c in clusters] == [('network_issues', 5), ('framework_issues', 2)]
+        assert clusters[0]['examples'] == ["job_0", "job_1", "job_2"]
+
+        patterns = analyze_failure_patterns(failed)
+        assert list(patterns) == ['network_issues', 'framework_issues']
+        assert len(patterns['network_issues']) == 1
+
+    def test_100k_failures_in_seconds(self):
+        failed = [failure(f"case_{i}", f"model {i:08x}-0000-4000-8000-{i:012x} failed at step {i % 97}: "
+                                       f"{('Connection reset', 'Read timed out', 'shape mismatch')[i % 3]}")
+                  for i in range(100_000)]
+
+        start = time.perf_counter()
+        clusters = cluster_failures(failed)
+        elapsed = time.perf_counter() - start
+
+        assert len(clusters) == 3
+        assert sum(c['count'] for c in clusters) == 100_000
+        assert elapsed < 10, f"{elapsed:.2f}초"
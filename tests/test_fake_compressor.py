@@ -0,0 +1,102 @@
+"""
+오프라인 compressor 대역 테스트
+"""
+
+import pytest
+import json
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fake_compressor import FakeCompressor, FakeNetsPresso, NotValidFrameworkException
+from netspresso_client import NetsPresssoQAClient
+
+SHAPES = [{"batch": 1, "channel": 3, "dimension": [224, 224]}]
+
+class TestFakeCompressor:
+
+    @pytest.fixture
+    def model_path(self, tmp_path):
+        path = tmp_path / "model.pt"
+        path.write_bytes(b"0" * 4096)
+        return str(path)
+
+    def test_writes_sdk_like_output(self, tmp_path, model_path):
+        compressor = FakeNetsPresso().compressor_v2()
+        result = compressor.automatic_compression(
+            input_model_path=model_path,
+            output_dir=str(tmp_path / "out"),
+            input_shapes=SHAPES,
+            compression_ratio=0.5
+        )
+
+        assert result.status == 'completed'
+        assert os.path.exists(result.compressed_model_path)
+        with open(tmp_path / "out" / "metadata.json", encoding='utf-8') as f:
+            metadata = json.load(f)
+        assert metadata['compression_info']['ratio'] == 0.5
+        assert metadata['results']['compressed_model']['size'] == 2048
+
+        # 같은 output_dir을 다시 쓰면 SDK처럼 새 폴더를 만듦
+        again = compressor.automatic_compression(model_path, str(tmp_path / "out"), SHAPES)
+        assert "out (1)" in again.compressed_model_path
+
+    def test_onnx_fails_after_upload(self, tmp_path):
+        onnx_path = tmp_path / "yolov8l.onnx"
+        onnx_path.write_bytes(b"onnx")
+        client = NetsPresssoQAClient(compressor=FakeCompressor(), use_cache=False, precheck=False)
+
+        result = client.test_simple_compression(str(onnx_path), str(tmp_path / "out"))
+
+        assert result['success'] is False
+        assert result['error_type'] == 'NotValidFrameworkException'
+        assert "NotValidFrameworkException" in result['error']
+
+    def test_failure_injection(self, tmp_path, model_path):
+        # SDK처럼 예외 대신 error metadata를 반환하고 출력 폴더에 metadata.json을 남김
+        compressor = FakeCompressor(failure_rate=1.0, failure_exception=TimeoutError)
+        result = compressor.automatic_compression(model_path, str(tmp_path / "out"), SHAPES)
+        assert result.status == 'error' and result.compressed_model_path == ''
+        assert result.error_detail['name'] == 'TimeoutError'
+        with open(tmp_path / "out" / "metadata.json", encoding='utf-8') as f:
+            metadata = json.load(f)
+        assert metadata['status'] == 'error' and "주입된 압축 실패" in metadata['error_detail']['message']
+        assert metadata['input_model_path'] == os.path.realpath(model_path).replace(os.sep, '/')
+
+        compressor = FakeCompressor(failure_rate=1.0, failure_exception=TimeoutError, raise_errors=True)
+        with pytest.raises(TimeoutError):
+            compressor.automatic_compression(model_path, str(tmp_path / "raised"), SHAPES)
+
+        compressor = FakeCompressor(fail_first=2)
+        client = NetsPresssoQAClient(compressor=compressor, use_cache=False, precheck=False)
+        results = [client.compress(model_path, str(tmp_path / f"r{i}")) for i in range(3)]
+        assert [r['success'] for r in results] == [False, False, True]
+        assert results[0]['status'] == 'error' and results[0]['error_type'] == 'ConnectionError'
+        assert "주입된 오류 1/2" in results[0]['error'] and results[0]['compressed_path'] is None
+        assert compressor.stats['failed'] == 2 and compressor.stats['completed'] == 1
+
+    def test_concurrency_cap(self, tmp_path, model_path):
+        compressor = FakeCompressor(latency=0.1, max_concurrent=2)
+        client = NetsPresssoQAClient(compressor=compressor, use_cache=False, precheck=False)
+        jobs = [{"model_path": model_path, "output_dir": str(tmp_path / f"job{i}")} for i in range(6)]
+
+        start = time.perf_counter()
+        results = list(client.compress_many(jobs, max_workers=6))
+        elapsed = time.perf_counter() - start
+
+        assert all(r['success'] for r in results)
+        assert compressor.stats['peak_concurrency'] == 2
+        assert elapsed >= 0.3, "슬롯 2개로 6개 작업은 최소 3회 지연이 필요"
+
+    def test_upload_bandwidth(self, tmp_path, model_path):
+        compressor = FakeCompressor(upload_bandwidth=4096 / 0.2)
+        start = time.perf_counter()
+        compressor.automatic_compression(model_path, str(tmp_path / "out"), SHAPES)
+        assert time.perf_counter() - start >= 0.2
+
+    def test_fake_backend_env(self, monkeypatch):
+        monkeypatch.setenv('NETSPRESSO_FAKE_BACKEND', '1')
+        client = NetsPresssoQAClient(use_cache=False)
+        assert isinstance(client.compressor, FakeCompressor)
+        assert isinstance(client.netspresso, FakeNetsPresso)
@@ -0,0 +1,108 @@
+"""
+mmap 아티팩트 포맷(.fxa) 테스트
+"""
+
+import pytest
+import torch
+import torch.fx
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fx_artifact import ALIGNMENT, is_fx_artifact, load_fx_artifact, read_fx_artifact_header, save_fx_artifact
+from model_tests import create_yolo_compatible_model, load_fx_model, save_fx_model, verify_fx_model
+from precheck import precheck_model
+
+class TestFxArtifact:
+
+    @pytest.fixture
+    def yolo_fx(self):
+        torch.manual_seed(0)
+        model = torch.fx.symbolic_trace(create_yolo_compatible_model())
+        model.eval()
+        return model
+
+    def test_roundtrip_outputs_match(self, tmp_path, yolo_fx):
+        path = str(tmp_path / "yolo.fxa")
+        save_fx_artifact(yolo_fx, path)
+
+        loaded = load_fx_artifact(path)
+        example = torch.randn(2, 3, 64, 64)
+        with torch.no_grad():
+            assert torch.equal(yolo_fx(example), loaded.eval()(example))
+        assert isinstance(loaded, torch.fx.GraphModule)
+        assert loaded.code == yolo_fx.code
+        # BatchNorm 버퍼(정수 포함)도 그대로 복원
+        assert loaded.get_submodule('backbone.1').num_batches_tracked.dtype == torch.int64
+
+    def test_tied_weights_roundtrip(self, tmp_path):
+        class Tied(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.a = torch.nn.Linear(8, 8)
+                self.b = torch.nn.Linear(8, 8)
+                self.b.weight = self.a.weight
+
+            def forward(self, x):
+                return self.b(torch.relu(self.a(x)))
+
+        torch.manual_seed(0)
+        model = torch.fx.symbolic_trace(Tied())
+        path = str(tmp_path / "tied.fxa")
+        header = save_fx_artifact(model, path)
+        [weight] = [entry for entry in header['tensors'] if entry['name'] == 'a.weight']
+        assert weight['aliases'] == ['b.weight'] and len(header['tensors']) == 3
+
+        loaded = load_fx_artifact(path)
+        assert loaded.b.weight is loaded.a.weight and loaded.b.weight.device.type == 'cpu'
+        example = torch.randn(4, 8)
+        with torch.no_grad():
+            assert torch.allclose(model(example), loaded(example))
+
+    def test_header_and_alignment(self, tmp_path, yolo_fx):
+        path = str(tmp_path / "yolo.fxa")
+        save_fx_artifact(yolo_fx, path)
+
+        header = read_fx_artifact_header(path)
+        names = {t['name'] for t in header['tensors']}
+        assert 'backbone.0.weight' in names and 'backbone.1.running_mean' in names
+        assert all(t['offset'] % ALIGNMENT == 0 for t in header['tensors'])
+        assert "def forward" in header['code']
+
+    def test_tensors_are_mmap_views(self, tmp_path, yolo_fx):
+        path = str(tmp_path / "yolo.fxa")
+        save_fx_artifact(yolo_fx, path)
+        loaded = load_fx_artifact(path)
+
+        # 텐서가 자체 메모리를 할당하지 않고 하나의 mmap 영역 안의 오프셋을 가리킴
+        offsets = {t['name']: t['offset'] for t in read_fx_artifact_header(path)['tensors']}
+        tensors = dict(loaded.named_parameters())
+        tensors.update(dict(loaded.named_buffers()))
+        base = tensors['backbone.0.weight'].data_ptr() - offsets['backbone.0.weight']
+        for name, tensor in tensors.items():
+            assert tensor.data_ptr() - base == offsets[name], name
+
+        weight = loaded.get_submodule('detection_head.0').weight
+        # copy-on-write: 메모리에서 수정해도 파일은 그대로
+        with torch.no_grad():
+            weight.zero_()
+        assert not torch.equal(load_fx_artifact(path).get_submodule('detection_head.0').weight, weight)
+
+    def test_loader_autodetects_format(self, tmp_path, yolo_fx):
+        torch_path = str(tmp_path / "yolo.pt")
+        fxa_path = str(tmp_path / "yolo.fxa")
+        assert save_fx_model(yolo_fx, torch_path)
+        assert save_fx_model(yolo_fx, fxa_path, format='fxa')
+
+        assert not is_fx_artifact(torch_path) and is_fx_artifact(fxa_path)
+        example = torch.randn(1, 3, 32, 32)
+        with torch.no_grad():
+            assert torch.equal(load_fx_model(torch_path).eval()(example), load_fx_model(fxa_path).eval()(example))
+        assert verify_fx_model(fxa_path, input_shape=(1, 3, 32, 32))[0] is True
+
+    def test_precheck_rejects_artifact_for_upload(self, tmp_path, yolo_fx):
+        path = str(tmp_path / "disguised.pt")
+        save_fx_artifact(yolo_fx, path)
+        result = precheck_model(path, [{"batch": 1, "channel": 3, "dimension": [32, 32]}])
+        assert result['compatible'] is False
+        assert ".fxa" in result['reason']
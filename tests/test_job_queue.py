@@ -0,0 +1,222 @@
+"""
+내구성 있는 압축 작업 큐 테스트 (오프라인 대역 backend)
+"""
+
+import pytest
+import os
+import sys
+import json
+import shutil
+import time
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fake_compressor import FakeCompressor
+from job_queue import JobQueue, run_queue
+
+class SdkLikeCompressor:
+    """실제 SDK처럼 실패를 예외 대신 status='error' metadata로 반환 (errors를 앞에서부터 하나씩 소비)"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.fake = FakeCompressor()
+
+    def automatic_compression(self, **kwargs):
+        if self.errors:
+            return SimpleNamespace(status='error', compressed_model_path="",
+                                   error_detail=SimpleNamespace(name="", message=self.errors.pop(0)))
+        return self.fake.automatic_compression(**kwargs)
+
+class SlowFirstCompressor:
+    """out_0 작업만 오래 걸리는 대역 (lease보다 긴 원격 압축 흉내). 출력 폴더별 호출 수를 셈"""
+
+    def __init__(self, slow=1.0, fast=0.15):
+        self.slow, self.fast = slow, fast
+        self.fake = FakeCompressor()
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def automatic_compression(self, **kwargs):
+        name = os.path.basename(kwargs['output_dir'])
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+        time.sleep(self.slow if name == "out_0" else self.fast)
+        return self.fake.automatic_compression(**kwargs)
+
+class TestJobQueue:
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return str(tmp_path / "jobs.db")
+
+    def add_jobs(self, queue, model_path, tmp_path, count):
+        return [queue.add(model_path, str(tmp_path / f"out_{i}"), batch="test") for i in range(count)]
+
+    def test_add_is_idempotent(self, db_path, simple_fx_model_path, tmp_path):
+        with JobQueue(db_path) as queue:
+            first = queue.add(simple_fx_model_path, str(tmp_path / "out"), batch="test")
+            assert queue.add(simple_fx_model_path, str(tmp_path / "out"), batch="test") == first
+            assert queue.add(simple_fx_model_path, str(tmp_path / "out"), compression_ratio=0.3, batch="test") != first
+            assert queue.add(simple_fx_model_path, str(tmp_path / "out"), batch="other") != first
+            assert queue.counts("test") == {'pending': 2}
+
+    def test_restart_resumes_only_unfinished_jobs(self, db_path, simple_fx_model_path, tmp_path):
+        queue = JobQueue(db_path, lease=0.05)
+        job_ids = self.add_jobs(queue, simple_fx_model_path, tmp_path, 3)
+        run_queue(queue, FakeCompressor(), batch="test", credit_budget=25, max_concurrent=1)
+        assert queue.counts("test") == {'done': 1, 'pending': 2}
+
+        # 압축 도중 kill된 실행 흉내: 점유한 채로 사라짐
+        run_id = queue.start_run("test")
+        crashed = queue.claim(run_id, "test")
+        queue.advance(crashed, 'upload')
+        queue.advance(crashed, 'compress')
+        queue.close()
+        time.sleep(0.1)
+
+        compressor = FakeCompressor()
+        with JobQueue(db_path, lease=0.05) as restarted:
+            summary = run_queue(restarted, compressor, batch="test")
+            assert summary['counts'] == {'done': 3}
+            assert compressor.stats['calls'] == 2
+            events = [(e['stage'], e['event']) for e in restarted.events(crashed['id'])]
+            assert ('compress', 'resumed') in events and events[-1] == ('done', 'done')
+            done = restarted.jobs("test", status='done')
+            assert sorted(job['id'] for job in done) == sorted(job_ids)
+            assert all(job['result']['verify'].startswith("FX 모델 검증 성공") for job in done)
+
+    def test_finished_download_is_not_recompressed(self, db_path, simple_fx_model_path, tmp_path):
+        queue = JobQueue(db_path, lease=0.05)
+        [job_id] = self.add_jobs(queue, simple_fx_model_path, tmp_path, 1)
+        run_id = queue.start_run("test")
+        job = queue.claim(run_id, "test")
+        queue.advance(job, 'download')
+        # 다운로드는 끝났지만 verify로 전이하기 전에 죽음
+        FakeCompressor().automatic_compression(simple_fx_model_path, job['output_dir'], job['settings']['input_shapes'])
+        time.sleep(0.1)
+
+        compressor = FakeCompressor()
+        summary = run_queue(queue, compressor, batch="test", credit_budget=0)
+        assert summary['counts'] == {'done': 1}
+        assert compressor.stats['calls'] == 0 and summary['credits_used'] == 0
+
+    def test_credit_budget_and_concurrency_cap(self, db_path, simple_fx_model_path, tmp_path):
+        queue = JobQueue(db_path)
+        self.add_jobs(queue, simple_fx_model_path, tmp_path, 6)
+        compressor = FakeCompressor(latency=0.05)
+        summary = run_queue(queue, compressor, batch="test", credit_budget=100, max_concurrent=2)
+
+        assert summary['budget_exhausted'] and summary['credits_used'] == 100
+        assert summary['counts'] == {'done': 4, 'pending': 2}
+        assert compressor.stats['calls'] == 4
+        assert compressor.stats['peak_concurrency'] <= 2
+        # 예산 때문에 돌려놓은 작업은 precheck 통과가 남고 시도 횟수는 늘지 않음
+        pending = queue.jobs("test", status='pending')
+        assert all(job['attempts'] == 0 for job in pending)
+        assert 'upload' in [job['stage'] for job in pending]
+
+        summary = run_queue(queue, compressor, batch="test")
+        assert summary['counts'] == {'done': 6} and compressor.stats['calls'] == 6
+
+    def test_retry_and_permanent_failures(self, db_path, simple_fx_model_path, tmp_path):
+        queue = JobQueue(db_path)
+        [flaky] = self.add_jobs(queue, simple_fx_model_path, tmp_path, 1)
+        bad_path = tmp_path / "model.txt"
+        bad_path.write_text("not a model")
+        bad = queue.add(str(bad_path), str(tmp_path / "bad"), batch="test")
+
+        summary = run_queue(queue, FakeCompressor(fail_first=1), batch="test", max_concurrent=1)
+        assert summary['counts'] == {'done': 1, 'failed': 1}
+        assert summary['outcomes'] == {'retry': 1, 'done': 1, 'failed': 1}
+        jobs = {job['id']: job for job in queue.jobs("test")}
+        assert jobs[flaky]['attempts'] == 2 and jobs[flaky]['credits'] == 50
+        assert jobs[bad]['error_type'] == 'PrecheckError' and jobs[bad]['credits'] == 0
+
+    def test_claims_are_exclusive(self, db_path, simple_fx_model_path, tmp_path):
+        with JobQueue(db_path) as queue:
+            self.add_jobs(queue, simple_fx_model_path, tmp_path, 40)
+        claimed = []
+
+        def claim_all():
+            with JobQueue(db_path) as queue:
+                run_id = queue.start_run("test")
+                while True:
+                    job = queue.claim(run_id, "test")
+                    if job is None:
+                        return
+                    claimed.append(job['id'])
+
+        threads = [threading.Thread(target=claim_all) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(claimed) == sorted(set(claimed)) and len(claimed) == 40
+
+    def test_dead_owner_is_reclaimed_before_lease_expires(self, db_path, simple_fx_model_path, tmp_path):
+        with JobQueue(db_path) as queue:
+            self.add_jobs(queue, simple_fx_model_path, tmp_path, 1)
+            job = queue.claim(queue.start_run("test"), "test")
+            queue.conn.execute("UPDATE jobs SET owner = ? WHERE id = ?",
+                               (job['owner'].rsplit(':', 2)[0] + ":999999999:dead", job['id']))
+            resumed = queue.claim(queue.start_run("test"), "test")
+            assert resumed['id'] == job['id'] and resumed['attempts'] == 2
+
+    def test_sdk_error_metadata_is_classified(self, db_path, simple_fx_model_path, tmp_path):
+        queue = JobQueue(db_path)
+        self.add_jobs(queue, simple_fx_model_path, tmp_path, 1)
+        compressor = SdkLikeCompressor(["HTTPSConnectionPool: Max retries exceeded (Connection refused)"])
+        summary = run_queue(queue, compressor, batch="test", max_concurrent=1)
+        assert summary['outcomes'] == {'retry': 1, 'done': 1}
+        assert [e['event'] for e in queue.events(queue.jobs("test")[0]['id'])].count('retry') == 1
+
+        [job_id] = self.add_jobs(queue, simple_fx_model_path, tmp_path / "second", 1)
+        message = "NotValidFrameworkException: 지원하지 않는 모델"
+        summary = run_queue(queue, SdkLikeCompressor([message]), batch="test", max_concurrent=1)
+        job = {job['id']: job for job in queue.jobs("test")}[job_id]
+        assert summary['outcomes'] == {'failed': 1}
+        assert job['error'] == message and job['error_type'] == 'CompressionError'
+
+    def test_relative_model_path_download_is_adopted(self, db_path, simple_fx_model_path, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        shutil.copyfile(simple_fx_model_path, "model.pt")
+        queue = JobQueue(db_path, lease=0.05)
+        queue.add("model.pt", "out", batch="test")
+        job = queue.claim(queue.start_run("test"), "test")
+        queue.advance(job, 'download')
+        # SDK는 input_model_path를 resolve한 절대 경로로 기록
+        os.makedirs("out")
+        shutil.copyfile("model.pt", "out/model_compressed.pt")
+        with open("out/metadata.json", 'w', encoding='utf-8') as f:
+            json.dump({'status': 'completed', 'input_model_path': Path("model.pt").resolve().as_posix(),
+                       'compressed_model_path': "out/model_compressed.pt"}, f)
+        time.sleep(0.1)
+
+        compressor = FakeCompressor()
+        summary = run_queue(queue, compressor, batch="test", credit_budget=0)
+        assert summary['counts'] == {'done': 1}
+        assert compressor.stats['calls'] == 0 and summary['credits_used'] == 0
+
+    def test_long_compression_keeps_lease(self, db_path, simple_fx_model_path, tmp_path):
+        queue = JobQueue(db_path, lease=0.4)
+        self.add_jobs(queue, simple_fx_model_path, tmp_path, 8)
+        compressor = SlowFirstCompressor()
+        stolen = []
+
+        def other_run():
+            # lease가 한 번 이상 지났을 시점에 다른 실행이 진행 중인 작업을 가져가려 함
+            time.sleep(0.7)
+            with JobQueue(db_path, lease=0.4) as other:
+                stolen.append(other.claim(other.start_run("test"), "test", stages=('upload', 'compress', 'download')))
+
+        thread = threading.Thread(target=other_run)
+        thread.start()
+        summary = run_queue(queue, compressor, batch="test", max_concurrent=2, verify=False)
+        thread.join()
+
+        assert stolen == [None]
+        assert compressor.calls == {f"out_{i}": 1 for i in range(8)}
+        assert summary['credits_used'] == 200
+        assert summary['outcomes'] == {'done': 8} and summary['counts'] == {'done': 8}
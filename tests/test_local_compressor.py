@@ -0,0 +1,164 @@
+"""
+로컬 채널 프루닝 backend 테스트
+"""
+
+import pytest
+import os
+import sys
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import torch
+
+import utils
+from fake_compressor import FakeCompressor, NotValidFrameworkException
+from generate_qa_report import generate_markdown_report
+from local_compressor import LocalCompressor, channel_importance, compare_backends, prune_graph_module
+from model_tests import load_fx_model, trace_fx_model
+from netspresso_client import NetsPresssoQAClient
+
+SHAPES = [{"batch": 1, "channel": 3, "dimension": [64, 64]}]
+
+class ConvChain(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, 3, padding=1)
+        self.conv2 = torch.nn.Conv2d(8, 4, 1)
+
+    def forward(self, x):
+        return self.conv2(torch.relu(self.conv1(x)))
+
+class ConvBNLinear(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv = torch.nn.Conv2d(3, 8, 3)
+        self.bn = torch.nn.BatchNorm2d(8)
+        self.fc = torch.nn.Linear(8 * 6 * 6, 5)
+
+    def forward(self, x):
+        return self.fc(torch.flatten(torch.relu(self.bn(self.conv(x))), 1))
+
+class Residual(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = torch.nn.Conv2d(3, 8, 3, padding=1)
+        self.conv2 = torch.nn.Conv2d(8, 8, 3, padding=1)
+
+    def forward(self, x):
+        y = self.conv1(x)
+        return self.conv2(y) + y
+
+def dropped_channels(conv, ratio, norm='l2'):
+    kept = conv.out_channels - int(conv.out_channels * ratio + 0.5)
+    keep = set(channel_importance(conv.weight, norm).topk(kept).indices.tolist())
+    return [c for c in range(conv.out_channels) if c not in keep]
+
+class TestLocalCompressor:
+
+    def test_pruning_matches_zeroed_channels(self):
+        # 제거한 필터를 0으로 만든 원본과 프루닝 결과의 출력이 같아야 함
+        torch.manual_seed(0)
+        model = trace_fx_model(ConvChain()).eval()
+        x = torch.randn(2, 3, 16, 16)
+        with torch.no_grad():
+            for c in dropped_channels(model.conv1, 0.5):
+                model.conv1.weight[c] = 0
+                model.conv1.bias[c] = 0
+            expected = model(x)
+
+        pruned = prune_graph_module(model, 0.5)
+        assert pruned == [{'layer': 'conv1', 'channels': 8, 'kept': 4}]
+        assert model.conv1.out_channels == 4 and model.conv2.in_channels == 4
+        assert torch.allclose(model(x), expected, atol=1e-6)
+
+    def test_batch_norm_and_flattened_linear_are_rewired(self):
+        torch.manual_seed(0)
+        model = trace_fx_model(ConvBNLinear()).eval()
+        with torch.no_grad():
+            model.bn.running_mean.normal_()
+            model.bn.running_var.uniform_(0.5, 2)
+        x = torch.randn(2, 3, 8, 8)
+        with torch.no_grad():
+            for c in dropped_channels(model.conv, 0.25, norm='l1'):
+                model.bn.weight[c] = 0
+                model.bn.bias[c] = 0
+            expected = model(x)
+
+        prune_graph_module(model, 0.25, norm='l1')
+        assert model.bn.num_features == 6 and model.bn.running_mean.shape == (6,)
+        assert model.fc.in_features == 6 * 6 * 6
+        assert torch.allclose(model(x), expected, atol=1e-5)
+
+    def test_channels_bound_to_other_tensors_are_kept(self):
+        model = trace_fx_model(Residual())
+        assert prune_graph_module(model, 0.5) == []
+        assert model(torch.randn(1, 3, 8, 8)).shape == (1, 8, 8, 8)
+
+        with pytest.raises(ValueError):
+            prune_graph_module(model, 1.0)
+        with pytest.raises(ValueError):
+            prune_graph_module(model, 0.5, norm='l3')
+
+    def test_output_layout_matches_automatic_compression(self, yolo_fx_model_path, tmp_path):
+        fake = FakeCompressor().automatic_compression(yolo_fx_model_path, str(tmp_path / "fake"), SHAPES)
+        local = LocalCompressor()
+        result = local.automatic_compression(yolo_fx_model_path, str(tmp_path / "out"), SHAPES, compression_ratio=0.5)
+        again = local.automatic_compression(yolo_fx_model_path, str(tmp_path / "out"), SHAPES, compression_ratio=0.5)
+
+        assert set(result.metadata) == set(fake.metadata)
+        assert result.status == 'completed' and result.metadata['backend'] == 'local'
+        stem = os.path.splitext(os.path.basename(yolo_fx_model_path))[0]
+        assert result.compressed_model_path == str(tmp_path / "out" / f"{stem}_compressed.pt")
+        assert os.path.dirname(again.compressed_model_path).endswith("out (1)")
+        with open(os.path.join(os.path.dirname(result.compressed_model_path), 'metadata.json'), encoding='utf-8') as f:
+            metadata = json.load(f)
+        assert metadata['compression_info']['method'] == 'PR_L2' and metadata['credits_consumed'] == 0
+
+        sizes = metadata['results']
+        assert sizes['compressed_model']['size'] < sizes['original_model']['size'] * 0.5
+        compressed = load_fx_model(result.compressed_model_path)
+        assert sum(p.numel() for p in compressed.parameters()) == sizes['compressed_model']['params']
+        assert compressed(torch.randn(1, 3, 64, 64)).shape == (1, 85, 4, 4)
+        assert local.stats['completed'] == 2
+
+    def test_invalid_models_are_rejected(self, tmp_path):
+        onnx_path = tmp_path / "model.onnx"
+        onnx_path.write_bytes(b"not a torch model")
+        # SDK처럼 예외 대신 error metadata 반환
+        local = LocalCompressor(norm='l1')
+        result = local.automatic_compression(str(onnx_path), str(tmp_path / "out"), SHAPES)
+        assert result.status == 'error' and result.compressed_model_path == ''
+        assert result.error_detail['name'] == 'NotValidFrameworkException'
+        with open(tmp_path / "out" / "metadata.json", encoding='utf-8') as f:
+            metadata = json.load(f)
+        assert metadata['backend'] == 'local' and metadata['compression_info']['method'] == 'PR_L1'
+
+        client = NetsPresssoQAClient(compressor=local, use_cache=False, precheck=False)
+        missing = client.compress(str(tmp_path / "missing.pt"), str(tmp_path / "missing"))
+        assert missing['success'] is False and missing['error_type'] == 'FileNotFoundError'
+        assert local.stats['failed'] == 2
+
+        with pytest.raises(NotValidFrameworkException):
+            LocalCompressor(raise_errors=True).automatic_compression(str(onnx_path), str(tmp_path / "raised"), SHAPES)
+        assert not (tmp_path / "raised").exists()
+
+    def test_client_backend_and_comparison_report(self, simple_fx_model_path, tmp_path, monkeypatch):
+        monkeypatch.setenv('NETSPRESSO_FAKE_BACKEND', '0')
+        monkeypatch.setenv('NETSPRESSO_LOCAL_BACKEND', '1')
+        local_client = NetsPresssoQAClient(use_cache=False)
+        assert local_client.backend == 'local'
+
+        clients = {'local': local_client, 'remote': NetsPresssoQAClient(compressor=FakeCompressor(), use_cache=False)}
+        comparison = compare_backends(clients, simple_fx_model_path, str(tmp_path), input_shapes=SHAPES,
+                                      iterations=3, warmup=1)
+        local, remote = comparison['backends']
+        assert local['success'] and remote['success']
+        assert local['params'] < comparison['original']['params'] == remote['params']
+        assert local['compressed_size'] < remote['compressed_size']
+
+        collector = utils.TestResultCollector()
+        collector.add_result("simple_backend_comparison", True, {'backend_comparison': comparison})
+        report = generate_markdown_report(collector)
+        assert "## ⚖️ 로컬 vs 원격 압축" in report
+        assert "| local | ✅ |" in report and "| remote | ✅ |" in report and "| 원본 | - |" in report
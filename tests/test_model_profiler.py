@@ -0,0 +1,54 @@
+"""
+정적 모델 프로파일러 테스트
+"""
+
+import pytest
+import torch
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from model_profiler import profile_graph_module, profile_model
+from model_tests import create_simple_test_model, create_yolo_compatible_model, save_fx_model
+from utils import get_model_info
+
+class TestModelProfiler:
+
+    def test_simple_cnn_counts(self):
+        profile = profile_graph_module(create_simple_test_model(), (1, 3, 8, 8))
+        nodes = {n['name']: n for n in profile['nodes']}
+
+        # conv1: 3->16, 3x3, 출력 1x16x8x8
+        assert nodes['conv1']['params'] == 16 * 3 * 9 + 16
+        assert nodes['conv1']['macs'] == 16 * 8 * 8 * 3 * 9
+        assert nodes['conv1']['activation_bytes'] == 16 * 8 * 8 * 4
+        assert nodes['fc']['macs'] == 10 * 32
+        assert profile['totals']['params'] == sum(p.numel() for p in create_simple_test_model().parameters())
+        assert profile['totals']['flops'] >= 2 * profile['totals']['macs']
+
+        # 입력(3x8x8)과 conv1 출력이 동시에 살아 있는 순간보다 최대값이 작을 수 없음
+        assert profile['peak_activation_bytes'] >= (3 * 64 + 16 * 64) * 4
+        assert profile['peak_activation_bytes'] < profile['totals']['activation_bytes']
+
+    def test_profile_cached_per_model_hash(self, tmp_path):
+        path = str(tmp_path / "yolo.pt")
+        assert save_fx_model(create_yolo_compatible_model(), path)
+
+        first = profile_model(path, (1, 3, 64, 64), cache_dir=tmp_path / "profiles")
+        second = profile_model(path, (1, 3, 64, 64), cache_dir=tmp_path / "profiles")
+        other_shape = profile_model(path, (1, 3, 32, 32), cache_dir=tmp_path / "profiles")
+
+        assert first['cached'] is False and second['cached'] is True
+        assert first['totals'] == second['totals']
+        assert other_shape['cached'] is False
+        assert other_shape['totals']['macs'] < first['totals']['macs']
+
+    def test_get_model_info_with_profile(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('NETSPRESSO_PROFILE_CACHE_DIR', str(tmp_path / "profiles"))
+        path = str(tmp_path / "simple.pt")
+        assert save_fx_model(create_simple_test_model(), path)
+
+        assert 'profile' not in get_model_info(path)
+        info = get_model_info(path, input_shape=(1, 3, 32, 32))
+        assert info['params'] == info['profile']['totals']['params']
+        assert info['macs'] > 0 and info['peak_activation_bytes'] > 0
@@ -0,0 +1,112 @@
+"""
+업로드 전 호환성 사전 검증 테스트
+"""
+
+import pytest
+import torch
+import torch.fx
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fake_compressor import FakeCompressor
+from model_tests import save_fx_model
+from netspresso_client import NetsPresssoQAClient
+from precheck import precheck_model
+
+SHAPES = [{"batch": 1, "channel": 3, "dimension": [224, 224]}]
+
+class PixelShuffleModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv = torch.nn.Conv2d(3, 12, 3, padding=1)
+        self.shuffle = torch.nn.PixelShuffle(2)
+
+    def forward(self, x):
+        return self.shuffle(self.conv(x))
+
+class ShapeModel(torch.nn.Module):
+    """x.shape[0]와 정수 나눗셈으로 flatten 크기를 계산하는 모델 (getattr / floordiv 노드)"""
+
+    def __init__(self):
+        super().__init__()
+        self.conv = torch.nn.Conv2d(3, 4, 3, padding=1)
+        self.pool = torch.nn.AdaptiveAvgPool2d(2)
+
+    def forward(self, x):
+        x = self.pool(self.conv(x))
+        return x.view(x.shape[0], x.shape[1] * 4 // 2, -1)
+
+class TestPrecheck:
+
+    @pytest.fixture
+    def fx_model_path(self, simple_fx_model_path):
+        return simple_fx_model_path
+
+    def test_compatible_model(self, fx_model_path):
+        result = precheck_model(fx_model_path, SHAPES)
+
+        assert result['compatible'] is True, result['reason']
+        assert [c['name'] for c in result['checks']] == ['format', 'load', 'graph_module', 'graph', 'ops', 'input_shapes']
+        assert result['elapsed'] < 5
+
+    def test_onnx_rejected_without_loading(self, tmp_path):
+        onnx_path = tmp_path / "yolov8l.onnx"
+        onnx_path.write_bytes(b"\0" * 1024)
+
+        result = precheck_model(str(onnx_path), SHAPES)
+
+        assert result['compatible'] is False
+        assert "'.onnx'" in result['reason']
+        assert result['checks'][-1]['name'] == 'format'
+
+    def test_plain_module_not_graph_module(self, tmp_path):
+        path = tmp_path / "plain.pt"
+        torch.save(PixelShuffleModel(), path)
+
+        result = precheck_model(str(path), SHAPES)
+
+        assert result['compatible'] is False
+        assert "GraphModule이 아님" in result['reason']
+        assert "save_fx_model" in result['reason']
+
+    def test_unsupported_op(self, tmp_path):
+        path = str(tmp_path / "shuffle.pt")
+        assert save_fx_model(PixelShuffleModel(), path)
+
+        result = precheck_model(path, SHAPES)
+
+        assert result['compatible'] is False
+        assert "shuffle(PixelShuffle)" in result['reason']
+
+    def test_shape_access_is_supported(self, tmp_path):
+        path = str(tmp_path / "shape.pt")
+        assert save_fx_model(ShapeModel(), path)
+        graph = torch.fx.symbolic_trace(ShapeModel()).graph
+        assert getattr in {node.target for node in graph.nodes}
+
+        result = precheck_model(path, SHAPES)
+
+        assert result['compatible'] is True, result['reason']
+
+    def test_input_shape_mismatch(self, fx_model_path):
+        result = precheck_model(fx_model_path, [{"batch": 1, "channel": 4, "dimension": [224, 224]}])
+        assert result['compatible'] is False
+        assert result['checks'][-1]['name'] == 'input_shapes'
+
+        result = precheck_model(fx_model_path, [{"batch": 1, "channel": 3}])
+        assert result['compatible'] is False
+        assert "dimension" in result['reason']
+
+    def test_client_rejects_before_network_call(self, tmp_path):
+        onnx_path = tmp_path / "yolov8l.onnx"
+        onnx_path.write_bytes(b"\0" * 1024)
+        compressor = FakeCompressor()
+        client = NetsPresssoQAClient(compressor=compressor, use_cache=False)
+
+        result = client.test_simple_compression(str(onnx_path), str(tmp_path / "out"))
+
+        assert result['success'] is False
+        assert result['status'] == 'precheck_failed'
+        assert result['error_type'] == 'PrecheckError'
+        assert compressor.stats['calls'] == 0
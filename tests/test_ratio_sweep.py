@@ -0,0 +1,59 @@
+"""
+압축률 스윕 / 파레토 프런티어 테스트
+"""
+
+import pytest
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from fake_compressor import FakeCompressor
+from generate_qa_report import generate_sweep_section
+from netspresso_client import NetsPresssoQAClient
+from ratio_sweep import pareto_frontier, save_sweep_result, sweep_compression_ratios
+from utils import load_test_result
+
+SHAPES = [{"batch": 1, "channel": 3, "dimension": [32, 32]}]
+
+class TestRatioSweep:
+
+    def test_pareto_frontier(self):
+        points = [
+            {'ratio': 0.2, 'compressed_size': 100, 'latency': 1.0, 'deviation': 0.0},
+            {'ratio': 0.4, 'compressed_size': 80, 'latency': 1.2, 'deviation': 0.1},
+            {'ratio': 0.5, 'compressed_size': 90, 'latency': 1.3, 'deviation': 0.2},  # 0.4에 지배됨
+            {'ratio': 0.6, 'compressed_size': 60, 'latency': 0.9, 'deviation': None},
+        ]
+        frontier = pareto_frontier(points)
+        assert [p['ratio'] for p in frontier] == [0.2, 0.4, 0.6]
+
+    def test_sweep_stops_when_no_improvement(self, tmp_path, simple_fx_model_path):
+        model_path = simple_fx_model_path
+        compressor = FakeCompressor()
+        client = NetsPresssoQAClient(compressor=compressor, use_cache=False)
+
+        sweep = sweep_compression_ratios(
+            client, model_path, str(tmp_path / "sweep"),
+            ratios=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+            input_shapes=SHAPES, max_workers=2, patience=1, min_improvement=0.5
+        )
+
+        # 대역은 같은 모델을 돌려주므로 두 번째 묶음에서 크기/지연 시간 개선이 없어 종료
+        assert [p['ratio'] for p in sweep['points']] == [0.1, 0.2, 0.3, 0.4]
+        assert sweep['stopped_early'] is True
+        assert sweep['skipped_ratios'] == [0.5, 0.6]
+        assert compressor.stats['calls'] == 4
+        assert all(p['deviation'] == 0.0 for p in sweep['points'])
+        assert sweep['pareto_frontier']
+
+        output_path = str(tmp_path / "results" / "simple_sweep.json")
+        save_sweep_result(sweep, output_path)
+        saved = load_test_result(output_path)
+        section = generate_sweep_section([{
+            'test_name': 'simple_sweep',
+            'success': saved['result']['success'],
+            'details': saved['result']
+        }])
+        assert "파레토 프런티어" in section
+        assert f"| {sweep['pareto_frontier'][0]['ratio']:.2f} |" in section
@@ -0,0 +1,181 @@
+"""
+성능 회귀 추적 테스트
+"""
+
+import pytest
+import os
+import sys
+import random
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import utils
+from generate_qa_report import generate_markdown_report
+from regression import check_regressions, compare_to_baseline, holm_adjust, mad, mann_whitney_u, median, runner_id
+from results_db import ResultsDB
+
+START = datetime(2026, 10, 1, 9, 0, 0)
+
+def record_runs(db, model, commits, metric_values, repeats=3, seed=0, runner=None):
+    """commit마다 metric_values(commit 순번) 근처 값을 repeats회 기록"""
+    rng = random.Random(seed)
+    for index, commit in enumerate(commits):
+        for repeat in range(repeats):
+            timestamp = (START + timedelta(hours=index, minutes=repeat)).isoformat()
+            metrics = {name: value(index) * (1 + rng.uniform(-0.02, 0.02)) for name, value in metric_values.items()}
+            metrics['compressed_size'] = 1_000_000
+            db.add_metrics(model, metrics, commit=commit, timestamp=timestamp, runner=runner)
+
+class TestRegressionStatistics:
+
+    def test_median_and_mad(self):
+        assert median([3, 1, 2]) == 2
+        assert median([4, 1, 3, 2]) == 2.5
+        assert mad([1, 1, 2, 2, 4, 6, 9]) == 1
+        with pytest.raises(ValueError):
+            median([])
+
+    def test_mann_whitney_matches_reference(self):
+        # scipy.stats.mannwhitneyu(x, y, alternative='greater') 기준값: U=23.5, p≈0.0139
+        x = [1.9, 2.1, 2.3, 2.2, 2.0]
+        y = [1.0, 1.2, 1.1, 1.3, 2.0]
+        u, p = mann_whitney_u(x, y)
+        assert u == 23.5
+        assert p == pytest.approx(0.0139, abs=1e-4)
+        assert mann_whitney_u(y, x)[1] > 0.9
+        assert mann_whitney_u([1, 1], [1, 1, 1])[1] == 1.0
+
+    def test_compare_to_baseline(self):
+        baseline = [1.0, 1.02, 0.98, 1.01, 0.99, 1.0, 1.03]
+        assert compare_to_baseline([1.5, 1.52, 1.49], baseline)['status'] == 'regressed'
+        assert compare_to_baseline([0.5, 0.52, 0.49], baseline)['status'] == 'improved'
+        assert compare_to_baseline([1.01, 0.99, 1.0], baseline)['status'] == 'ok'
+
+        single = compare_to_baseline([1.5], baseline)
+        assert single['method'] == 'robust_z' and single['status'] == 'regressed'
+        # 유의하지만 변화가 min_relative_change 미만이면 회귀 아님
+        assert compare_to_baseline([1.04], [1.0] * 6)['status'] == 'ok'
+        assert compare_to_baseline([1.2], [1.0] * 6)['status'] == 'regressed'
+
+    def test_holm_adjust(self):
+        # 정렬된 p-value에 (m - 순위)를 곱하고 단조 증가하도록 누적 최대값 적용
+        assert holm_adjust([0.01, 0.04, 0.03]) == pytest.approx([0.03, 0.06, 0.06])
+        assert holm_adjust([0.5, 0.9]) == pytest.approx([1.0, 1.0])
+        assert holm_adjust([]) == []
+
+class TestRegressionTracking:
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        with ResultsDB(str(tmp_path / "results.db")) as db:
+            yield db
+
+    def test_flags_injected_slowdown(self, db):
+        commits = [f"c{i}" for i in range(8)]
+        record_runs(db, "simple", commits, {
+            'inference_p50': lambda i: 0.010 if i < 7 else 0.015,
+            'compression_wall_time': lambda i: 2.0
+        })
+
+        check = check_regressions(db, "simple", "c7", gating=None)
+        assert check['regressed'] and check['regressions'] == ['inference_p50']
+        statuses = {row['metric']: row['status'] for row in check['metrics']}
+        assert statuses == {'compressed_size': 'ok', 'compression_wall_time': 'ok', 'inference_p50': 'regressed'}
+        assert 0.05 > check['metrics'][2]['p_adjusted'] > check['metrics'][2]['p_value']
+
+        # 기본값에서는 시간 지표 회귀는 참고용으로만 보고
+        check = check_regressions(db, "simple", "c7")
+        assert not check['regressed'] and check['advisory'] == ['inference_p50']
+
+        assert not check_regressions(db, "simple", "c6", gating=None)['regressed']
+        assert db.metric_values("simple", 'inference_p50', exclude_commit="c7", limit=4) == \
+            db.metric_values("simple", 'inference_p50')[-7:-3]
+
+    def test_deterministic_metric_regression_fails(self, db):
+        commits = [f"c{i}" for i in range(8)]
+        record_runs(db, "simple", commits, {'inference_p50': lambda i: 0.010})
+        db.add_metrics("simple", {'peak_memory': 2_000_000}, commit="c7")
+        for commit in commits[:-1]:
+            db.add_metrics("simple", {'peak_memory': 1_000_000}, commit=commit)
+
+        check = check_regressions(db, "simple", "c7")
+        assert check['regressed'] and check['regressions'] == ['peak_memory']
+        assert check['advisory'] == []
+
+    def test_unchanged_code_is_not_flagged(self, db):
+        # 변경 없는 코드의 잡음(±20%)만 있는 지표 10개를 여러 번 검사해도 회귀로 판정하지 않아야 함
+        names = [f"latency_{i}" for i in range(10)]
+        for seed in range(6):
+            commits = [f"s{seed}_{i}" for i in range(8)]
+            rng = random.Random(seed)
+            for commit in commits:
+                for _ in range(5):
+                    db.add_metrics(f"m{seed}", {name: 0.01 * rng.uniform(0.8, 1.2) for name in names}, commit=commit)
+            check = check_regressions(db, f"m{seed}", commits[-1], gating=None)
+            assert not check['regressed'], check['regressions']
+
+    def test_same_runner_baseline_gates_latency(self, db, monkeypatch):
+        commits = [f"c{i}" for i in range(8)]
+        # c0~c2는 다른 runner, c3~c7은 현재 runner에서 측정 (c7에서 느려짐)
+        record_runs(db, "simple", commits[:3], {'inference_p50': lambda i: 0.010}, runner="other-cpu")
+        record_runs(db, "simple", commits[3:], {'inference_p50': lambda i: 0.010 if i < 4 else 0.015},
+                    runner="ubuntu-22.04/xeon/4cpu", seed=1)
+
+        check = check_regressions(db, "simple", "c7", runner="ubuntu-22.04/xeon/4cpu", min_baseline=12)
+        assert check['regressed'] and check['regressions'] == ['inference_p50']
+        row = next(row for row in check['metrics'] if row['metric'] == 'inference_p50')
+        assert row['baseline_scope'] == 'runner' and row['baseline_samples'] == 12 and row['gating']
+
+        # 같은 runner 기준이 min_baseline보다 적으면 전체 기준과 비교하고 참고용으로만 보고
+        check = check_regressions(db, "simple", "c7", runner="ubuntu-22.04/xeon/4cpu", min_baseline=13)
+        assert not check['regressed'] and check['advisory'] == ['inference_p50']
+        assert check['runner'] == "ubuntu-22.04/xeon/4cpu"
+
+        monkeypatch.setenv('NETSPRESSO_RUNNER', "ci-runner")
+        assert runner_id() == "ci-runner"
+        monkeypatch.delenv('NETSPRESSO_RUNNER')
+        monkeypatch.setenv('ImageOS', "ubuntu22")
+        monkeypatch.setenv('ImageVersion', "20261012.1")
+        assert runner_id().startswith("ubuntu22-20261012.1/") and runner_id().endswith(f"/{os.cpu_count()}cpu")
+
+    def test_metrics_table_without_runner_is_migrated(self, tmp_path):
+        import sqlite3
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE metrics (id INTEGER PRIMARY KEY, model TEXT NOT NULL, metric TEXT NOT NULL, "
+                     "value REAL NOT NULL, commit_sha TEXT, timestamp TEXT NOT NULL)")
+        conn.execute("INSERT INTO metrics (model, metric, value, commit_sha, timestamp) "
+                     "VALUES ('simple', 'peak_memory', 1.0, 'c0', '2026-10-01')")
+        conn.commit()
+        conn.close()
+
+        with ResultsDB(path) as db:
+            db.add_metrics("simple", {'peak_memory': 2.0}, commit="c1", runner="r1")
+            assert db.metric_values("simple", 'peak_memory') == [1.0, 2.0]
+            assert db.metric_values("simple", 'peak_memory', runner="r1") == [2.0]
+
+    def test_insufficient_baseline(self, db):
+        record_runs(db, "yolo", ["a", "b"], {'peak_memory': lambda i: 1000.0}, repeats=1)
+        check = check_regressions(db, "yolo", "b")
+        assert not check['regressed']
+        assert {row['status'] for row in check['metrics']} == {'insufficient_baseline'}
+
+    def test_report_section(self, db):
+        commits = [f"c{i}" for i in range(8)]
+        record_runs(db, "simple", commits, {
+            'inference_p99': lambda i: 0.02 if i < 7 else 0.04,
+            'inference_p50': lambda i: 0.01 if i < 7 else 0.02
+        })
+        check = check_regressions(db, "simple", "c7", gating=('compressed_size', 'inference_p99'))
+
+        collector = utils.TestResultCollector()
+        collector.add_result("simple_regression_result", not check['regressed'],
+                             {'regression': check, 'error': "성능 회귀: inference_p99"})
+        report = generate_markdown_report(collector)
+        assert "## 📉 성능 회귀 검사" in report
+        assert "### simple — ❌ 회귀 (inference_p99)" in report
+        assert "| 추론 p99(초) |" in report and "❌ 회귀 |" in report
+        assert "- **참고용 회귀** (실패로 판정하지 않음): inference_p50" in report
+        assert "⚠️ 회귀 (참고) |" in report
+        assert "성능 회귀가 감지된 지표의 원인 커밋 확인 필요" in report
@@ -0,0 +1,58 @@
+"""
+스트리밍 리포트 작성 / 상세 페이지 분할 테스트
+"""
+
+import pytest
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import utils
+from generate_qa_report import generate_markdown_report, publish_latest, write_markdown_report
+
+def make_collector(count, streaming=True):
+    collector = utils.TestResultCollector(streaming=streaming)
+    for i in range(count):
+        details = {'duration': 1.0}
+        if i % 5 == 0:
+            details['error'] = f"Read timed out after {i}s"
+        collector.add_result(f"case_{i:04d}", i % 5 != 0, details)
+    return collector
+
+class TestReportWriter:
+
+    def test_sharded_report(self, tmp_path):
+        collector = make_collector(25)
+        written = write_markdown_report(collector, tmp_path / "qa_report_1.md", shard_size=10)
+
+        assert [p['count'] for p in written['pages']] == [10, 10, 5]
+        assert [p['file'] for p in written['pages']] == ["page_0001.md", "page_0002.md", "page_0003.md"]
+        report = (tmp_path / "qa_report_1.md").read_text(encoding='utf-8')
+        assert "| [1](qa_report_1_details/page_0001.md) | 10 | 8 | 2 | case_0000 … case_0009 |" in report
+        assert "### ✅ case_0001" not in report
+        assert "`Read timed out after <n>s` — 5건" in report
+
+        page = (tmp_path / "qa_report_1_details" / "page_0003.md").read_text(encoding='utf-8')
+        assert page.count("### ") == 5 and "### ❌ case_0020" in page
+        assert "(../qa_report_1.md)" in page
+        assert not [p for p in os.listdir(tmp_path) if p.endswith('.tmp')]
+        collector.close()
+
+    def test_string_report_keeps_inline_details(self):
+        collector = make_collector(3, streaming=False)
+        report = generate_markdown_report(collector)
+        assert "### ❌ case_0000" in report and "### ✅ case_0002" in report
+        assert "리포트 생성 시간: {datetime" not in report
+
+    def test_publish_latest_hardlinks(self, tmp_path):
+        collector = make_collector(3)
+        first = write_markdown_report(collector, tmp_path / "qa_report_1.md")['report_path']
+        second = write_markdown_report(collector, tmp_path / "qa_report_2.md")['report_path']
+
+        latest = publish_latest(first, tmp_path / "qa_summary_report.md")
+        latest = publish_latest(second, latest)
+
+        assert os.path.samefile(latest, second)
+        assert os.stat(first).st_nlink == 1
+        collector.close()
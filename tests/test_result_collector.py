@@ -0,0 +1,69 @@
+"""
+스트리밍 TestResultCollector 테스트
+"""
+
+import pytest
+import os
+import sys
+import tracemalloc
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import utils
+
+def fill(collector, count, payload=""):
+    for i in range(count):
+        details = {'duration': float(i % 5), 'payload': f"{payload}{i}"}
+        if i % 4 == 0:
+            details['error'] = "timeout"
+        collector.add_result(f"case_{i}", i % 4 != 0, details)
+
+class TestResultCollectorStreaming:
+
+    def test_streaming_matches_list_mode(self, tmp_path):
+        listed = utils.TestResultCollector()
+        streamed = utils.TestResultCollector(streaming=True, spill_dir=str(tmp_path))
+        fill(listed, 100)
+        fill(streamed, 100)
+
+        listed_summary, streamed_summary = listed.get_summary(), streamed.get_summary()
+        for key in ('total_tests', 'success_count', 'failed_count', 'success_rate', 'durations'):
+            assert listed_summary[key] == streamed_summary[key]
+        assert streamed_summary['durations'] == {'count': 100, 'total': 200.0, 'mean': 2.0, 'max': 4.0}
+
+        results = streamed_summary['results']
+        assert len(results) == 100 and results
+        first_pass = [(r['test_name'], r['success'], r['details']) for r in results]
+        assert first_pass == [(r['test_name'], r['success'], r['details']) for r in listed.results]
+        assert [r['test_name'] for r in results] == [r[0] for r in first_pass]
+        streamed.close()
+
+    def test_empty_streaming_collector_is_falsy(self):
+        collector = utils.TestResultCollector(streaming=True)
+        assert not collector.results and len(collector.results) == 0
+        assert collector.get_summary()['success_rate'] == 0
+        collector.close()
+
+    def test_save_summary_materializes_results(self, tmp_path):
+        collector = utils.TestResultCollector(streaming=True)
+        fill(collector, 3)
+        output_path = str(tmp_path / "summary.json")
+        collector.save_summary(output_path)
+
+        saved = utils.load_test_result(output_path)['result']
+        assert [r['test_name'] for r in saved['results']] == ["case_0", "case_1", "case_2"]
+        collector.close()
+
+    def test_details_spill_to_disk(self, tmp_path):
+        payload = "x" * 2048
+
+        def retained_memory(streaming):
+            tracemalloc.start()
+            collector = utils.TestResultCollector(streaming=streaming, spill_dir=str(tmp_path))
+            fill(collector, 5000, payload)
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            if streaming:
+                collector.close()
+            return current
+
+        assert retained_memory(True) < retained_memory(False) / 5
@@ -0,0 +1,115 @@
+"""
+SQLite 결과 DB 테스트
+"""
+
+import pytest
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from failure_patterns import classify_failure
+from generate_qa_report import generate_markdown_report
+from results_db import ResultsDB
+import utils
+
+NOW = datetime(2026, 10, 17, 12, 0, 0)
+
+def synthetic_results(count):
+    """모델 3종 x 성공/실패가 섞인 결과"""
+    errors = ["NotValidFrameworkException: onnx", "Connection reset", "CUDA out of memory"]
+    for i in range(count):
+        model = ("yolo_like", "simple_cnn", "resnet")[i % 3]
+        success = i % 4 != 0
+        details = {'model': model, 'duration': 1.0 + (i % 10) / 10}
+        if not success:
+            details['error'] = errors[i % 3]
+        yield {
+            'test_name': f"{model}_compression",
+            'success': success,
+            'details': details,
+            'timestamp': (NOW - timedelta(minutes=count - i)).isoformat()
+        }
+
+class TestResultsDB:
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        with ResultsDB(str(tmp_path / "results.db")) as db:
+            yield db
+
+    def test_classify_failure(self):
+        assert classify_failure({'error': "NotValidFrameworkException"}) == 'framework_issues'
+        assert classify_failure({'error': "Read timeout"}) == 'timeout_issues'
+        assert classify_failure({'error': None}) == 'other_issues'
+
+    def test_metric_history_and_failures(self, db):
+        assert db.add_results(synthetic_results(120)) == 120
+
+        history = db.metric_history(test_name="yolo_like_compression", metric='duration', limit=30)
+        assert len(history) == 30
+        assert [h['timestamp'] for h in history] == sorted(h['timestamp'] for h in history)
+        assert all(h['value'] is not None for h in history)
+
+        framework = db.failures(category='framework_issues', since=NOW - timedelta(days=7))
+        assert framework and all(f['failure_category'] == 'framework_issues' for f in framework)
+        assert sum(db.failure_counts().values()) == 30
+
+        model_history = db.model_history("simple_cnn", limit=5)
+        assert len(model_history) == 5 and model_history[-1]['details']['model'] == "simple_cnn"
+
+    def test_collector_and_save_test_result_write_db(self, tmp_path):
+        db_path = str(tmp_path / "results.db")
+        collector = utils.TestResultCollector(db=db_path)
+        collector.add_result("simple_compression", True, {'model_path': "models/simple_cnn.pt", 'duration': 2.0})
+        utils.save_test_result({'success': False, 'error': "timeout"}, db_path, test_name="yolo_compression")
+
+        with ResultsDB(db_path) as db:
+            assert db.count() == 2
+            assert db.recent_models() == ["simple_cnn"]
+            assert db.failures()[0]['test_name'] == "yolo_compression"
+            trend = db.daily_trend(days=1)
+            assert trend[0]['total'] == 2 and trend[0]['success_rate'] == 50
+
+            report = generate_markdown_report(collector, db)
+        assert "최근 7일 추이" in report
+        assert "| simple_cnn | ✅ | 2.00초 |" in report
+
+    def test_100k_ingest_and_queries(self, db):
+        start = time.perf_counter()
+        db.add_results(synthetic_results(100_000))
+        ingest = time.perf_counter() - start
+
+        start = time.perf_counter()
+        db.metric_history(test_name="yolo_like_compression", limit=30)
+        db.failures(category='framework_issues', since=NOW - timedelta(days=7), limit=100)
+        db.failure_counts(since=NOW - timedelta(days=7))
+        db.model_history("resnet", limit=30)
+        queries = time.perf_counter() - start
+
+        assert db.count() == 100_000
+        assert ingest < 5, f"적재 {ingest:.2f}초"
+        assert queries < 1, f"질의 {queries:.2f}초"
+
+    def test_bulk_ingest_budget(self, db):
+        # model_path에서 모델 이름을 뽑는 경로 + 인덱스 재생성 경로
+        records = []
+        for record in synthetic_results(100_000):
+            record['details']['model_path'] = f"/data/models/{record['details'].pop('model')}.pt"
+            records.append(record)
+
+        start = time.perf_counter()
+        assert db.add_results(records) == 100_000
+        ingest = time.perf_counter() - start
+
+        assert ingest < 1.5, f"적재 {ingest:.2f}초"
+        indexes = {row['name'] for row in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {'idx_results_test_time', 'idx_results_model_time', 'idx_results_timestamp',
+                'idx_results_status', 'idx_results_failure'} <= indexes
+        assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert db.model_history("resnet", limit=1)
+        # 이후 소량 적재는 인덱스를 유지한 채 추가
+        db.add_results(synthetic_results(10))
+        assert db.count() == 100_010
@@ -0,0 +1,89 @@
+"""
+결과 파일 증분 인덱스 테스트
+"""
+
+import pytest
+import json
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from generate_qa_report import collect_test_results
+from results_index import INDEX_FILENAME, MAX_STACK_TRACE, ResultsIndex, parse_result_data
+from utils import save_test_result
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+class TestResultsIndex:
+
+    @pytest.fixture
+    def results_dir(self, tmp_path):
+        results = tmp_path / "results"
+        save_test_result({'success': True, 'duration': 1.0}, str(results / "simple_test_result.json"))
+        save_test_result({'success': False, 'error': "timeout"}, str(results / "yolo" / "yolo_result.json"))
+        write_json(results / "abc123" / "metadata.json", {'status': 'completed', 'compressed_model_id': 'x'})
+        return results
+
+    def test_parse_result_formats(self):
+        assert parse_result_data("r/a_result.json", {'result': {'success': True}})['test_name'] == "a_result"
+        metadata = parse_result_data("r/job1/metadata.json", {'status': 'completed'})
+        assert metadata == {'test_name': "netspresso_test_job1", 'success': True, 'details': {'status': 'completed'}}
+        assert parse_result_data("r/x.json", {'error': "boom"})['success'] is False
+        assert parse_result_data("r/empty.json", []) is None
+
+    def test_second_refresh_reuses_entries(self, results_dir):
+        index = ResultsIndex(str(results_dir))
+        assert len(index.refresh()) == 3
+        index.save()
+
+        index_path = results_dir / INDEX_FILENAME
+        written = index_path.stat().st_mtime_ns
+        index = ResultsIndex(str(results_dir))
+        assert index.refresh() == []
+        assert index.stats == {'total': 3, 'parsed': 0, 'reused': 3, 'removed': 0}
+        # 바뀐 것이 없으면 다시 쓰지 않음
+        assert index.save() is False
+        assert index_path.stat().st_mtime_ns == written
+        assert sorted(r['test_name'] for r in index.records()) == [
+            "netspresso_test_abc123", "simple_test_result", "yolo_result"]
+
+    def test_only_changed_files_reparsed(self, results_dir):
+        index = ResultsIndex(str(results_dir))
+        index.refresh()
+        index.save()
+
+        save_test_result({'success': True}, str(results_dir / "yolo" / "yolo_result.json"))
+        os.utime(results_dir / "yolo" / "yolo_result.json", ns=(1, 1))
+        os.remove(results_dir / "abc123" / "metadata.json")
+        write_json(results_dir / "new_test.json", {'success': True})
+
+        index = ResultsIndex(str(results_dir))
+        parsed = index.refresh()
+        assert sorted(os.path.basename(p) for p in parsed) == ["new_test.json", "yolo_result.json"]
+        assert index.stats['removed'] == 1
+        yolo = next(r for r in index.records() if r['test_name'] == "yolo_result")
+        assert yolo['success'] is True
+
+    def test_index_stores_report_summary_only(self, results_dir):
+        save_test_result({'success': False, 'error': "boom", 'error_type': "RuntimeError", 'duration': 2.0,
+                          'spans': [{'name': 'compress'}] * 100, 'stack_trace': "x" * 5000},
+                         str(results_dir / "big_result.json"))
+        index = ResultsIndex(str(results_dir))
+        index.refresh()
+        index.save()
+
+        stored = json.loads((results_dir / INDEX_FILENAME).read_text(encoding='utf-8'))
+        details = stored['files']['big_result.json']['record']['details']
+        assert set(details) == {'error', 'error_type', 'duration', 'stack_trace'}
+        assert len(details['stack_trace']) == MAX_STACK_TRACE
+
+    def test_collect_skips_index_file(self, results_dir):
+        first = collect_test_results(str(results_dir))
+        assert (results_dir / INDEX_FILENAME).exists()
+
+        second = collect_test_results(str(results_dir))
+        assert len(first.results) == len(second.results) == 3
+        assert sum(1 for r in second.results if r['success']) == 2
@@ -0,0 +1,77 @@
+"""
+append-only JSONL 결과 로그 테스트
+"""
+
+import pytest
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import test_result_saver
+from generate_qa_report import collect_test_results
+from results_log import ResultsLog, iter_log_records, list_segments, migrate_json_results
+from utils import save_test_result
+
+class TestResultsLog:
+
+    def test_append_and_rotate(self, tmp_path):
+        log_path = str(tmp_path / "results.jsonl")
+        log = ResultsLog(log_path, max_segment_bytes=200)
+        for i in range(20):
+            log.append({'test_name': f"t{i}", 'result': {'success': True}})
+
+        segments = list_segments(log_path)
+        assert len(segments) > 2
+        assert segments[0].endswith("results.000001.jsonl") and segments[-1] == log_path
+        assert all(os.path.getsize(p) <= 200 for p in segments)
+        assert [r['test_name'] for r in log] == [f"t{i}" for i in range(20)]
+
+    def test_truncated_last_line_skipped(self, tmp_path):
+        log_path = tmp_path / "results.jsonl"
+        ResultsLog(str(log_path)).append({'test_name': "ok"})
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write('{"test_name": "torn"')
+
+        assert [r['test_name'] for r in iter_log_records([str(log_path)])] == ["ok"]
+
+    def test_concurrent_appends_keep_lines_intact(self, tmp_path):
+        log = ResultsLog(str(tmp_path / "results.jsonl"), max_segment_bytes=4096)
+        payload = "x" * 300
+
+        def append(i):
+            log.append({'test_name': f"t{i}", 'payload': payload})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(append, range(200)))
+
+        names = [r['test_name'] for r in log]
+        assert sorted(names) == sorted(f"t{i}" for i in range(200))
+
+    def test_savers_and_collect_read_log_and_legacy_json(self, tmp_path):
+        results_dir = tmp_path / "results"
+        save_test_result({'success': True}, str(results_dir / "legacy_result.json"))
+        save_test_result({'success': False, 'error': "timeout"}, str(results_dir / "log" / "results.jsonl"),
+                         test_name="yolo_compression")
+        test_result_saver.save_test_result("netspresso_simple", True, {'status': 'completed'},
+                                           output_dir=str(results_dir / "test_results"), format="jsonl")
+
+        assert not list((results_dir / "test_results").glob("*.json"))
+        collector = collect_test_results(str(results_dir))
+        by_name = {r['test_name']: r for r in collector.results}
+        assert set(by_name) == {"legacy_result", "yolo_compression", "netspresso_simple"}
+        assert by_name["yolo_compression"]['details']['error'] == "timeout"
+        assert by_name["netspresso_simple"]['success'] is True
+
+    def test_migrate_json_results(self, tmp_path):
+        legacy = []
+        for i in range(3):
+            path = tmp_path / f"case{i}_result.json"
+            path.write_text(json.dumps({'timestamp': "t", 'result': {'success': True}}), encoding='utf-8')
+            legacy.append(str(path))
+
+        log_path = str(tmp_path / "log" / "results.jsonl")
+        assert migrate_json_results(legacy, log_path) == 3
+        assert [r['test_name'] for r in ResultsLog(log_path)] == ["case0_result", "case1_result", "case2_result"]
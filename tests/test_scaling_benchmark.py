@@ -0,0 +1,72 @@
+"""
+모델 크기별 확장성 벤치마크 테스트
+"""
+
+import pytest
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import torch
+
+import utils
+from generate_qa_report import generate_markdown_report
+from model_tests import create_parametric_model, create_yolo_compatible_model, trace_fx_model
+from scaling_benchmark import STAGES, fit_linear, fit_power_law, predict, run_scaling_benchmark
+
+SMALL_LADDER = (
+    {'name': 'tiny', 'depth': 2, 'width': 8, 'head_channels': 32},
+    {'name': 'mid', 'depth': 3, 'width': 12, 'head_channels': 64},
+    {'name': 'small', 'depth': 3, 'width': 16, 'head_channels': 128},
+)
+
+def count_params(model):
+    return sum(p.numel() for p in model.parameters())
+
+class TestScalingBenchmark:
+
+    def test_fits_recover_exact_curves(self):
+        xs = [1, 2, 4, 8, 16]
+        power = fit_power_law(xs, [2 * x ** 1.5 for x in xs])
+        assert power['exponent'] == pytest.approx(1.5) and power['r2'] == pytest.approx(1.0)
+        assert predict(power, 32) == pytest.approx(2 * 32 ** 1.5)
+
+        linear = fit_linear(xs, [0.5 + 3 * x for x in xs])
+        assert linear['intercept'] == pytest.approx(0.5) and linear['slope'] == pytest.approx(3)
+        assert predict(linear, 100) == pytest.approx(300.5)
+
+        assert fit_power_law([1], [1]) is None
+        assert fit_power_law([2, 2], [1, 3]) is None
+
+    def test_parametric_model_defaults_match_yolo_model(self):
+        assert count_params(create_parametric_model()) == count_params(create_yolo_compatible_model())
+
+        cnn = trace_fx_model(create_parametric_model(depth=3, width=8, head_channels=16, num_classes=10, kind='cnn'))
+        assert cnn(torch.randn(2, 3, 64, 64)).shape == (2, 10)
+
+        wide = create_parametric_model(depth=4, width=64, max_channels=128, batch_norm=False)
+        assert max(m.out_channels for m in wide.backbone if isinstance(m, torch.nn.Conv2d)) == 128
+        assert not any(isinstance(m, torch.nn.BatchNorm2d) for m in wide.modules())
+
+        with pytest.raises(ValueError):
+            create_parametric_model(kind='transformer')
+
+    def test_benchmark_rows_curves_and_report(self, tmp_path):
+        scaling = run_scaling_benchmark(SMALL_LADDER, work_dir=str(tmp_path), repeats=1, input_shape=(1, 3, 64, 64))
+
+        sizes = [row['file_size'] for row in scaling['rows']]
+        assert sizes == sorted(sizes) and len(sizes) == 3
+        assert all(set(row['stages']) == set(STAGES) for row in scaling['rows'])
+        assert all(row['param_bytes'] == row['params'] * 4 for row in scaling['rows'])
+        # 파라미터 바이트는 파일 크기에 거의 정비례
+        assert scaling['curves']['param_bytes']['power']['exponent'] == pytest.approx(1.0, abs=0.1)
+        assert scaling['projected']['param_bytes']['linear'] == pytest.approx(scaling['target_size'], rel=0.1)
+        assert not list(tmp_path.glob("*.pt"))
+
+        collector = utils.TestResultCollector()
+        collector.add_result("scaling_result", True, {'scaling': scaling})
+        report = generate_markdown_report(collector)
+        assert "## 📈 모델 크기별 확장성" in report
+        assert "| tiny |" in report and "| small |" in report
+        assert "| param_bytes |" in report and "167.0MB 추정 (직선)" in report
@@ -0,0 +1,66 @@
+"""
+세션 간 trace 캐시 테스트
+"""
+
+import pytest
+import torch
+import torch.fx
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fx_artifact import is_fx_artifact
+from model_tests import load_fx_model
+from precheck import precheck_model
+from trace_cache import get_traced_model_path, load_traced_model, trace_cache_key
+
+CALLS = []
+
+def counting_factory(width=8):
+    """호출 횟수를 기록하는 모델 생성 함수"""
+    CALLS.append(width)
+    time.sleep(0.05)
+    return torch.nn.Sequential(torch.nn.Conv2d(3, width, 3, padding=1), torch.nn.ReLU())
+
+class TestTraceCache:
+
+    @pytest.fixture(autouse=True)
+    def reset_calls(self):
+        CALLS.clear()
+
+    def test_second_call_is_cache_hit(self, tmp_path):
+        first = get_traced_model_path(counting_factory, cache_dir=str(tmp_path))
+        second = get_traced_model_path(counting_factory, cache_dir=str(tmp_path))
+
+        assert first == second
+        assert CALLS == [8]
+        assert isinstance(load_fx_model(first), torch.fx.GraphModule)
+
+    def test_key_depends_on_args_and_format(self, tmp_path):
+        assert trace_cache_key(counting_factory, (8,)) != trace_cache_key(counting_factory, (16,))
+        assert trace_cache_key(counting_factory) != trace_cache_key(counting_factory, format='fxa')
+
+        path = get_traced_model_path(counting_factory, width=16, cache_dir=str(tmp_path))
+        assert load_fx_model(path).get_submodule('0').out_channels == 16
+
+    def test_concurrent_callers_trace_once(self, tmp_path):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            paths = list(executor.map(lambda _: get_traced_model_path(counting_factory, cache_dir=str(tmp_path)),
+                                      range(4)))
+
+        assert len(set(paths)) == 1
+        assert CALLS == [8]
+        assert not [p for p in os.listdir(tmp_path) if p.endswith('.tmp')]
+
+    def test_fxa_format(self, tmp_path):
+        path = get_traced_model_path(counting_factory, format='fxa', cache_dir=str(tmp_path))
+        assert is_fx_artifact(path)
+        assert isinstance(load_traced_model(counting_factory, format='fxa', cache_dir=str(tmp_path)),
+                          torch.fx.GraphModule)
+        assert CALLS == [8]
+
+    def test_session_fixture_is_uploadable(self, yolo_fx_model_path):
+        result = precheck_model(yolo_fx_model_path, [{"batch": 1, "channel": 3, "dimension": [64, 64]}])
+        assert result['compatible'] is True, result['reason']
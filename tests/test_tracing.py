@@ -0,0 +1,102 @@
+"""
+단계별 타이밍 span / Chrome trace 내보내기 테스트
+"""
+
+import pytest
+import os
+import sys
+import json
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import utils
+from fake_compressor import FakeCompressor
+from generate_qa_report import generate_markdown_report
+from netspresso_client import NetsPresssoQAClient
+from tracing import Tracer, export_chrome_trace, instrument_methods, span, stage_durations
+
+class FakeSDKCompressor:
+    """SDK compressor처럼 내부에서 self 메서드를 호출하는 객체"""
+
+    def upload_model(self):
+        time.sleep(0.01)
+
+    def get_model(self):
+        pass
+
+    def run(self):
+        self.upload_model()
+        for _ in range(3):
+            self.get_model()
+
+class TestTracing:
+
+    def test_nested_spans_and_self_time(self):
+        tracer = Tracer()
+        with tracer.activate():
+            with span('outer'):
+                with span('inner', step=1):
+                    time.sleep(0.02)
+                time.sleep(0.01)
+        with span('ignored'):
+            pass
+
+        assert [s['name'] for s in tracer.spans] == ['inner', 'outer']
+        assert [s['depth'] for s in tracer.spans] == [1, 0]
+        assert tracer.spans[0]['args'] == {'step': 1}
+
+        stages = stage_durations(tracer.spans)
+        assert stages['outer']['total'] >= 0.03
+        assert stages['outer']['self'] == pytest.approx(stages['outer']['total'] - stages['inner']['total'])
+
+    def test_span_records_error(self):
+        tracer = Tracer()
+        with pytest.raises(ValueError), tracer.activate(), span('failing'):
+            raise ValueError("boom")
+        assert tracer.spans[0]['args'] == {'error': 'ValueError'}
+
+    def test_instrument_methods_is_idempotent(self):
+        compressor = FakeSDKCompressor()
+        instrument_methods(compressor, {'upload_model': 'upload', 'get_model': 'status_polling', 'missing': 'x'})
+        instrument_methods(compressor, {'upload_model': 'upload'})
+
+        tracer = Tracer()
+        with tracer.activate():
+            compressor.run()
+        stages = stage_durations(tracer.spans)
+        assert stages['upload']['count'] == 1 and stages['status_polling']['count'] == 3
+
+    def test_client_result_has_stage_spans(self, simple_fx_model_path, tmp_path):
+        client = NetsPresssoQAClient(compressor=FakeCompressor(latency=0.02), use_cache=False)
+        outer = Tracer()
+        with outer.activate():
+            result = client.compress(simple_fx_model_path, str(tmp_path / "out"))
+
+        assert result['success']
+        names = [s['name'] for s in sorted(result['spans'], key=lambda s: s['start'])]
+        assert names == ['compress', 'precheck', 'automatic_compression', 'upload', 'compression', 'download']
+        assert result['stages']['compression']['total'] >= 0.02
+        assert result['duration'] >= result['stages']['compress']['total']
+        assert len(outer.spans) == len(result['spans'])
+
+        collector = utils.TestResultCollector()
+        collector.add_result("simple_compression", True, result)
+        assert "- **단계별 시간**: " in generate_markdown_report(collector)
+
+    def test_chrome_trace_export(self, simple_fx_model_path, tmp_path):
+        client = NetsPresssoQAClient(compressor=FakeCompressor(), use_cache=False)
+        jobs = [{'model_path': simple_fx_model_path, 'output_dir': str(tmp_path / f"out_{i}")} for i in range(3)]
+        spans = [s for result in client.compress_many(jobs, max_workers=3) for s in result['spans']]
+
+        trace_path = export_chrome_trace(spans, str(tmp_path / "trace.json"))
+        with open(trace_path, encoding='utf-8') as f:
+            trace = json.load(f)
+
+        events = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+        assert len(events) == len(spans)
+        assert min(e['ts'] for e in events) == 0
+        assert sum(e['name'] == 'compress' for e in events) == 3
+        assert all(e['dur'] >= 0 and isinstance(e['tid'], int) for e in events)
+        compress = next(e for e in events if e['name'] == 'compress')
+        assert compress['args']['model_path'] == simple_fx_model_path